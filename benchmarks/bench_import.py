@@ -0,0 +1,104 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Benchmark of the import time of the library ("python -X importtime"), for example, for the time of parsing DAG
+    files by the Apache Airflow scheduler.
+
+    Each statement is executed in a fresh interpreter "--repeat" times, the median of the cumulative import time of
+    the "tcommenter" modules is printed, as well as the heaviest modules imported by the statement and whether
+    SQLAlchemy was imported:
+
+        python benchmarks/bench_import.py
+        python benchmarks/bench_import.py --statement "import tcommenter" --repeat 20
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# The statements are run from a plain checkout (without "pip install -e ."), the root of the repository is importable:
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    'import tcommenter',
+    'from tcommenter import Tcommenter',
+    'from tcommenter import Tcommenter, SchemaCommenter, MetadataCache, QueryMetrics',
+]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def import_time(statement: str) -> tuple[int, dict[str, int]]:
+    """
+        Runs the statement in a fresh interpreter, returns the total import time (us) of the statement and the
+        self time of each module.
+    """
+
+    code = f'{statement}; import sys; print("sqlalchemy" in sys.modules)'
+    baseline_modules = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True, check=True
+    ).stderr
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True, env={
+            **os.environ,
+            'PYTHONDONTWRITEBYTECODE': '1',
+            'PYTHONPATH': os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])),
+        }
+    )
+
+    startup = {line.split('|')[-1].strip() for line in baseline_modules.splitlines() if '|' in line}
+    modules: dict[str, int] = {}
+    total = 0
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+
+        if name.strip() in startup:
+            continue
+
+        modules[name] = int(self_time)
+
+        # Top-level imports of the statement (without indentation):
+        if not line.split('|')[-1].startswith('  '):
+            total += int(cumulative)
+
+    modules['<sqlalchemy imported>'] = int(result.stdout.strip() == 'True')
+
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--statement', action='append', help='the import statement (by default, a set of them)')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=5, help='the number of the heaviest modules to print')
+    args = parser.parse_args()
+
+    for statement in args.statement or STATEMENTS:
+        totals, modules = [], {}
+
+        for _ in range(args.repeat):
+            total, modules = import_time(statement)
+            totals.append(total)
+
+        sqlalchemy_imported = modules.pop('<sqlalchemy imported>')
+        heaviest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+        print(
+            f'{statement}\n'
+            f'    median: {statistics.median(totals) / 1000:.2f} ms, min: {min(totals) / 1000:.2f} ms, '
+            f'modules: {len(modules)}, SQLAlchemy imported: {bool(sqlalchemy_imported)}\n'
+            f'    heaviest (self time): {", ".join(f"{name} {time / 1000:.2f} ms" for name, time in heaviest)}'
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    An in-process fake PostgreSQL engine for benchmarks without a database.
+
+    The engine is a real "sqlalchemy.engine.Engine" (PostgreSQL dialect) on top of a fake DB-API driver: each
+    statement is only recorded, and the queries of the library for reading comments return rows of one generated
+    entity. It measures the overhead of the library (statements, connection checkouts, Python time and memory),
+    not the database.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import types
+
+# ---------------------------------- Importing third-party libraries
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class FakeCursor:
+    """
+        DB-API cursor answering the queries of the library from the comments of one entity.
+    """
+
+    arraysize = 1
+
+    def __init__(self, connection: 'FakeConnection'):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self._rows: list[tuple] = []
+
+    def _answer(self, statement: str, params: dict) -> list[tuple]:
+        table_comment, column_comments = self.connection.table_comment, self.connection.column_comments
+        columns = list(column_comments.items())
+
+        if 'version()' in statement:
+            return [('PostgreSQL 16.0 (fake)',)]
+
+        if 'type_entity' in statement:
+            return [('table',)]
+
+        if 'objsubid = 0' in statement:
+            return [(table_comment,)]
+
+        if 'objsubid = ANY' in statement:
+            return [columns[index - 1] for index in params['columns'] if 0 < index <= len(columns)]
+
+        if 'attname = ANY' in statement:
+            return [(name, comment) for name, comment in columns if name in params['columns']]
+
+        if 'objsubid > 0' in statement:
+            return columns
+
+        if 'objsubid >= 0' in statement:
+            return [(None, table_comment)] + columns
+
+        return []
+
+    def execute(self, statement: str, params: dict | None = None) -> None:
+        self.connection.statements.append(statement)
+        self._rows = self._answer(statement, params or {})
+        self.rowcount = len(self._rows)
+        self.description = [(f'column_{i}', None, None, None, None, None, None) for i in range(2)] \
+            if self._rows else None
+
+    def executemany(self, statement: str, params_list: list[dict]) -> None:
+        for params in params_list:
+            self.execute(statement, params)
+
+    def fetchone(self) -> tuple | None:
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:
+        size = size or self.arraysize
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self) -> list[tuple]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    """
+        DB-API connection of the fake driver.
+    """
+
+    autocommit = False
+    notices: list[str] = []
+
+    def __init__(self, table_comment: str, column_comments: dict[str, str], statements: list[str]):
+        self.table_comment = table_comment
+        self.column_comments = column_comments
+        self.statements = statements
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def create_fake_engine(table_comment: str, column_comments: dict[str, str]) -> Engine:
+    """
+        Creates an engine on top of the fake driver; the executed statements are available in "engine.statements".
+    """
+
+    statements: list[str] = []
+    module = types.SimpleNamespace(paramstyle='pyformat', Error=Exception, __version__='2.9.10')
+
+    engine = create_engine(
+        'postgresql+psycopg2://',
+        module=module,
+        creator=lambda: FakeConnection(table_comment, column_comments, statements),
+        use_native_hstore=False,
+        _initialize=False,
+    )
+    engine.statements = statements
+
+    return engine
+# ----------------------------------------------------------------------------------------------------------------------
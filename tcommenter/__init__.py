@@ -1,3 +1,41 @@
-from .tcommenter import Tcommenter
+# The classes are imported on first access (PEP 562): "import tcommenter" does not import SQLAlchemy, and
+# "from tcommenter import Tcommenter" imports only the modules of the class (SQLAlchemy - on the first query).
+_LAZY_IMPORTS = {
+    "Tcommenter": ".tcommenter",
+    "SchemaCommenter": ".schema_commenter",
+    "DatabaseCommenter": ".database_commenter",
+    "BulkCommenter": ".bulk_commenter",
+    "SchemaCatalog": ".catalog",
+    "CommentBuffer": ".buffer",
+    # The asynchronous version requires the optional "SQLAlchemy[asyncio]" extra:
+    "AsyncTcommenter": ".async_tcommenter",
+    "MetadataCache": ".cache",
+    "QueryMetrics": ".metrics",
+}
 
-__all__ = ["Tcommenter"]
\ No newline at end of file
+__all__ = [
+    "Tcommenter",
+    "SchemaCommenter",
+    "DatabaseCommenter",
+    "BulkCommenter",
+    "SchemaCatalog",
+    "CommentBuffer",
+    "AsyncTcommenter",
+    "MetadataCache",
+    "QueryMetrics",
+]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value  # The next access does not call "__getattr__()".
+        return value
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
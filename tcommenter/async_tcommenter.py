@@ -0,0 +1,976 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library with the asynchronous version of the main class for working with
+    comments on tables (and other entities) through "sqlalchemy.ext.asyncio.AsyncEngine" (for example, "asyncpg").
+
+    The asynchronous version uses the same SQL queries, validation and data conversion as "Tcommenter", only the
+    database access methods are replaced. To use it, you need the "SQLAlchemy[asyncio]" extra (the "greenlet"
+    library).
+
+    Asynchronous drivers bind parameters on the server side, where utility statements ("COMMENT ON ...") do not
+    accept parameters. Therefore, comments are written through the server-side restoration of comments (the comment
+    is passed to the server as part of one JSON parameter, and the "COMMENT ON ..." query is formed by the server).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import time
+from contextlib import asynccontextmanager
+from contextvars import Token
+from typing import AsyncIterator, Callable
+
+# ---------------------------------- Importing third-party libraries
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql.elements import TextClause
+
+# -------------------------------- Local modules
+from .base import _SESSION_CONNECTIONS
+from .cache import MetadataCache
+from .metrics import QueryMetrics, instrumented
+from .tcommenter import Tcommenter
+from .sql.postgre_sql import *
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class AsyncTcommenter(Tcommenter):
+    """
+        "AsyncTcommenter" is an asynchronous version of "Tcommenter": contains awaitable methods for creating,
+        extracting, and overloading comments to tables (and other entities), columns in the database (in the current
+        version of the library, only for PostgreSQL) through "sqlalchemy.ext.asyncio.AsyncEngine".
+    """
+
+    def __init__(
+            self,
+            engine: AsyncEngine,
+            name_table: str,
+            schema: str,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None
+    ):
+        super().__init__(engine, name_table, schema, cache, metrics)
+
+    @staticmethod
+    def _get_engine_type() -> type:
+        """
+            *** A private method for getting the type of engine accepted by the class. ***
+
+            :return: "sqlalchemy.ext.asyncio.AsyncEngine".
+            :rtype: type.
+        """
+
+        return AsyncEngine
+
+    @asynccontextmanager
+    async def _connection_scope(self) -> AsyncIterator[AsyncConnection]:
+        """
+            *** A private asynchronous context manager for getting a connection to execute queries. ***
+
+            The same as "Tcommenter._connection_scope()" (for more information, see its description).
+
+            :return: SQLAlchemy asynchronous connection.
+            :rtype: AsyncIterator[AsyncConnection].
+        """
+
+        if self._connection is not None:
+            yield self._connection
+
+        else:
+            async with self.engine.connect() as conn:
+                self._count_metrics(checkouts=1)
+
+                async with conn.begin():
+                    yield conn
+
+    @asynccontextmanager
+    async def session(self, connection: AsyncConnection | None = None) -> AsyncIterator['AsyncTcommenter']:
+        """
+            *** An asynchronous context manager for executing all queries on one connection in one transaction. ***
+
+            The same as "Tcommenter.session()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                async with comments.session():
+                    all_comments_dict = await comments.get_all_comments()
+                    await comments.save_comments(all_comments_dict)
+
+            ***
+
+            :param connection: Optional, the SQLAlchemy asynchronous connection of the caller.
+            :return: The instance itself (the methods are called on it as usual).
+            :rtype: AsyncIterator[AsyncTcommenter].
+            :raises TypeError: If the passed connection is not "sqlalchemy.ext.asyncio.AsyncConnection".
+        """
+
+        connection = self._validator(connection, AsyncConnection, type(None))
+
+        # The session is already open (nested call):
+        if self._connection is not None:
+            yield self
+            return
+
+        token: Token | None = None
+
+        try:
+
+            # The caller's transaction (it is controlled by the caller):
+            if connection is not None and connection.in_transaction():
+                token = self._enter_session(connection)
+                yield self
+
+            elif connection is not None:
+                async with connection.begin():
+                    token = self._enter_session(connection)
+                    yield self
+
+            else:
+                async with self.engine.connect() as conn:
+                    self._count_metrics(checkouts=1)
+
+                    async with conn.begin():
+                        token = self._enter_session(conn)
+                        yield self
+
+        finally:
+            if token is not None:
+                _SESSION_CONNECTIONS.reset(token)
+
+            # The data read or written inside the session could have been rolled back:
+            self._invalidate_cache()
+
+    async def _reader(self, sql: str | TextClause, **params: str | int | list) -> list[tuple]:
+        """
+            *** Private asynchronous method of reading data in an SQL database. ***
+
+            The same as "Tcommenter._reader()", but the query is executed via "AsyncEngine" without blocking
+            the event loop.
+
+            :param sql:SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: required data).
+            :return: Returns a list of tuples, example result: [(1, 'Alice'), (2, 'Bob'), (3, 'Charlie')] or [].
+            :rtype: list[tuple].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        _params = params or None
+
+        try:
+
+            sql = self._get_text_clause(sql)
+
+            async with self._connection_scope() as conn:
+                if _params:
+                    _params: dict = self._validator(_params, dict)
+                    result = await conn.execute(sql, _params)
+                else:
+                    result = await conn.execute(sql)
+
+                # fetchall() returns [] if there is no data.
+                tuple_list = [tuple(row) for row in result.fetchall()]
+                self._count_metrics(statements=1, rows=len(tuple_list))
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+        return tuple_list
+
+    async def _cached_reader(self, kind: str, sql: str | TextClause, **params: str | int | list) -> list[tuple]:
+        """
+            *** A private asynchronous method of reading data in an SQL database through the cache of metadata. ***
+
+            The same as "Tcommenter._cached_reader()" (for more information, see its description).
+
+            :param kind: The kind of cached data: 'comments' or 'type'.
+            :param sql: SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: required data).
+            :return: Returns a list of tuples, example result: [(1, 'Alice'), (2, 'Bob'), (3, 'Charlie')] or [].
+            :rtype: list[tuple].
+        """
+
+        # Inside the session, the data may not be committed yet (or may be rolled back), it is not cached:
+        if self.cache is None or self._connection is not None:
+            return await self._reader(sql, **params)
+
+        cache_key = self._get_cache_key(kind, sql, params)
+        is_found, tuple_list = self.cache.get(cache_key)
+
+        if not is_found:
+            tuple_list = await self._reader(sql, **params)
+            self.cache.set(cache_key, tuple_list)
+
+        return tuple_list
+
+    async def _recorder(self, sql: str | TextClause, **params: None | str | int) -> None:
+        """
+            *** A private asynchronous method for writing data to an SQL database. ***
+
+            The same as "Tcommenter._recorder()", but the query is executed via "AsyncEngine" without blocking
+            the event loop.
+
+            :param sql: SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: optional data).
+            :return: None.
+            :rtype: Note.
+            :raises Runtime Error: is (SQLAlchemy Error).
+        """
+
+        await self._batch_recorder([(sql, params)])
+
+    async def _batch_recorder(self, statements: list[tuple[str | TextClause, dict]]) -> dict[str, int | float]:
+        """
+            *** A private asynchronous method for writing a batch of SQL queries in a single transaction. ***
+
+            The same as "Tcommenter._batch_recorder()", but the queries are executed via "AsyncEngine" without
+            blocking the event loop.
+
+            :param statements: A list of pairs (SQL query template, dictionary of parameters).
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        valid_statements: list = self._validator(statements, list)
+
+        start_time = time.perf_counter()
+
+        # There is nothing to write, we do not take a connection from the pool:
+        if not valid_statements:
+            return {'statements': 0, 'elapsed': 0.0}
+
+        try:
+
+            async with self._connection_scope() as conn:
+
+                for sql, params in valid_statements:
+
+                    sql = self._get_text_clause(sql)
+
+                    self._count_metrics(statements=1)
+
+                    if params:
+                        await conn.execute(sql, self._validator(params, dict))
+                    else:
+                        await conn.execute(sql)
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+        # The written metadata is no longer relevant in the cache:
+        finally:
+            self._invalidate_cache()
+
+        return {'statements': len(valid_statements), 'elapsed': time.perf_counter() - start_time}
+
+    async def _save_dispatched_comments(
+            self,
+            dispatched_dict: dict[str, str | dict[str, str]],
+            partitions: list[tuple[str, str]] | None = None
+    ) -> dict[str, int | float]:
+        """
+            *** A private asynchronous method for writing comments on an entity and its columns. ***
+
+            It is designed to write comments distributed by type (see "self._dispatch_comments_dict()") through the
+            server-side restoration of comments ("self._prepare_restore_comments()") in one transaction. The record
+            is passed in the "strict" mode: if the entity or one of the columns does not exist, an exception is
+            thrown (as in "Tcommenter"), the type of entity is set explicitly ('TABLE', 'VIEW', ...). The records
+            of the partitions (if passed, see "self._prepare_partitions_comments()") are written in the same
+            restoration.
+
+            ***
+
+            * Example of a call:
+
+                report = await self._save_dispatched_comments({'TABLE': 'table_comment', 'COLUMN': {'id': 'pass'}})
+
+            ***
+
+            :param dispatched_dict: Type dictionary: {'TABLE': 'table_comment', 'COLUMN': {'column_1': 'comment'}}.
+            :param partitions: Tuples (schema, partition name) to write the same comments to, by default None.
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        record = {'schema': self.schema, 'table': self.name_entity, 'strict': True}
+
+        for type_comment, value in self._validator(dispatched_dict, dict).items():
+
+            if type_comment == 'COLUMN':
+
+                # The comments are validated in the same way as in "self._prepare_comment()":
+                record['columns'] = {
+                    name_column: self._validator(comment, str) for name_column, comment in value.items()
+                }
+
+            else:
+                record['entity_type'] = self._PARAMS_SQL.get(type_comment)
+                record['table_comment'] = value
+
+        records = [record] + self._prepare_partitions_comments(dispatched_dict, partitions or [])
+
+        try:
+            return await self._batch_recorder(self._prepare_restore_comments(records))
+        finally:
+            if partitions:
+                self._invalidate_targets_cache(partitions)
+
+    @instrumented
+    async def get_type_entity(self) -> str:
+        """
+           *** An asynchronous method for determining the type of entity ('table', 'view', 'view', ...). ***
+
+            The same as "Tcommenter.get_type_entity()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                type_entity = await comments.get_type_entity()
+
+            ***
+
+            :return: Returns the value of the entity: ('table', 'view', 'mview', ...).
+            :rtype: str.
+        """
+
+        type_entity = await self._cached_reader('type', SQL_CHECK_TYPE_ENTITY, relation=self._relation)
+
+        return type_entity[0][0] if type_entity else None
+
+    @instrumented
+    async def get_types_entities(self, targets: list[tuple[str, str]]) -> dict[tuple[str, str], str | None]:
+        """
+            *** An asynchronous method for determining the types of many entities of a database in one query. ***
+
+            The same as "Tcommenter.get_types_entities()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                # -> {('audit', 'sales'): 'table', ('audit', 'ghost'): None}.
+                types_dict = await comments.get_types_entities([('audit', 'sales'), ('audit', 'ghost')])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :return: The types of the entities in the order of the targets: {(schema, entity name): type or None}.
+            :rtype: dict[tuple[str, str], str | None].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        valid_targets = self._validate_targets(targets)
+
+        if not valid_targets:
+            return {}
+
+        types_tuple_list = await self._cached_reader(
+            'type', SQL_GET_TYPES_ENTITIES, **self._prepare_types_entities(valid_targets)
+        )
+
+        return self._parse_types_entities(valid_targets, types_tuple_list)
+
+    @instrumented
+    async def set_table_comment(self, comment: str) -> None:
+        """
+            *** An asynchronous method for creating comments to tables in a database. ***
+
+            The same as "Tcommenter.set_table_comment()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                await comments.set_table_comment('This comment will be written to the table in the metadata.')
+
+            ***
+
+            :param comment: A comment to be written to an entity in the database.
+            :return: None, in case of a successful write to the database.
+            :rtype: Note.
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        await self._save_dispatched_comments({'TABLE': comment})
+
+    @instrumented
+    async def set_view_comment(self, comment: str) -> None:
+        """
+            *** An asynchronous method for creating comments on views in the database. ***
+
+            The same as "Tcommenter.set_view_comment()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                await comments.set_view_comment('This comment will be written to the metadata representation.')
+
+            ***
+
+            :param comment: A comment to be written to an entity in the database.
+            :return: None, in case of a successful write to the database.
+            :rtype: Note.
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        await self._save_dispatched_comments({'VIEW': comment})
+
+    @instrumented
+    async def set_materialized_view_comment(self, comment: str) -> None:
+        """
+            *** An asynchronous method for creating comments on materialized views in a database. ***
+
+            The same as "Tcommenter.set_materialized_view_comment()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                await comments.set_materialized_view_comment(
+                    'This comment will be written to the materialized representation in the metadata.'
+                )
+
+            ***
+
+            :param comment: A comment to be written to an entity in the database.
+            :return: None, in case of a successful write to the database.
+            :rtype: Note.
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        await self._save_dispatched_comments({'MATERIALIZED': comment})
+
+    @instrumented
+    async def set_column_comment(self, **comments_columns: str) -> dict[str, int | float]:
+        """
+            *** An asynchronous method for creating comments on columns in the database. ***
+
+            The same as "Tcommenter.set_column_comment()" (for more information, see its description): either all
+            comments are saved, or none.
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.set_column_comment(sales='This comment will be recorded in the metadata.')
+
+            ***
+
+            :param  comments_columns: kwargs (
+                key: column name,
+                value: comments to be written to a column in the database
+                ).
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        if not comments_columns:
+            return {'statements': 0, 'elapsed': 0.0}
+
+        return await self._save_dispatched_comments({'COLUMN': comments_columns})
+
+    @instrumented
+    async def get_table_comments(self, service_mode: bool = False) -> str | dict[str, str]:
+        """
+            *** An asynchronous method for getting comments on tables (and other entities other than columns). ***
+
+            The same as "Tcommenter.get_table_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                # -> 'comment'.
+                comment_table_str = await comments.get_table_comments()
+
+            ***
+
+            :param service_mode: The "Switch" of the output type, by default False.
+            :return: If service_mode=False -> str (row with table comment), \
+                if service_mode=True -> dict[str, str].
+            :rtype: str | dict[str, str].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        service_mode = self._validator(service_mode, bool)
+
+        table_comment_tuple_list: list[tuple] = await self._cached_reader(
+            'comments', SQL_GET_TABLE_COMMENTS, relation=self._relation
+        )
+
+        return self._parse_table_comments(table_comment_tuple_list, service_mode)
+
+    @instrumented
+    async def get_column_comments(self,
+                                  *column_index_or_name: int | str,
+                                  service_mode: bool = False
+                                  ) -> dict[str, str] | dict[str, dict[str, str]]:
+        """
+            *** An asynchronous method for getting comments on columns by their name or by index. ***
+
+            The same as "Tcommenter.get_column_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                # -> {'column_name_1': 'comment_1', 'column_name_2': 'comment_2', ... }
+                comment_columns_dict = await comments.get_column_comments()
+
+            ***
+
+            :param column_index_or_name: *args - indexes or column names for which comments should be counted.
+            :param service_mode: The "Switch" of the output type, By default False.
+            :return: If service_mode=False -> dict[str, str], if service_mode=True -> dict[str, dict[str, str]].
+            :rtype: dict[str, str] | dict[str, dict[str, str]].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        self._validator(service_mode, bool)
+
+        if column_index_or_name:
+
+            # We get sql (either for names or indexes) and a list of parameters:
+            sql, params_list_only_from_indexes_or_name = self._get_sql_and_params_list_only_from_indexes_or_names(
+                column_index_or_name
+            )
+
+            column_comments_tuple_list: list[tuple] = await self._cached_reader(
+                'comments',
+                sql,
+                relation=self._relation,
+                columns=params_list_only_from_indexes_or_name
+            )
+
+        else:
+
+            column_comments_tuple_list: list[tuple] = await self._cached_reader(
+                'comments',
+                SQL_GET_ALL_COLUMN_COMMENTS,
+                relation=self._relation
+            )
+
+        return self._parse_column_comments(column_comments_tuple_list, service_mode)
+
+    @instrumented
+    async def get_all_comments(self) -> dict[str, str | dict]:
+        """
+            *** An asynchronous method for getting all comments for an entity (to it and its columns). ***
+
+            The same as "Tcommenter.get_all_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                # -> {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+                all_comments_dict = await comments.get_all_comments()
+
+            ***
+
+            :return: {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :rtype: dict[str, str | dict].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        all_comments_tuple_list: list[tuple] = await self._cached_reader(
+            'comments', SQL_GET_ALL_COMMENTS, relation=self._relation
+        )
+
+        return self._parse_all_comments(all_comments_tuple_list)
+
+    @instrumented
+    async def save_comments(
+            self,
+            comments_dict: dict[str, str | dict],
+            only_changed: bool = False,
+            type_entity: str | None = None,
+            propagate: bool = False
+    ) -> dict[str, int | float | dict]:
+        """
+            *** An asynchronous method for saving comments of any type (to entities or their columns). ***
+
+            The same as "Tcommenter.save_comments()" (for more information, see its description), all comments
+            are always written in one transaction.
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                comment_table_dict = await comments.get_all_comments()
+                report = await comments.save_comments(comment_table_dict)
+
+            ***
+
+            :param comments_dict: Type dictionary:
+                {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}} |
+                {'table': 'table_comment'} | {'columns': {'column_1': 'column_1_comment', ...}}.
+            :param only_changed: The "Switch" of writing only changed comments, by default False.
+            :param type_entity: The type of the entity, if it is already known (see "get_types_entities()"), \
+                by default None (requested from the database).
+            :param propagate: The "Switch" of writing the comments to all partitions of a partitioned table, \
+                by default False.
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042} (if only_changed=True, \
+                supplemented with the 'written', 'skipped', 'cleared' keys, if propagate=True - 'partitions').
+            :rtype: dict[str, int | float | dict].
+            :raise ValueError: An exception will be thrown if an attempt is made to save comments on the entity type \
+                not provided in the current library implementation, there may be other exceptions in nested utility \
+                methods (see their description for details).
+        """
+
+        comments_dict = self._validate_comments_dict(comments_dict)
+        only_changed = self._validator(only_changed, bool)
+        propagate = self._validator(propagate, bool)
+
+        summary: dict[str, dict] = {}
+
+        if only_changed:
+
+            # The current comments are read bypassing the cache (the comparison must not be based on stale data):
+            current_dict = self._parse_all_comments(await self._reader(SQL_GET_ALL_COMMENTS, relation=self._relation))
+            comments_dict, summary = self._diff_comments_dict(comments_dict, current_dict)
+
+            # Nothing has changed, we do not access the database anymore:
+            if not comments_dict:
+                return summary | {'statements': 0, 'elapsed': 0.0}
+
+        if type_entity is None:
+            type_entity = await self.get_type_entity()
+
+        dispatched_dict = self._dispatch_comments_dict(comments_dict, type_entity)
+        partitions: list[tuple[str, str]] = []
+
+        # The comments of all partitions (of all levels) are written by the server in the same restoration:
+        if propagate:
+            partitions = await self.get_partitions() if type_entity == 'partitioned_table' else []
+            summary['partitions'] = len(partitions)
+
+        return summary | await self._save_dispatched_comments(dispatched_dict, partitions)
+
+    @instrumented
+    async def copy_comments_to(
+            self,
+            schema: str,
+            table: str,
+            by_position: bool = False,
+            strict: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** An asynchronous method for copying comments of the entity to another entity on the server side. ***
+
+            The same as "Tcommenter.copy_comments_to()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.copy_comments_to('audit', 'sales_copy')
+
+            ***
+
+            :param schema: The schema of the target entity.
+            :param table: The name of the target entity.
+            :param by_position: The "Switch" of matching columns by position instead of by name, by default False.
+            :param strict: The "Switch" of the exception for commented columns missing in the target entity, \
+                by default False.
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If the source or target entity does not exist (or, if strict=True, a column is \
+                missing), there may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        targets, statements = self._prepare_copy_comments([(schema, table)], by_position, strict)
+
+        try:
+            return await self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @instrumented
+    async def broadcast_comments_to(
+            self,
+            targets: list[tuple[str, str]],
+            by_position: bool = False,
+            strict: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** An asynchronous method for copying comments of the entity to many entities on the server side. ***
+
+            The same as "Tcommenter.broadcast_comments_to()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.broadcast_comments_to([(f'tenant_{number}', 'sales') for number in range(300)])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :param by_position: The "Switch" of matching columns by position instead of by name, by default False.
+            :param strict: The "Switch" of the exception for commented columns missing in a target entity, \
+                by default False.
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0853}.
+            :rtype: dict[str, int | float].
+            :raises ValueError: If the list of targets is empty.
+            :raises RuntimeError: If the source or a target entity does not exist (or, if strict=True, a column is \
+                missing), there may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        targets, statements = self._prepare_copy_comments(targets, by_position, strict)
+
+        try:
+            return await self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @instrumented
+    async def get_partitions(self) -> list[tuple[str, str]]:
+        """
+            *** An asynchronous method for getting all partitions of a partitioned table (of all levels). ***
+
+            The same as "Tcommenter.get_partitions()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='events', schema='audit')
+                partitions = await comments.get_partitions()
+
+            ***
+
+            :return: Tuples (schema, partition name) by levels of the tree.
+            :rtype: list[tuple[str, str]].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        return [tuple(partition) for partition in await self._reader(SQL_GET_PARTITIONS, relation=self._relation)]
+
+    @instrumented
+    async def propagate_comments(self, strict: bool = False) -> dict[str, int | float]:
+        """
+            *** An asynchronous method for pushing the comments of a partitioned table down to all its partitions. ***
+
+            The same as "Tcommenter.propagate_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='events', schema='audit')
+                report = await comments.propagate_comments()
+
+            ***
+
+            :param strict: See "Tcommenter.copy_comments_to()", by default False.
+            :return: Report of the type {'partitions': 700, 'statements': 2, 'elapsed': 0.2311}.
+            :rtype: dict[str, int | float].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        partitions = await self.get_partitions()
+
+        if not partitions:
+            return {'partitions': 0, 'statements': 0, 'elapsed': 0.0}
+
+        targets, statements = self._prepare_copy_comments(partitions, False, strict)
+
+        try:
+            return {'partitions': len(targets)} | await self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @asynccontextmanager
+    async def preserve_comments(self) -> AsyncIterator[dict[str, str | dict]]:
+        """
+            *** An asynchronous context manager for preserving comments of the entity when it is recreated. ***
+
+            The same as "Tcommenter.preserve_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                async with comments.preserve_comments() as snapshot:
+                    await conn.run_sync(lambda sync_conn: dataframe.to_sql('sales', sync_conn, schema='audit', ...))
+
+            ***
+
+            :return: The snapshot: {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :rtype: AsyncIterator[dict[str, str | dict]].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        with self._instrument('preserve_comments.snapshot'):
+            snapshot_dict = self._parse_all_comments(
+                await self._reader(SQL_GET_ALL_COMMENTS, relation=self._relation)
+            )
+
+        yield snapshot_dict
+
+        with self._instrument('preserve_comments.restore'):
+            await self._batch_recorder(self._prepare_preserved_comments(snapshot_dict))
+
+    @instrumented
+    async def to_sql(
+            self,
+            dataframe: 'pandas.DataFrame',
+            connection: AsyncConnection | None = None,
+            index: bool = False,
+            chunksize: int | None = None,
+            method: str | Callable | None = None,
+            **to_sql_kwargs: object
+    ) -> int | None:
+        """
+            *** An asynchronous method for recreating the entity from a DataFrame with the preservation of comments. ***
+
+            The same as "Tcommenter.to_sql()" (for more information, see its description), "pandas.DataFrame.to_sql()"
+            is executed on the connection of the session via "AsyncConnection.run_sync()".
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+
+                rows = await comments.to_sql(dataframe, chunksize=10_000)
+
+            ***
+
+            :return: The number of rows written (the output of "pandas.DataFrame.to_sql()").
+            :rtype: int | None.
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        def to_sql(sync_connection: Connection) -> int | None:
+            return dataframe.to_sql(
+                self.name_entity,
+                sync_connection,
+                schema=self.schema,
+                if_exists='replace',
+                index=index,
+                chunksize=chunksize,
+                method=method,
+                **to_sql_kwargs
+            )
+
+        async with self.session(connection), self.preserve_comments():
+            rows = await self._connection.run_sync(to_sql)
+
+        return rows
+
+    @instrumented
+    async def install_comments_preservation(self, shadow_schema: str = 'tcommenter') -> dict[str, int | float]:
+        """
+            *** An asynchronous method for installing the automatic preservation of comments by the server. ***
+
+            The same as "Tcommenter.install_comments_preservation()" (for more information, see its description), the
+            statements of the installation are executed one by one in one transaction ("asyncpg" does not accept
+            several statements in one query).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.install_comments_preservation()
+
+            ***
+
+            :param shadow_schema: See "Tcommenter.install_comments_preservation()", by default 'tcommenter'.
+            :return: Report of the type {'statements': 12, 'elapsed': 0.0421}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._batch_recorder()".
+        """
+
+        return await self._batch_recorder(
+            self._prepare_preservation_statements(SQL_INSTALL_COMMENTS_PRESERVATION, shadow_schema)
+        )
+
+    @instrumented
+    async def uninstall_comments_preservation(
+            self,
+            shadow_schema: str = 'tcommenter',
+            keep_comments: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** An asynchronous method for removing the automatic preservation of comments by the server. ***
+
+            The same as "Tcommenter.uninstall_comments_preservation()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.uninstall_comments_preservation()
+
+            ***
+
+            :param shadow_schema: See "Tcommenter.uninstall_comments_preservation()", by default 'tcommenter'.
+            :param keep_comments: See "Tcommenter.uninstall_comments_preservation()", by default False.
+            :return: Report of the type {'statements': 6, 'elapsed': 0.0093}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._batch_recorder()".
+        """
+
+        scripts = SQL_UNINSTALL_COMMENTS_PRESERVATION
+
+        if not self._validator(keep_comments, bool):
+            scripts += (SQL_DROP_PRESERVED_COMMENTS,)
+
+        return await self._batch_recorder(self._prepare_preservation_statements(scripts, shadow_schema))
+
+    @instrumented
+    async def prune_preserved_comments(
+            self,
+            older_than_days: int | float = 0,
+            shadow_schema: str = 'tcommenter'
+    ) -> dict[str, int]:
+        """
+            *** An asynchronous method for deleting the preserved comments of the dropped entities. ***
+
+            The same as "Tcommenter.prune_preserved_comments()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                report = await comments.prune_preserved_comments(older_than_days=30)
+
+            ***
+
+            :param older_than_days: See "Tcommenter.prune_preserved_comments()", by default 0.
+            :param shadow_schema: See "Tcommenter.prune_preserved_comments()", by default 'tcommenter'.
+            :return: The number of entities and comments deleted: {'relations': 3, 'comments': 41}.
+            :rtype: dict[str, int].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._reader()".
+        """
+
+        sql, params = self._prepare_prune_preserved_comments(older_than_days, shadow_schema)
+        relations, comments = (await self._reader(sql, **params))[0]
+
+        return {'relations': relations, 'comments': comments}
+
+    @instrumented
+    async def get_comments_preservation_status(self) -> dict[str, bool | str | int | dict | None]:
+        """
+            *** An asynchronous method for getting the state of the automatic preservation of comments. ***
+
+            The same as "Tcommenter.get_comments_preservation_status()" (for more information, see its description).
+
+            * Example of a call:
+
+                comments = AsyncTcommenter(engine=ASYNC_ENGINE, name_table='sales', schema='audit')
+                status = await comments.get_comments_preservation_status()
+
+            ***
+
+            :return: See "Tcommenter.get_comments_preservation_status()".
+            :rtype: dict[str, bool | str | int | dict | None].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._reader()".
+        """
+
+        status = self._parse_preservation_triggers(await self._reader(SQL_GET_PRESERVATION_TRIGGERS))
+
+        if status['schema'] is None:
+            return status
+
+        relations, dropped, entity_comments = (await self._reader(
+            SQL_GET_PRESERVED_COMMENTS_STATS.format(schema_preserved=self._quote_identifier(status['schema'])),
+            schema=self.schema,
+            name_entity=self.name_entity
+        ))[0]
+
+        return status | {'relations': relations, 'dropped': dropped, 'entity_comments': entity_comments}
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,1042 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module contains the base class of the "Tcommenter" library with the general service methods (validation of
+    arguments, protection against SQL injections, reading and writing data to the database) used by classes that
+    work with individual entities ("Tcommenter"), with the whole schema ("SchemaCommenter") and with the whole database
+    ("DatabaseCommenter").
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+# -------------------------------- Local modules
+from .cache import MetadataCache
+from .metrics import QueryMetrics, _CURRENT_CALL, instrumented
+from .sql.postgre_sql import SQL_GET_TYPES_ENTITIES, SQL_SET_COMMENTS_PAYLOAD, SQL_RESTORE_COMMENTS
+
+# SQLAlchemy (and "typing") are imported on the first query, not when the library is imported (see "__init__.py"):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import re
+    from typing import Iterable, Iterator, TypeVar
+
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncConnection
+    from sqlalchemy.sql.elements import TextClause
+
+    any_types = TypeVar('any_types')  # Creating a generalized data type.
+
+# The connections of the open sessions by instances (see "BaseCommenter.session()"), one context variable for all the
+# instances: the session of one thread (asyncio task) is not used by the others. The dictionary is not changed, it is
+# replaced by a new one when the session is opened (the previous one is restored by the token when it is closed):
+_SESSION_CONNECTIONS: ContextVar[dict[BaseCommenter, Connection | AsyncConnection]] = ContextVar(
+    'tcommenter_session_connections', default={}
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _build_text_clause(sql: str) -> TextClause:
+    """
+        Builds (once for each text of the query) "sqlalchemy.text()": the parsing of the parameters of the query is
+        not repeated, and the same object gets hits in the compiled cache of SQLAlchemy (and in the cache of
+        prepared statements of drivers that have it, for example, "asyncpg").
+    """
+
+    from sqlalchemy import text
+
+    return text(sql)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_identifier_patterns() -> tuple[re.Pattern, re.Pattern]:
+    """
+        Compiles (once, on the first check) the patterns of identifiers: the allowed characters of one or several
+        identifiers separated by line breaks (for the batch check) and the forbidden SQL keywords (as separate words,
+        "updated_at" or "created_by" are allowed) and sequences.
+    """
+
+    import re
+
+    allowed_pattern = re.compile(r'[a-zA-Z0-9_.\-]+(?:\n[a-zA-Z0-9_.\-]+)*')
+    keywords_pattern = re.compile(
+        r'(?<![a-zA-Z0-9_])(?:DROP|CREATE|ALTER|INSERT|UPDATE|DELETE)(?![a-zA-Z0-9_])|--|;', re.IGNORECASE
+    )
+
+    return allowed_pattern, keywords_pattern
+
+
+@functools.lru_cache(maxsize=65536)
+def _check_identifier(identifier: str) -> str:
+    """
+        Checks one identifier (the results are memoized, the exceptions are not).
+    """
+
+    allowed_pattern, keywords_pattern = _get_identifier_patterns()
+
+    # Checking for allowed characters:
+    if '\n' in identifier or not allowed_pattern.fullmatch(identifier):
+        raise ValueError(
+            f'String validation error: "{identifier}"! An invalid character was detected. '
+            f'Only letters of the Latin alphabet, numbers, symbols are allowed.: "_", ".", "-".'
+        )
+
+    # Checking for SQL keywords:
+    if keywords_pattern.search(identifier):
+        raise ValueError(
+            f'String verification error:"{identifier}"! '
+            f'The presence of SQL keywords was detected: {keywords_pattern.pattern}'
+        )
+
+    return identifier
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class BaseCommenter:
+    """
+        "BaseCommenter" contains the general service methods for the classes of the library: validation of arguments,
+        protection against SQL injections, reading and writing data to the database (in the current version of the
+        library, only for PostgreSQL).
+    """
+
+
+    def __init__(
+            self,
+            engine: Engine,
+            schema: str | None,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None
+    ):
+        self.engine = self._validator(engine, self._get_engine_type())
+        self.schema = self._stop_sql_injections(self._validator(schema, str)) if schema is not None else None
+        self.cache = self._validator(cache, MetadataCache, type(None))
+        self.metrics = self._validator(metrics, QueryMetrics, type(None))
+
+    @property
+    def _connection(self) -> Connection | None:
+        """
+            *** The connection of the session opened in the current thread (asyncio task), see "session()". ***
+
+            The asyncio tasks created inside the session inherit it (a copy of the context), as with any context
+            variable.
+
+            :return: SQLAlchemy connection or None (there is no open session in the current context).
+            :rtype: Connection | None.
+        """
+
+        return _SESSION_CONNECTIONS.get().get(self)
+
+    def _enter_session(self, connection: Connection | AsyncConnection) -> Token:
+        """
+            *** A private method for binding the connection of the session to the instance in the current context. ***
+
+            :param connection: The connection of the session.
+            :return: The token for closing the session ("_SESSION_CONNECTIONS.reset()").
+            :rtype: Token.
+        """
+
+        return _SESSION_CONNECTIONS.set({**_SESSION_CONNECTIONS.get(), self: connection})
+
+    @staticmethod
+    def _get_engine_type() -> type:
+        """
+            *** A private method for getting the type of engine accepted by the class. ***
+
+            SQLAlchemy is imported here (not when the library is imported), the asynchronous version overrides
+            the method.
+
+            :return: "sqlalchemy.engine.Engine".
+            :rtype: type.
+        """
+
+        from sqlalchemy.engine import Engine
+
+        return Engine
+
+    @staticmethod
+    def _get_text_clause(sql: str | TextClause) -> TextClause:
+        """
+            *** A private method for getting the "TextClause" of the SQL query from the cache of statements. ***
+
+            The text of the query is converted into "sqlalchemy.text()" only once (the cache is limited to 4096
+            queries, the least recently used ones are deleted), "TextClause" objects are returned as is.
+
+            * Example of a call:
+
+                result = conn.execute(self._get_text_clause(SQL_GET_ALL_COMMENTS), params)
+
+            ***
+
+            :param sql: SQL query (text or "TextClause").
+            :return: "TextClause" of the query.
+            :rtype: TextClause.
+        """
+
+        return _build_text_clause(sql) if isinstance(sql, str) else sql
+
+    @staticmethod
+    def _validator(value: any_types, *check_type: type[any]) -> any_types:
+        """
+            *** Private validation method (basic). ***
+
+            It is intended for checking the correct transmission of arguments in accordance with the required data type.
+            It is used as a nested method in other sections of the library code.
+
+            * Description of the mechanics:
+
+                According to the passed set of valid data types via the "*check_type" parameter,
+                The "value" argument being checked is being reconciled based on the "isinstance()" method.
+                If at least one of the data types matches, the passed argument "value" is returned,
+                otherwise, a TypeError exception is thrown.
+
+            ***
+
+            * Example of a call:
+
+                params = self._validator(_params, dict)
+
+            ***
+
+            :param value: The value to be checked.
+            :param check_type: One or more data types allowed for the value.
+            :return: Returns the passed original value if it matches one of the check_type types.
+            :rtype: any_types, returns the type of the original data type of the argument being checked.
+            :raises TypeError: If the value does not match any of the specified data types.
+        """
+
+        if isinstance(value, check_type):
+            return value
+        else:
+            raise TypeError(f'Invalid data type: "{type(value).__name__}", for the argument: "{value}".')
+
+    def _stop_sql_injections(self, sql_param_string: str) -> str:
+        """
+            *** A private method for escaping queries from SQL injections. ***
+
+            It is designed to prevent SQL injections from being passed to the main query of other methods
+            through arguments.
+            an instance of the class. Combines two approaches, increasing security:
+
+                - regular expressions
+                - checking for key SQL commands.
+
+            * Description of the mechanics:
+
+                1) Checking for allowed characters:
+                The regular expression ^[a-zA-Z0-9_.\\-]+$ does not skip empty lines and other expressions do
+                not match the allowed ones by throwing a ValueError exception. Only lines containing
+                are allowed.
+                these characters are without spaces:
+
+                    - lowercase and uppercase Latin letters (a-z, A-Z);
+                    - numbers (0-9);
+                    - underline;
+                    - period;
+                    - hyphen.
+
+                This allows you to use strings consisting of regular identifiers, table names, and columns.
+                or other SQL parameters, but excludes inappropriate characters such as quotation marks, spaces,
+                or special characters that may be part of an SQL injection.
+
+                2) Checking for SQL key commands:
+                After checking the characters, the string is additionally analyzed for reserved SQL keywords.
+                words that can be used in injections. If the string contains any of the following prohibited
+                words (as a separate word, for example, "drop" or "audit.drop", but not "updated_at" or
+                "created_by"), a ValueError exception will be thrown.:
+
+                    - DROP;
+                    - CREATE;
+                    - ALTER;
+                    - INSERT;
+                    - UPDATE;
+                    - DELETE;
+                    - SQL comment "--";
+                    - The command completion symbol ";".
+
+            This prevents the use of strings containing malicious SQL constructs that can
+            damage the database structure or its contents. The patterns are compiled once, the results of the
+            check are memoized (repeated names are not checked again). In the SQL queries, the identifiers are
+            additionally quoted by the dialect ("self._quote_identifier()"). To check many names at once, use
+            "self._stop_sql_injections_batch()".
+
+
+            ***
+
+            * Example of a call:
+
+                self.name_entity: str = self._stop_sql_injections(self._validator(name_table, str))
+
+            ***
+
+            :param sql_param_string: A string that is passed for security verification before use \
+                in the SQL query.
+            :return: A validated string that is safe to use in an SQL query.
+            :rtype: str.
+            :raises ValueError: If the string contains invalid SQL characters or keywords, \
+                which may be part of the injection.
+        """
+
+        return _check_identifier(self._validator(sql_param_string, str))
+
+    def _stop_sql_injections_batch(self, sql_param_strings: Iterable[str]) -> list[str]:
+        """
+            *** A private method for checking many identifiers for SQL injections in one pass. ***
+
+            It is designed to check thousands of names (for example, of the columns of a bulk restoration of
+            comments) with the same rules as "self._stop_sql_injections()", but without a separate call for each name.
+
+            * Description of the mechanics:
+
+                The names are joined by line breaks and checked by two compiled regular expressions in one pass
+                over the whole string (the allowed characters of each name and the forbidden SQL keywords). Only if
+                the check fails, the names are checked one by one to raise an exception with the invalid name.
+
+            ***
+
+            * Example of a call:
+
+                names_columns = self._stop_sql_injections_batch(comments_columns_dict.keys())
+
+            ***
+
+            :param sql_param_strings: The strings that are passed for security verification.
+            :return: A list of validated strings.
+            :rtype: list[str].
+            :raises TypeError: If one of the values is not a string.
+            :raises ValueError: If one of the strings contains invalid SQL characters or keywords.
+        """
+
+        valid_strings = list(sql_param_strings)
+
+        if not all(isinstance(value, str) for value in valid_strings):
+            for value in valid_strings:
+                self._validator(value, str)
+
+        allowed_pattern, keywords_pattern = _get_identifier_patterns()
+        joined_strings = '\n'.join(valid_strings)
+
+        if valid_strings and (
+                joined_strings.count('\n') != len(valid_strings) - 1
+                or not allowed_pattern.fullmatch(joined_strings)
+                or keywords_pattern.search(joined_strings)
+        ):
+            # Finding the invalid string (raises ValueError):
+            for value in valid_strings:
+                _check_identifier(value)
+
+        return valid_strings
+
+    def _quote_identifier(self, identifier: str) -> str:
+        """
+            *** A private method for quoting an identifier for SQL queries by the dialect of the engine. ***
+
+            The identifier is always quoted (the case of letters is preserved) by "IdentifierPreparer" of the
+            dialect of the engine, the quotation marks inside the identifier are escaped.
+
+            * Example of a call:
+
+                relation = f'{self._quote_identifier(self.schema)}.{self._quote_identifier(self.name_entity)}'
+
+            ***
+
+            :param identifier: The identifier (checked by "self._stop_sql_injections()").
+            :return: The quoted identifier, for example: '"sales"'.
+            :rtype: str.
+        """
+
+        return self.engine.dialect.identifier_preparer.quote_identifier(identifier)
+
+    def _validate_targets(self, targets: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+            *** A private method for checking the pairs (schema, entity name) passed to the methods. ***
+
+            The names of all pairs are checked for SQL injections in one pass ("self._stop_sql_injections_batch()").
+
+            * Example of a call:
+
+                targets = self._validate_targets([('audit', 'sales'), ('audit', 'dags')])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :return: A list of the checked tuples (schema, entity name).
+            :rtype: list[tuple[str, str]].
+            :raises TypeError: If a pair is not a tuple (list) or a name is not a string.
+            :raises ValueError: If a pair does not consist of two names, or a name contains invalid SQL characters \
+                or keywords.
+        """
+
+        valid_targets = [tuple(self._validator(target, tuple, list)) for target in targets]
+
+        for target in valid_targets:
+            if len(target) != 2:
+                raise ValueError(f'Invalid target: "{target}", a pair (schema, entity name) expected.')
+
+        self._stop_sql_injections_batch(name for target in valid_targets for name in target)
+
+        return valid_targets
+
+    def _check_all_elements(self, check_type: type, args_array: dict | list | tuple) -> bool:  # *args_elements
+        """
+            *** A private method for validating the entire set of arguments against a single data type. ***
+
+            It is designed to ensure the correct transmission of the entire passed set of arguments "args_array"
+            in accordance with the required data type (specified for verification in "check_type"). Used as
+            a nested method in other parts of the library code to control the logic of further data processing
+            (redirecting data to condition blocks).
+
+            * Description of the mechanics:
+
+                In accordance with the passed data type (acceptable) through the "check_type" parameter, the following
+                is performed reconciliation of the checked array of arguments "args_array" based on the collaboration
+                of the "all" and "isinstance" methods. Validation is pre-performed using the "self._validator()" method
+                for valid values for arguments:
+                "check_type" - checking the transmission of a data type, for example "str", an invalid value, for
+                example, "test";
+                "args_array" - will be checked for compliance with dict|list | tuple.
+
+            ***
+
+            * Example of a call:
+
+                if self._check_all_elements(str, param_column_index_or_name):
+                    pass
+
+            ***
+
+            :param check_type: One or more data types allowed for the value.
+            :param args_array: An array of arguments to check element-by-element, only dict|list|tuple \
+                types are allowed.
+            :return: Returns True if "args_array" matches the type "check_type" \
+                and the validation was passed, otherwise False.
+            :rtype: bool.
+            :raises: Exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        # Validation of the passed argument (corresponds to the data type) for further verification:
+        valid_type = self._validator(check_type, type)
+        # Allowed types for args_array:
+        valid_args_array = self._validator(args_array, (dict, list, tuple,))
+
+        # Check if all the elements have the same type:
+        return all(isinstance(element, valid_type) for element in valid_args_array)
+
+    @contextmanager
+    def _instrument(self, method: str) -> Iterator[None]:
+        """
+            *** A private context manager for measuring the call of the public method (see "QueryMetrics"). ***
+
+            It is designed to collect the measurements of the call (statements, rows, connection checkouts, latency)
+            and pass them to "self.metrics" when exiting the block. The counters are stored in a context variable,
+            so the calls from different threads and asyncio tasks are measured separately. Nested calls of public
+            methods (for example, "get_type_entity()" inside "save_comments()") are counted in the outer call.
+            The measurements are keyed by the class of the instance and the method ('Tcommenter.save_comments'), so
+            the methods of different classes with the same name are not mixed. If the instance has no metrics,
+            nothing is measured.
+
+            * Example of a call:
+
+                with self._instrument('save_comments'):
+                    ...
+
+            ***
+
+            :param method: The name of the measured method.
+            :return: None.
+        """
+
+        if self.metrics is None or _CURRENT_CALL.get() is not None:
+            yield
+            return
+
+        sample = {'statements': 0, 'rows': 0, 'checkouts': 0}
+        token = _CURRENT_CALL.set(sample)
+        start_time = time.perf_counter()
+        error = False
+
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            _CURRENT_CALL.reset(token)
+            self.metrics.record(f'{type(self).__name__}.{method}', sample, time.perf_counter() - start_time, error)
+
+    @staticmethod
+    def _count_metrics(**counters: int) -> None:
+        """
+            *** A private method for increasing the counters of the current measured call (see "_instrument()"). ***
+
+            :param counters: Increments of the counters: statements, rows, checkouts.
+            :return: None.
+        """
+
+        sample = _CURRENT_CALL.get()
+
+        if sample is not None:
+            for name, value in counters.items():
+                sample[name] += value
+
+    @contextmanager
+    def _connection_scope(self) -> Iterator[Connection]:
+        """
+            *** A private context manager for getting a connection to execute queries. ***
+
+            Inside the open session ("session()"), the connection of the session is returned (the transaction is
+            controlled by the session), otherwise a new connection is taken from the engine pool and a separate
+            transaction is opened for it (committed when exiting the block).
+
+            * Example of a call:
+
+                with self._connection_scope() as conn:
+                    conn.execute(sql)
+
+            ***
+
+            :return: SQLAlchemy connection.
+            :rtype: Iterator[Connection].
+        """
+
+        if self._connection is not None:
+            yield self._connection
+
+        else:
+            with self.engine.connect() as conn:
+                self._count_metrics(checkouts=1)
+
+                with conn.begin():
+                    yield conn
+
+    @contextmanager
+    def session(self, connection: Connection | None = None) -> Iterator['BaseCommenter']:
+        """
+            *** A context manager for executing all queries of the instance on one connection in one transaction. ***
+
+            It is designed to reuse one connection for all methods called inside the block (without taking a
+            connection from the pool and opening a transaction for each call), as well as to write comments in the
+            same transaction as other operations of the caller (for example, "pandas.DataFrame.to_sql()" that has
+            just recreated the table, or work with a temporary table existing only on this connection).
+
+            * Description of the mechanics:
+
+                If the "connection" argument is not passed, one connection is taken from the engine pool and one
+                transaction is opened: it is committed when exiting the block, and rolled back in case of an exception.
+                If the caller's connection is passed: if a transaction is already open on it, all queries are executed
+                in it (it is committed or rolled back by the caller), otherwise a transaction is opened for the block.
+                Inside the session, the cache of metadata is not used for reading (the data may not be committed yet).
+                After an error in one of the queries, the transaction of the session can no longer be used
+                (PostgreSQL), so the exception should not be suppressed inside the block. The session belongs to the
+                thread (asyncio task) that opened it: the other threads and tasks using the same instance take their
+                own connections, and do not enter its transaction. Nested calls reuse the open session.
+
+            ***
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                with comments.session():
+                    all_comments_dict = comments.get_all_comments()
+                    comments.save_comments(all_comments_dict)
+
+                with ENGINE.begin() as conn:
+                    dataframe.to_sql('sales', conn, schema='audit', if_exists='replace')
+
+                    with comments.session(conn):
+                        comments.save_comments(all_comments_dict)
+
+            ***
+
+            :param connection: Optional, the SQLAlchemy connection of the caller.
+            :return: The instance itself (the methods are called on it as usual).
+            :rtype: Iterator[BaseCommenter].
+            :raises TypeError: If the passed connection is not "sqlalchemy.engine.Connection".
+        """
+
+        from sqlalchemy.engine import Connection
+
+        connection = self._validator(connection, Connection, type(None))
+
+        # The session is already open (nested call):
+        if self._connection is not None:
+            yield self
+            return
+
+        token: Token | None = None
+
+        try:
+
+            # The caller's transaction (it is controlled by the caller):
+            if connection is not None and connection.in_transaction():
+                token = self._enter_session(connection)
+                yield self
+
+            elif connection is not None:
+                with connection.begin():
+                    token = self._enter_session(connection)
+                    yield self
+
+            else:
+                with self.engine.connect() as conn:
+                    self._count_metrics(checkouts=1)
+
+                    with conn.begin():
+                        token = self._enter_session(conn)
+                        yield self
+
+        finally:
+            if token is not None:
+                _SESSION_CONNECTIONS.reset(token)
+
+            # The data read or written inside the session could have been rolled back:
+            self._invalidate_cache()
+
+    def _get_cache_key_prefix(self) -> tuple[str, ...]:
+        """
+            *** A private method for getting the beginning of the cache keys of the instance. ***
+
+            The records of the cache are keyed by the engine URL and the schema (the classes bound to an entity
+            add its name).
+
+            :return: (engine URL, schema).
+            :rtype: tuple[str, ...].
+        """
+
+        return str(self.engine.url), self.schema
+
+    def _get_cache_key(self, kind: str, sql: str | TextClause, params: dict) -> tuple:
+        """
+            *** A private method for generating a cache key for a read query. ***
+
+            :param kind: The kind of cached data: 'comments' (invalidated by writing comments) or 'type'.
+            :param sql: SQL query template.
+            :param params: Query parameters (lists are converted into tuples).
+            :return: (engine URL, schema, [entity], kind, SQL, parameters).
+            :rtype: tuple.
+        """
+
+        frozen_params = tuple(
+            sorted((key, tuple(value) if isinstance(value, list) else value) for key, value in params.items())
+        )
+
+        return *self._get_cache_key_prefix(), kind, str(sql), frozen_params
+
+    def _invalidate_cache(self) -> None:
+        """
+            *** A private method for invalidating the cache records of the instance after writing comments. ***
+
+            All the records of the schema are invalidated (the classes bound to an entity invalidate only the
+            comments of the entity, see "Tcommenter._invalidate_cache()").
+        """
+
+        if self.cache is not None:
+            self.cache.invalidate(*self._get_cache_key_prefix())
+
+    def _invalidate_targets_cache(self, targets: Iterable[tuple[str, str]]) -> None:
+        """
+            *** A private method for invalidating the cached comments of other entities after writing to them. ***
+
+            It is used after writing comments to entities other than the entity of the instance (copying,
+            partitions, buffered writes).
+
+            :param targets: Tuples (schema, entity name).
+            :return: None.
+        """
+
+        if self.cache is not None:
+            for schema, table in targets:
+                self.cache.invalidate(str(self.engine.url), schema, table, 'comments')
+
+    def _cached_reader(self, kind: str, sql: str | TextClause, **params: str | int | list) -> list[tuple]:
+        """
+            *** A private method of reading data in an SQL database through the cache of metadata. ***
+
+            It is designed to execute SQL queries for reading metadata through the cache ("MetadataCache") passed
+            during initialization. If the cache is not set, it is equivalent to "self._reader()".
+
+            * Description of the mechanics:
+
+                The key of the record is formed from the engine URL, schema, entity, kind of data, SQL query and its
+                parameters. Writing comments invalidates only the records of the 'comments' kind (the types of
+                entities do not change from this, they are limited only by the TTL). If the record is found (and has
+                not expired), the query is not executed, otherwise the result of "self._reader()" is stored in the
+                cache.
+
+            ***
+
+            * Example of a call:
+
+                result = self._cached_reader('type', SQL_CHECK_TYPE_ENTITY, relation=self._relation)
+
+            ***
+
+            :param kind: The kind of cached data: 'comments' or 'type'.
+            :param sql: SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: required data).
+            :return: Returns a list of tuples, example result: [(1, 'Alice'), (2, 'Bob'), (3, 'Charlie')] or [].
+            :rtype: list[tuple].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        # Inside the session, the data may not be committed yet (or may be rolled back), it is not cached:
+        if self.cache is None or self._connection is not None:
+            return self._reader(sql, **params)
+
+        cache_key = self._get_cache_key(kind, sql, params)
+        is_found, tuple_list = self.cache.get(cache_key)
+
+        if not is_found:
+            tuple_list = self._reader(sql, **params)
+            self.cache.set(cache_key, tuple_list)
+
+        return tuple_list
+
+    def _reader(self, sql: str | TextClause, **params: str | int | list) -> list[tuple]:
+        """
+           *** Private method of reading data in an SQL database. ***
+
+            It is designed to execute SQL queries to read data with or without parameter substitution.
+            It is used as a nested method in other sections of the library code.
+
+            * Description of the mechanics:
+
+                The method is based on the "SQLAlchemy" ("execute()") library. Optional parameter transmission,
+                allows you to make a self._reader () is universal. Transmission mechanism via Multi params
+                conn.execute (sql, multiparams) provides protection against SQL injection.
+                If an error occurs when a request is made, a RuntimeError exception is thrown.
+                with errors (SQLAlchemy Error).
+
+            ***
+
+            * Example of a call:
+
+                result = self._reader(sql, placeholder_sales='sales')
+
+            ***
+
+            :param sql:SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: required data).
+            :return: Returns a list of tuples, example result: [(1, 'Alice'), (2, 'Bob'), (3, 'Charlie')] or [].
+            :rtype: list[tuple].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        from sqlalchemy.exc import SQLAlchemyError
+
+        _params = params or None
+
+        try:
+
+            sql = self._get_text_clause(sql)
+
+            with self._connection_scope() as conn:
+                if _params:
+                    _params: dict = self._validator(_params, dict)
+                    result = conn.execute(sql, _params)
+                else:
+                    result = conn.execute(sql)
+
+                # tuple_list = result.fetchall()  # Returns the Row object
+                tuple_list = [tuple(row) for row in result.fetchall()]  # fetchall() returns [] if there is no data.
+                self._count_metrics(statements=1, rows=len(tuple_list))
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+        # Even if fetchall() returns an empty list, the generator will safely return [].
+        return tuple_list
+
+    def _recorder(self, sql: str | TextClause, **params: None | str | int) -> None:
+        """
+            *** A private method for writing data to an SQL database. ***
+
+            It is designed to execute SQL queries for writing data with or without parameter substitution.
+            It is used as a nested method in other sections of the library code.
+
+            * Description of the mechanics:
+
+                The method is based on the "SQLAlchemy" ("execute()") library. Optional parameter transmission,
+                allows you to make a self._recorder () is universal. Transmission mechanism via Multi params
+                conn.execute (sql, multiparams) provides protection against SQL injection.
+                If an error occurs when a request is made, a RuntimeError exception is thrown.
+                with errors (SQLAlchemy Error).
+
+            ***
+
+            * Example of a call:
+
+                self._recorder(sql, sales='This comment will be recorded in the metadata for the columns.')
+
+            ***
+
+            :param sql: SQL query template.
+            :param params: kwargs (key: placeholder name in the SQL template, value: optional data).
+            :return: None.
+            :rtype: Note.
+            :raises Runtime Error: is (SQLAlchemy Error).
+        """
+
+        from sqlalchemy.exc import SQLAlchemyError
+
+        _params = params or None
+
+        try:
+
+            sql = self._get_text_clause(sql)
+
+            with self._connection_scope() as conn:
+
+                self._count_metrics(statements=1)
+
+                if _params:
+                    _params: dict = self._validator(_params, dict)
+                    conn.execute(sql, _params)
+                else:
+                    conn.execute(sql)
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+        # The written metadata is no longer relevant in the cache:
+        finally:
+            self._invalidate_cache()
+
+    def _batch_recorder(self, statements: list[tuple[str | TextClause, dict]]) -> dict[str, int | float]:
+        """
+            *** A private method for writing a batch of SQL queries to a database in a single transaction. ***
+
+            It is designed to execute a set of SQL queries for writing data (for example, "COMMENT ON ...") on one
+            connection and inside one transaction ("all or nothing"). It is used as a nested method in other
+            sections of the library code instead of calling "self._recorder()" for each query separately.
+
+            * Description of the mechanics:
+
+                The method is based on the "SQLAlchemy" ("execute()") library. One connection is taken from the
+                engine pool, one transaction is opened, after which all the transmitted queries are executed in turn
+                with their parameters (transmission via multiparams provides protection against SQL injection).
+                If an error occurs in any of the queries, the entire transaction is rolled back and a RuntimeError
+                exception is thrown (with SQLAlchemy Error). After a successful commit, a report is returned
+                containing the number of executed queries and the elapsed time (in seconds).
+
+            ***
+
+            * Example of a call:
+
+                report = self._batch_recorder([(sql_table, {'comment': 'table'}), (sql_column, {'comment': 'col'})])
+
+            ***
+
+            :param statements: A list of pairs (SQL query template, dictionary of parameters).
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        from sqlalchemy.exc import SQLAlchemyError
+
+        valid_statements: list = self._validator(statements, list)
+
+        start_time = time.perf_counter()
+
+        # There is nothing to write, we do not take a connection from the pool:
+        if not valid_statements:
+            return {'statements': 0, 'elapsed': 0.0}
+
+        try:
+
+            with self._connection_scope() as conn:
+
+                for sql, params in valid_statements:
+
+                    sql = self._get_text_clause(sql)
+
+                    self._count_metrics(statements=1)
+
+                    if params:
+                        conn.execute(sql, self._validator(params, dict))
+                    else:
+                        conn.execute(sql)
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+        # The written metadata is no longer relevant in the cache:
+        finally:
+            self._invalidate_cache()
+
+        return {'statements': len(valid_statements), 'elapsed': time.perf_counter() - start_time}
+
+    def _prepare_restore_comments(self, records: list[dict]) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for preparing a server-side restoration of comments on many entities. ***
+
+            It is designed to prepare (without execution) SQL queries that apply comments to any number of entities
+            (and their columns) of any schemas on the server side: the entire set of comments is transferred to the
+            database once (as one JSON parameter), and "COMMENT ON ..." queries are generated and executed by the
+            server itself. The result is written via "self._batch_recorder()" (one connection, one transaction).
+
+            * Description of the mechanics:
+
+                The list of records is serialized into JSON and passed as a parameter to the "set_config()" function
+                (the value is available only inside the current transaction). The next query (the "DO" block) reads
+                this value, determines the type of each entity (table, view, materialized view, foreign or partitioned
+                table) and executes the necessary "COMMENT ON ..." queries. The names of entities and columns are
+                quoted by the server ("format('%I')"), comments are passed as literals ("format('%L')").
+                Entities and columns that do not exist in the database are skipped (if the record has the
+                "strict": True key, an exception is thrown instead, and the whole transaction is rolled back).
+                The type of the entity can be set explicitly by the "entity_type" key ('TABLE', 'VIEW', ...).
+                If the "table_comment" key is missing, the comment on the entity is not changed, None deletes it.
+
+            ***
+
+            * Example of a call:
+
+                records = [{'schema': 'audit', 'table': 'sales', 'table_comment': 'pass', 'columns': {'id': 'pass'}}]
+                report = self._batch_recorder(self._prepare_restore_comments(records))
+
+            ***
+
+            :param records: A list of dictionaries of the type: \
+                {'schema': 'schema', 'table': 'name', 'table_comment': 'comment', 'columns': {'column': 'comment'}}.
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+        """
+
+        valid_records: list = self._validator(records, list)
+
+        identifiers: list[str] = []
+
+        for record in valid_records:
+            self._validator(record, dict)
+            identifiers.append(record.get('schema'))
+            identifiers.append(record.get('table'))
+            identifiers.extend(self._validator(record.get('columns', {}), dict))
+
+        # All names of all records in one pass:
+        self._stop_sql_injections_batch(identifiers)
+
+        import json
+
+        payload = json.dumps(valid_records, ensure_ascii=False)
+
+        return [(SQL_SET_COMMENTS_PAYLOAD, {'payload': payload}), (SQL_RESTORE_COMMENTS, {})]
+
+    def _merge_statements(self, statements: list[tuple[str, dict[str, str]]]) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for merging the prepared queries into one statement (one round trip). ***
+
+            With drivers binding parameters on the client side ("psycopg2"), the queries (for example, setting of
+            the payload and the "DO" block) are sent as one statement. With other drivers (for example, "asyncpg",
+            which does not allow several statements in one prepared query), the queries are returned unchanged.
+
+            * Example of a call:
+
+                report = self._batch_recorder(self._merge_statements(self._prepare_restore_comments(records)))
+
+            ***
+
+            :param statements: A list of pairs (SQL query, dictionary of parameters).
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+        """
+
+        if self.engine.dialect.driver != 'psycopg2' or len(statements) < 2:
+            return statements
+
+        merged_params: dict[str, str] = {}
+
+        for _, params in statements:
+            merged_params.update(params)
+
+        return [(';\n'.join(sql.strip().rstrip(';') for sql, _ in statements), merged_params)]
+
+    def _prepare_types_entities(self, targets: list[tuple[str, str]]) -> dict[str, list[str]]:
+        """
+            *** A private method for preparing the parameters of the batched resolution of the types of entities. ***
+
+            :param targets: The checked tuples (schema, entity name), see "self._validate_targets()".
+            :return: The parameters of "SQL_GET_TYPES_ENTITIES": {'relations': ['"audit"."sales"', ...]}.
+            :rtype: dict[str, list[str]].
+        """
+
+        return {
+            'relations': [
+                f'{self._quote_identifier(schema)}.{self._quote_identifier(name_entity)}'
+                for schema, name_entity in targets
+            ]
+        }
+
+    @staticmethod
+    def _parse_types_entities(
+            targets: list[tuple[str, str]],
+            types_tuple_list: list[tuple]
+    ) -> dict[tuple[str, str], str | None]:
+        """
+            *** A private method for converting the result of the batched resolution of the types of entities. ***
+
+            :param targets: The checked tuples (schema, entity name).
+            :param types_tuple_list: The result of "SQL_GET_TYPES_ENTITIES": [('audit', 'sales', 'table'), ...].
+            :return: {('audit', 'sales'): 'table', ('audit', 'ghost'): None, ...} (in the order of the targets).
+            :rtype: dict[tuple[str, str], str | None].
+        """
+
+        types_dict = {(schema, name_entity): type_entity for schema, name_entity, type_entity in types_tuple_list}
+
+        return {target: types_dict.get(target) for target in targets}
+
+    @instrumented
+    def get_types_entities(self, targets: Iterable[tuple[str, str]]) -> dict[tuple[str, str], str | None]:
+        """
+            *** A method for determining the types of many entities of a database in one query. ***
+
+            It is intended for determining the types of any number of entities (of any schemas) with one query to
+            the system catalog, instead of one query per entity ("Tcommenter.get_type_entity()"). Bulk jobs resolve
+            the types of all entities in advance and pass them to "Tcommenter.save_comments()" (the "type_entity"
+            argument).
+
+            * Description of the mechanics:
+
+                The names of all entities are checked for SQL injections in one pass, quoted by the dialect and
+                passed to the database as one array parameter; the server resolves them into OIDs ("to_regclass()",
+                a missing entity is not an error) and returns the types of all found entities ("= ANY(...)").
+                Query result options: 'table', 'view', 'mview', 'index', 'sequence', 'toast', 'composite_type',
+                'foreign_table', 'partitioned_table', 'partitioned_index'. If the entity does not exist - None.
+
+            ***
+
+            * Example of a call:
+
+                comments = DatabaseCommenter(engine=ENGINE)
+
+                # -> {('audit', 'sales'): 'table', ('audit', 'v_sales'): 'view', ('audit', 'ghost'): None}.
+                types_dict = comments.get_types_entities([('audit', 'sales'), ('audit', 'v_sales'), ('audit', 'ghost')])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :return: The types of the entities in the order of the targets: {(schema, entity name): type or None}.
+            :rtype: dict[tuple[str, str], str | None].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        valid_targets = self._validate_targets(targets)
+
+        # There is nothing to resolve, we do not access the database:
+        if not valid_targets:
+            return {}
+
+        types_tuple_list = self._cached_reader(
+            'type', SQL_GET_TYPES_ENTITIES, **self._prepare_types_entities(valid_targets)
+        )
+
+        return self._parse_types_entities(valid_targets, types_tuple_list)
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,424 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library with the write-behind buffer of comments.
+
+    When comments are written many times a minute (for example, the freshness of the data in the columns is
+    recorded by a streaming load), each call is a synchronous round trip to the database and a lock on the entity.
+    "CommentBuffer" accepts comments into memory (the last write of the same comment wins) and writes them in the
+    background with batches: one transaction and one server-side query for all the accumulated comments.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import atexit
+
+# -------------------------------- Local modules
+from .base import BaseCommenter
+from .cache import MetadataCache
+from .metrics import QueryMetrics, instrumented
+from .sql.postgre_sql import SQL_GET_ENTITIES_COLUMNS
+
+# SQLAlchemy (and "threading") are imported on the first call, not when the library is imported (see "__init__.py"):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from threading import Thread
+
+    from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class CommentBuffer(BaseCommenter):
+    """
+        "CommentBuffer" is a write-behind buffer of comments on entities (of any schemas) and their columns: the
+        comments are accepted into memory and written to the database by a background thread with batches (in the
+        current version of the library, only for PostgreSQL).
+    """
+
+    def __init__(
+            self,
+            engine: Engine,
+            max_size: int = 1000,
+            flush_interval: float = 5.0,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None
+    ):
+        super().__init__(engine, None, cache, metrics)
+
+        if self._validator(max_size, int) <= 0 or isinstance(max_size, bool):
+            raise ValueError(f'Invalid value of the "max_size" argument: "{max_size}", a positive int expected.')
+
+        if self._validator(flush_interval, int, float) <= 0 or isinstance(flush_interval, bool):
+            raise ValueError(
+                f'Invalid value of the "flush_interval" argument: "{flush_interval}", a positive number expected.'
+            )
+
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.last_error: Exception | None = None
+
+        # The comments waiting to be written: {(schema, entity, column or None): comment}:
+        self._pending: dict[tuple[str, str, str | None], str] = {}
+        self._counters = {'enqueued': 0, 'flushed': 0, 'skipped': 0, 'flushes': 0, 'errors': 0}
+        self._thread: Thread | None = None
+        self._closed = False
+
+        import threading
+
+        self._lock = threading.Lock()  # Protects the buffer and the counters.
+        self._flush_lock = threading.Lock()  # The batches are written one after another (in the order of writes).
+        self._wakeup = threading.Event()
+
+    def _start_thread(self) -> None:
+        """
+            *** A private method for starting the background thread of flushes (on the first write to the buffer). ***
+
+            The flush of the buffer at the exit of the interpreter is registered at the same time ("atexit").
+
+            :return: None.
+        """
+
+        import threading
+
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(target=self._run, name='tcommenter-buffer', daemon=True)
+            self._thread.start()
+
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """
+            *** A private method of the background thread: flushes the buffer on a size or time threshold. ***
+
+            The errors of the background flushes do not stop the thread: the comments remain in the buffer (see
+            "flush()"), the exception is saved in "self.last_error", the next attempt - at the next threshold.
+
+            :return: None.
+        """
+
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+            # The last flush is performed by "close()":
+            if self._closed:
+                return
+
+            try:
+                self.flush()
+            except Exception as error:
+                self.last_error = error
+
+    def _enqueue(self, comments: dict[tuple[str, str, str | None], str]) -> dict[str, int]:
+        """
+            *** A private method for accepting the checked comments into the buffer. ***
+
+            :param comments: {(schema, entity, column or None): comment}.
+            :return: Report of the type {'buffered': 2, 'pending': 120}.
+            :rtype: dict[str, int].
+            :raises RuntimeError: If the buffer is closed.
+        """
+
+        # The check and the update under one lock: the comments accepted before "close()" are written by it:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f'Error: The buffer is closed, the comments are not accepted: {comments}.')
+
+            self._pending.update(comments)
+            self._counters['enqueued'] += len(comments)
+            pending = len(self._pending)
+
+        self._start_thread()
+
+        # The size threshold - the background thread writes the buffer without waiting for the interval:
+        if pending >= self.max_size:
+            self._wakeup.set()
+
+        return {'buffered': len(comments), 'pending': pending}
+
+    def _prepare_buffered_comments(
+            self,
+            schema: str,
+            name_table: str,
+            table_comment: str | None = None,
+            columns: dict[str, str] | None = None
+    ) -> dict[tuple[str, str, str | None], str]:
+        """
+            *** A private method for checking the comments of an entity before accepting them into the buffer. ***
+
+            The names are checked for SQL injections in one pass, the comments - by type: the errors are reported
+            to the caller, and not by the background thread.
+
+            :param schema: The schema of the entity.
+            :param name_table: The name of the entity.
+            :param table_comment: The comment on the entity or None (is not changed).
+            :param columns: The comments on the columns: {'column_1': 'comment', ...} or None.
+            :return: {(schema, entity, column or None): comment}.
+            :rtype: dict[tuple[str, str, str | None], str].
+        """
+
+        columns = self._validator(columns or {}, dict)
+        self._stop_sql_injections_batch([schema, name_table, *columns])
+
+        comments = {
+            (schema, name_table, name_column): self._validator(comment, str) for name_column, comment in columns.items()
+        }
+
+        if table_comment is not None:
+            comments[(schema, name_table, None)] = self._validator(table_comment, str)
+
+        return comments
+
+    def set_table_comment(self, schema: str, name_table: str, comment: str) -> dict[str, int]:
+        """
+            *** A method for accepting a comment on an entity (table, view, ...) into the buffer. ***
+
+            The type of the entity is determined by the server when the buffer is written.
+
+            * Example of a call:
+
+                buffer = CommentBuffer(engine=ENGINE)
+                buffer.set_table_comment('audit', 'sales', 'Updated: 2025-01-01 12:00.')
+
+            ***
+
+            :param schema: The schema of the entity.
+            :param name_table: The name of the entity.
+            :param comment: A comment to be written to the entity.
+            :return: Report of the type {'buffered': 1, 'pending': 120}.
+            :rtype: dict[str, int].
+        """
+
+        return self._enqueue(self._prepare_buffered_comments(schema, name_table, table_comment=comment))
+
+    def set_column_comment(self, schema: str, name_table: str, **comments_columns: str) -> dict[str, int]:
+        """
+            *** A method for accepting comments on the columns of an entity into the buffer. ***
+
+            * Example of a call:
+
+                buffer = CommentBuffer(engine=ENGINE)
+                buffer.set_column_comment('audit', 'sales', sales='Updated: 2025-01-01 12:00.')
+
+            ***
+
+            :param schema: The schema of the entity.
+            :param name_table: The name of the entity.
+            :param comments_columns: kwargs (key: column name, value: comment).
+            :return: Report of the type {'buffered': 1, 'pending': 120}.
+            :rtype: dict[str, int].
+        """
+
+        return self._enqueue(self._prepare_buffered_comments(schema, name_table, columns=comments_columns))
+
+    def save_comments(self, schema: str, name_table: str, comments_dict: dict[str, str | dict]) -> dict[str, int]:
+        """
+            *** A method for accepting comments of any type (the "service structure") into the buffer. ***
+
+            * Example of a call:
+
+                buffer = CommentBuffer(engine=ENGINE)
+                buffer.save_comments('audit', 'sales', {'table': 'Sales', 'columns': {'sales': 'Amount'}})
+
+            ***
+
+            :param schema: The schema of the entity.
+            :param name_table: The name of the entity.
+            :param comments_dict: Type dictionary: \\
+                {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :return: Report of the type {'buffered': 2, 'pending': 120}.
+            :rtype: dict[str, int].
+            :raises ValueError: If the dictionary is empty or does not match the "service structure".
+        """
+
+        comments_dict = self._validator(comments_dict, dict)
+
+        if not comments_dict or set(comments_dict) - {'table', 'columns'}:
+            raise ValueError(
+                f'Error: The passed "comments_dict" argument does not match the "service structure" '
+                f'{{"table": "table_comment", "columns": {{...}}}}. Received: {comments_dict}.'
+            )
+
+        return self._enqueue(
+            self._prepare_buffered_comments(
+                schema, name_table, table_comment=comments_dict.get('table'), columns=comments_dict.get('columns')
+            )
+        )
+
+    @instrumented
+    def flush(self) -> dict[str, int | float | list]:
+        """
+            *** A method for writing all the accumulated comments to the database. ***
+
+            * Description of the mechanics:
+
+                The buffer is replaced by an empty one, and the accumulated comments (only the last write of each
+                comment) are grouped by entities. In one transaction, the columns of the entities are read with one
+                query, and the comments are written with one server-side query ("self._prepare_restore_comments()",
+                the type of each entity is determined by the server). The comments on entities and columns that do
+                not exist (for example, a misspelled column name) are not written: they are returned in the report
+                ('skipped' key: (schema, entity, column or None)) and counted in "stats()" separately from the written
+                ones. If the writing fails, the comments are returned to the buffer (if they have not been written
+                again in the meantime) and the exception is thrown.
+                It is called by the background thread (on the "max_size" or "flush_interval" threshold), by "close()"
+                and at the exit of the interpreter.
+
+            ***
+
+            * Example of a call:
+
+                buffer = CommentBuffer(engine=ENGINE)
+
+                # -> {'comments': 120, 'skipped': [('audit', 'sales', 'typo')], 'relations': 3, 'statements': 1,
+                #     'elapsed': 0.0042}.
+                report = buffer.flush()
+
+            ***
+
+            :return: Report of the type {'comments': 120, 'skipped': [], 'relations': 3, 'statements': 1, \
+                'elapsed': 0.0042} ('comments' - the number of written comments).
+            :rtype: dict[str, int | float | list].
+            :raises ValueError: If it is called inside "session()" (the buffer is written by its own transactions).
+            :raises RuntimeError: If (SQLAlchemyError), see "self._reader()" and "self._batch_recorder()".
+        """
+
+        from sqlalchemy.exc import SQLAlchemyError
+
+        if self._connection is not None:
+            raise ValueError('Error: The buffer is written by its own transactions, it cannot be used in "session()".')
+
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+
+            if not pending:
+                return {'comments': 0, 'skipped': [], 'relations': 0, 'statements': 0, 'elapsed': 0.0}
+
+            records: dict[tuple[str, str], dict] = {}
+            skipped: list[tuple[str, str, str | None]] = []
+
+            try:
+                with self.session():
+                    entities_columns = self._reader(
+                        SQL_GET_ENTITIES_COLUMNS,
+                        **self._prepare_types_entities(list(dict.fromkeys(key[:2] for key in pending)))
+                    )
+
+                    # The existing entities and their columns (an entity is marked with the column None):
+                    existing = {(schema, name_table, None) for schema, name_table, _ in entities_columns}
+                    existing.update(entities_columns)
+
+                    for key, comment in pending.items():
+                        schema, name_table, name_column = key
+
+                        if key not in existing:
+                            skipped.append(key)
+                            continue
+
+                        record = records.setdefault(
+                            (schema, name_table), {'schema': schema, 'table': name_table, 'columns': {}}
+                        )
+
+                        if name_column is None:
+                            record['table_comment'] = comment
+                        else:
+                            record['columns'][name_column] = comment
+
+                    report = self._batch_recorder(
+                        self._merge_statements(self._prepare_restore_comments(list(records.values())))
+                    ) if records else {'statements': 0, 'elapsed': 0.0}
+
+            except BaseException as error:
+                with self._lock:
+                    # Newer writes of the same comments win:
+                    for key, comment in pending.items():
+                        self._pending.setdefault(key, comment)
+
+                    self._counters['errors'] += 1
+
+                # The connection of the session (or its commit) failed:
+                if isinstance(error, SQLAlchemyError):
+                    raise RuntimeError(f"Error executing query: {error}")
+
+                raise
+
+            self._invalidate_targets_cache(records)
+
+            with self._lock:
+                self._counters['flushed'] += len(pending) - len(skipped)
+                self._counters['skipped'] += len(skipped)
+                self._counters['flushes'] += 1
+
+        return {'comments': len(pending) - len(skipped), 'skipped': skipped, 'relations': len(records)} | report
+
+    def close(self) -> dict[str, int | float | list]:
+        """
+            *** A method for stopping the background thread and writing the rest of the buffer. ***
+
+            After closing, the buffer does not accept comments. It is called automatically at the exit of the
+            interpreter and when exiting the "with" block.
+
+            * Example of a call:
+
+                with CommentBuffer(engine=ENGINE, flush_interval=10) as buffer:
+                    buffer.set_column_comment('audit', 'sales', sales='Updated: 2025-01-01 12:00.')
+
+            ***
+
+            :return: The report of the last "flush()".
+            :rtype: dict[str, int | float | list].
+        """
+
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._wakeup.set()
+            thread.join()
+            atexit.unregister(self.close)
+
+        return self.flush()
+
+    def stats(self) -> dict[str, int]:
+        """
+            *** A method for getting the statistics of the buffer. ***
+
+            The difference between the accepted ('enqueued') and written ('flushed') comments is the number of
+            writes merged in the buffer, not yet written ('pending') and not written because the entity or column
+            does not exist ('skipped').
+
+            :return: {'pending': 0, 'enqueued': 3600, 'flushed': 120, 'skipped': 0, 'flushes': 12, 'errors': 0}.
+            :rtype: dict[str, int].
+        """
+
+        with self._lock:
+            return {'pending': len(self._pending), **self._counters}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self) -> 'CommentBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __str__(self):
+        return (
+            f'{self.__class__.__name__}(max_size: {self.max_size}, flush_interval: {self.flush_interval}, '
+            f'pending: {len(self._pending)}).'
+        )
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}(max_size: {self.max_size}, flush_interval: {self.flush_interval}, '
+            f'pending: {len(self._pending)}).'
+        )
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,219 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library for working with comments of many entities (of any schemas) concurrently.
+
+    When the comments of thousands of tables are processed one after another, the total time is determined by
+    network delays to the database. "BulkCommenter" distributes the work between a limited pool of threads (by default,
+    according to the size of the "QueuePool" of the engine), each entity is processed by its own instance of
+    "Tcommenter".
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+
+# -------------------------------- Local modules
+from .base import BaseCommenter
+from .cache import MetadataCache
+from .metrics import QueryMetrics
+from .tcommenter import Tcommenter
+
+# SQLAlchemy (and "concurrent.futures", "typing") are imported on the first call, not when the library is imported:
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterable
+
+    from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class BulkCommenter:
+    """
+        "BulkCommenter" contains methods for extracting and saving comments on many entities (tables, views,
+        materialized views) of any schemas concurrently in a limited pool of threads (in the current version of the
+        library, only for PostgreSQL).
+    """
+
+    def __init__(
+            self,
+            engine: Engine,
+            max_workers: int | None = None,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None
+    ):
+        self.engine = Tcommenter._validator(engine, Tcommenter._get_engine_type())
+        self.cache = Tcommenter._validator(cache, MetadataCache, type(None))
+        self.metrics = Tcommenter._validator(metrics, QueryMetrics, type(None))
+
+        if max_workers is None:
+            self.max_workers = self._get_default_max_workers()
+
+        elif Tcommenter._validator(max_workers, int) > 0 and not isinstance(max_workers, bool):
+            self.max_workers = max_workers
+
+        else:
+            raise ValueError(f'Invalid value of the "max_workers" argument: "{max_workers}", a positive int expected.')
+
+    def _get_default_max_workers(self) -> int:
+        """
+            *** A private method for determining the number of threads by the size of the connection pool. ***
+
+            There is no point in having more threads than connections in the pool (the rest will wait for a free
+            connection), so for "QueuePool" (the default pool of the engine, including "AsyncAdaptedQueuePool") its
+            public size is used ("QueuePool.size()"), the overflow connections are not counted: to use them, pass
+            "max_workers" explicitly. For other pools ("NullPool", "StaticPool", ...), the default value of
+            "ThreadPoolExecutor" is used.
+
+            :return: The number of threads.
+            :rtype: int.
+        """
+
+        from sqlalchemy.pool import QueuePool
+
+        pool = self.engine.pool
+
+        if isinstance(pool, QueuePool) and pool.size() > 0:
+            return pool.size()
+
+        return min(32, (os.cpu_count() or 1) + 4)
+
+    def _run_jobs(self, function: Callable[..., object], jobs: list[tuple]) -> list[dict[str, object]]:
+        """
+            *** A private method for executing jobs in a pool of threads. ***
+
+            It is designed to execute the passed function for each job concurrently. The execution does not stop at
+            the first error: the exception is saved in the result of the corresponding job.
+
+            * Example of a call:
+
+                results = self._run_jobs(lambda schema, table: ..., [('audit', 'sales'), ('audit', 'dags')])
+
+            ***
+
+            :param function: The function of the job, accepts (schema, table, *args).
+            :param jobs: A list of tuples (schema, table, *args).
+            :return: The results in the order of the jobs: \\
+                [{'schema': 'audit', 'table': 'sales', 'result': ..., 'error': None}, ...].
+            :rtype: list[dict[str, object]].
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run_job(job: tuple) -> dict[str, object]:
+            schema = table = None
+
+            # An invalid job (for example, a short tuple) is reported in its result, as any other error:
+            try:
+                schema, table = job[0], job[1]
+
+                return {'schema': schema, 'table': table, 'result': function(*job), 'error': None}
+            except Exception as error:
+                return {'schema': schema, 'table': table, 'result': None, 'error': error}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(run_job, jobs))
+
+    def save_comments(
+            self,
+            jobs: Iterable[tuple[str, str, dict[str, str | dict]]],
+            atomic: bool = True,
+            only_changed: bool = False
+    ) -> list[dict[str, object]]:
+        """
+            *** A method for saving comments on many entities concurrently. ***
+
+            It is intended for saving comments on many entities (of any schemas) with "Tcommenter.save_comments()"
+            (for more information, see its description) in a limited pool of threads.
+
+            * Description of the mechanics:
+
+                The jobs are checked one by one, and the types of the entities of all valid jobs are resolved in
+                advance with one query ("BaseCommenter.get_types_entities()"), instead of one query per job (an
+                invalid job is reported in its result and does not affect the others). Then, for each job (schema,
+                entity name, "service structure" of comments), its own instance of "Tcommenter" is created and
+                "save_comments()" is called with the resolved type. The jobs are executed concurrently in a pool of
+                threads of size "self.max_workers". An error in one of the jobs does not stop the rest: the exception
+                is returned in the result of the job ('error' key), the report of "save_comments()" - in the 'result'
+                key.
+
+            ***
+
+            * Example of a call:
+
+                bulk_commenter = BulkCommenter(engine=ENGINE)
+
+                jobs = [('audit', 'sales', {'table': 'pass', 'columns': {'id': 'pass'}}), ...]
+
+                # -> [{'schema': 'audit', 'table': 'sales', 'result': {'statements': 2, ...}, 'error': None}, ...].
+                results = bulk_commenter.save_comments(jobs)
+                errors = [result for result in results if result['error']]
+
+            ***
+
+            :param jobs: Tuples (schema, entity name, comments in the format of "Tcommenter.save_comments()").
+            :param atomic: See "Tcommenter.save_comments()".
+            :param only_changed: See "Tcommenter.save_comments()".
+            :return: The results in the order of the jobs.
+            :rtype: list[dict[str, object]].
+        """
+
+        jobs = list(jobs)
+        base_commenter = BaseCommenter(self.engine, None, self.cache, self.metrics)
+        targets: list[tuple[str, str]] = []
+
+        for job in jobs:
+            # An invalid job is reported in its result (by "run_job()"), the types are resolved for the rest:
+            try:
+                targets.extend(base_commenter._validate_targets([job[:2]]))
+            except (TypeError, ValueError):
+                continue
+
+        types_dict = base_commenter.get_types_entities(targets) if targets else {}
+
+        def save_comments(schema: str, table: str, comments_dict: dict[str, str | dict]) -> dict:
+            commenter = Tcommenter(self.engine, table, schema, cache=self.cache, metrics=self.metrics)
+
+            return commenter.save_comments(
+                comments_dict, atomic=atomic, only_changed=only_changed, type_entity=types_dict.get((schema, table))
+            )
+
+        return self._run_jobs(save_comments, jobs)
+
+    def get_all_comments(self, targets: Iterable[tuple[str, str]]) -> list[dict[str, object]]:
+        """
+            *** A method for getting all comments of many entities concurrently. ***
+
+            It is intended for getting comments on many entities (of any schemas) with "Tcommenter.get_all_comments()"
+            (for more information, see its description) in a limited pool of threads. An error in one of the
+            entities does not stop the rest (see "save_comments()").
+
+            * Example of a call:
+
+                bulk_commenter = BulkCommenter(engine=ENGINE)
+
+                # -> [{'schema': 'audit', 'table': 'sales', 'result': {'table': 'pass', 'columns': {...}},
+                #      'error': None}, ...].
+                results = bulk_commenter.get_all_comments([('audit', 'sales'), ('audit', 'dags')])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :return: The results in the order of the entities.
+            :rtype: list[dict[str, object]].
+        """
+
+        def get_all_comments(schema: str, table: str) -> dict:
+            return Tcommenter(self.engine, table, schema, cache=self.cache, metrics=self.metrics).get_all_comments()
+
+        return self._run_jobs(get_all_comments, list(targets))
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(max_workers: {self.max_workers}, engine: {self.engine}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(max_workers: {self.max_workers}, engine: {self.engine}).'
+# ----------------------------------------------------------------------------------------------------------------------
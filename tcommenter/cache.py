@@ -0,0 +1,154 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library with an in-process cache of metadata (the results of reading comments and
+    types of entities). One instance of the cache can be shared by any number of instances of "Tcommenter"
+    (for example, created for each request in the API layer).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+# "threading" and "typing" are imported when they are needed, not when the library is imported:
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Hashable
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class MetadataCache:
+    """
+        "MetadataCache" is a thread-safe cache with a limited lifetime of records (TTL) and a limited size (LRU),
+        which is used by the library in front of the queries for reading metadata. Records are keyed by the engine
+        URL, schema and entity, any write of comments through the library invalidates the records of the entity.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl <= 0:
+            raise ValueError(f'Invalid value of the "ttl" argument: "{ttl}", a positive number is expected.')
+
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize <= 0:
+            raise ValueError(f'Invalid value of the "maxsize" argument: "{maxsize}", a positive int is expected.')
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._records: OrderedDict[tuple, tuple[float, object]] = OrderedDict()  # key: (expires_at, value)
+        import threading
+
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> tuple[bool, object]:
+        """
+            *** A method for getting a record from the cache. ***
+
+            Returns a pair (whether the record was found, value). The found record becomes the most recently
+            used one (LRU), the expired record is deleted and counted as a miss.
+
+            :param key: The key of the record: (engine URL, schema, entity, ...).
+            :return: (True, value) or (False, None).
+            :rtype: tuple[bool, object].
+        """
+
+        with self._lock:
+            record = self._records.get(key)
+
+            if record is not None and record[0] > time.monotonic():
+                self._records.move_to_end(key)
+                self.hits += 1
+                return True, record[1]
+
+            if record is not None:
+                del self._records[key]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: tuple[Hashable, ...], value: object) -> None:
+        """
+            *** A method for adding a record to the cache. ***
+
+            If the size limit is exceeded, the least recently used records are deleted (LRU).
+
+            :param key: The key of the record: (engine URL, schema, entity, ...).
+            :param value: The value to be cached.
+            :return: None.
+        """
+
+        with self._lock:
+            self._records[key] = (time.monotonic() + self.ttl, value)
+            self._records.move_to_end(key)
+
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+    def invalidate(self, *key_prefix: Hashable) -> int:
+        """
+            *** A method for deleting all records whose key starts with the passed values. ***
+
+            * Example of a call:
+
+                cache.invalidate(str(engine.url), 'audit', 'sales')  # One entity.
+                cache.invalidate(str(engine.url), 'audit')  # The whole schema.
+
+            ***
+
+            :param key_prefix: The beginning of the key: (engine URL, schema, entity).
+            :return: The number of deleted records.
+            :rtype: int.
+        """
+
+        size = len(key_prefix)
+
+        with self._lock:
+            keys = [key for key in self._records if key[:size] == key_prefix]
+
+            for key in keys:
+                del self._records[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+            *** A method for deleting all records of the cache (the hit and miss counters are reset). ***
+        """
+
+        with self._lock:
+            self._records.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+            *** A method for getting the statistics of the cache. ***
+
+            :return: {'hits': 10, 'misses': 2, 'size': 2, 'maxsize': 1024, 'ttl': 60.0}.
+            :rtype: dict[str, int | float].
+        """
+
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._records),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+            }
+
+    def __len__(self):
+        return len(self._records)
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(ttl: {self.ttl}, maxsize: {self.maxsize}, size: {len(self)}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(ttl: {self.ttl}, maxsize: {self.maxsize}, size: {len(self)}).'
+# ----------------------------------------------------------------------------------------------------------------------
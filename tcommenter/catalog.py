@@ -0,0 +1,284 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library with the catalog of one database schema: the entities of the schema
+    (tables, views, materialized views, foreign and partitioned tables) and their columns, loaded with one query.
+
+    Instances of "Tcommenter" bound to the schema use the catalog (the "catalog" argument) to determine the type of
+    the entity, to resolve the indexes of columns into names and to check the names of columns before writing
+    comments without additional queries to the database: a misspelled column name is reported before the
+    transaction is started, and not by the server in the middle of a batch.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from itertools import groupby
+from operator import itemgetter
+
+# -------------------------------- Local modules
+from .base import BaseCommenter
+from .metrics import QueryMetrics, instrumented
+from .sql.postgre_sql import SQL_GET_SCHEMA_CATALOG
+
+# SQLAlchemy (and "typing") are imported on the first query, not when the library is imported (see "__init__.py"):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# The types of entities by "pg_class.relkind" (the same as the result of "Tcommenter.get_type_entity()"):
+_RELKIND_TYPES = {
+    'r': 'table',
+    'v': 'view',
+    'm': 'mview',
+    'f': 'foreign_table',
+    'p': 'partitioned_table',
+}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class CatalogRelation:
+    """
+        "CatalogRelation" is a compact record of the catalog ("SchemaCatalog") about one entity of the schema:
+        OID, name, "relkind" and the names of the columns in the array by their numbers ("attnum", the dropped
+        columns are None).
+    """
+
+    __slots__ = ('oid', 'name', 'relkind', 'columns', '_numbers')
+
+    def __init__(self, oid: int, name: str, relkind: str, columns: tuple[str | None, ...]):
+        self.oid = oid
+        self.name = name
+        self.relkind = relkind
+        self.columns = columns
+
+        # The numbers of the columns by names are built on the first request:
+        self._numbers: dict[str, int] | None = None
+
+    @property
+    def type_entity(self) -> str | None:
+        """
+            :return: The type of the entity: 'table', 'view', 'mview', 'foreign_table', 'partitioned_table'.
+            :rtype: str | None.
+        """
+
+        return _RELKIND_TYPES.get(self.relkind)
+
+    def get_column_name(self, attnum: int) -> str | None:
+        """
+            :param attnum: The number (index) of the column, starting from 1.
+            :return: The name of the column or None (there is no column, or it has been dropped).
+            :rtype: str | None.
+        """
+
+        return self.columns[attnum - 1] if 0 < attnum <= len(self.columns) else None
+
+    def get_column_number(self, name_column: str) -> int | None:
+        """
+            :param name_column: The name of the column.
+            :return: The number (index) of the column or None (there is no column).
+            :rtype: int | None.
+        """
+
+        if self._numbers is None:
+            self._numbers = {name: attnum for attnum, name in enumerate(self.columns, 1) if name is not None}
+
+        return self._numbers.get(name_column)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(oid: {self.oid}, name: {self.name}, relkind: {self.relkind}).'
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class SchemaCatalog(BaseCommenter):
+    """
+        "SchemaCatalog" contains the entities of one schema (and their columns) loaded from the system catalog with
+        one query: name -> OID -> "relkind", (OID, column number) <-> column name (in the current version of the
+        library, only for PostgreSQL).
+    """
+
+    def __init__(
+            self,
+            engine: Engine,
+            schema: str,
+            metrics: QueryMetrics | None = None
+    ):
+        super().__init__(engine, self._validator(schema, str), metrics=metrics)
+
+        # Loaded on the first request (or by "refresh()"):
+        self._relations: dict[str, CatalogRelation] | None = None
+        self._relations_by_oid: dict[int, CatalogRelation] = {}
+
+    def _get_relations(self) -> dict[str, CatalogRelation]:
+        """
+            *** A private method for getting the records of the catalog (loaded on the first call). ***
+
+            :return: The records of the catalog by the names of the entities.
+            :rtype: dict[str, CatalogRelation].
+        """
+
+        if self._relations is None:
+            self.refresh()
+
+        return self._relations
+
+    @instrumented
+    def refresh(self) -> int:
+        """
+            *** A method for loading (reloading) the catalog of the schema. ***
+
+            * Description of the mechanics:
+
+                The entities of the schema and their columns are read with one query (the service tables
+                "pg_namespace", "pg_class", "pg_attribute"), each entity is stored in a compact record
+                ("CatalogRelation"). The catalog is loaded automatically on the first request; "refresh()" must be
+                called after the structure of the schema has been changed (for example, after the entity has been
+                recreated with new columns by "to_sql()").
+
+            ***
+
+            * Example of a call:
+
+                catalog = SchemaCatalog(engine=ENGINE, schema='audit')
+                number_relations = catalog.refresh()
+
+            ***
+
+            :return: The number of entities in the catalog.
+            :rtype: int.
+            :raises RuntimeError: If (SQLAlchemyError), see "self._reader()".
+        """
+
+        catalog_tuple_list = self._reader(SQL_GET_SCHEMA_CATALOG, schema=self.schema)
+
+        relations: dict[str, CatalogRelation] = {}
+        relations_by_oid: dict[int, CatalogRelation] = {}
+
+        for (oid, name_entity, relkind), rows in groupby(catalog_tuple_list, key=itemgetter(0, 1, 2)):
+            columns_numbers = {attnum: name_column for _, _, _, attnum, name_column in rows if attnum is not None}
+
+            # The array of names by numbers of columns (the dropped columns are None):
+            columns = tuple(columns_numbers.get(attnum) for attnum in range(1, max(columns_numbers, default=0) + 1))
+
+            relations[name_entity] = relations_by_oid[oid] = CatalogRelation(oid, name_entity, relkind, columns)
+
+        # The records are replaced at once (the readers see either the old or the new catalog):
+        self._relations, self._relations_by_oid = relations, relations_by_oid
+
+        return len(relations)
+
+    def get_relation(self, name_entity: str) -> CatalogRelation | None:
+        """
+            *** A method for getting the record of the entity by its name. ***
+
+            :param name_entity: The name of the entity.
+            :return: The record of the entity or None (there is no entity in the schema).
+            :rtype: CatalogRelation | None.
+        """
+
+        return self._get_relations().get(name_entity)
+
+    def get_relation_by_oid(self, oid: int) -> CatalogRelation | None:
+        """
+            *** A method for getting the record of the entity by its OID. ***
+
+            :param oid: The OID of the entity.
+            :return: The record of the entity or None (there is no entity in the schema).
+            :rtype: CatalogRelation | None.
+        """
+
+        self._get_relations()
+
+        return self._relations_by_oid.get(oid)
+
+    def get_oid(self, name_entity: str) -> int | None:
+        """
+            :param name_entity: The name of the entity.
+            :return: The OID of the entity or None.
+            :rtype: int | None.
+        """
+
+        relation = self.get_relation(name_entity)
+
+        return relation.oid if relation is not None else None
+
+    def get_type_entity(self, name_entity: str) -> str | None:
+        """
+            :param name_entity: The name of the entity.
+            :return: The type of the entity ('table', 'view', 'mview', 'foreign_table', 'partitioned_table') or None.
+            :rtype: str | None.
+        """
+
+        relation = self.get_relation(name_entity)
+
+        return relation.type_entity if relation is not None else None
+
+    def resolve_columns(self, name_entity: str, columns: Iterable[int | str]) -> list[str]:
+        """
+            *** A method for resolving the indexes (or checking the names) of the columns of the entity. ***
+
+            It is designed to check the columns before reading or writing comments without a query to the
+            database: the indexes ("attnum", starting from 1) are converted into names, the names are checked for
+            existence. If at least one column does not exist, an exception with all the unknown columns is thrown.
+
+            * Example of a call:
+
+                catalog = SchemaCatalog(engine=ENGINE, schema='audit')
+
+                # -> ['id', 'sales'].
+                names_columns = catalog.resolve_columns('sales', [1, 'sales'])
+
+            ***
+
+            :param name_entity: The name of the entity.
+            :param columns: The indexes or names of the columns.
+            :return: The names of the columns (in the order of the arguments).
+            :rtype: list[str].
+            :raises ValueError: If there is no entity in the catalog or there are no columns in the entity.
+        """
+
+        relation = self.get_relation(name_entity)
+
+        if relation is None:
+            raise ValueError(f'Error: The entity "{self.schema}"."{name_entity}" is not found in the catalog.')
+
+        names_columns: list[str] = []
+        unknown_columns: list[int | str] = []
+
+        for column in columns:
+            if isinstance(column, int) and not isinstance(column, bool):
+                name_column = relation.get_column_name(column)
+            else:
+                name_column = column if relation.get_column_number(column) is not None else None
+
+            if name_column is None:
+                unknown_columns.append(column)
+            else:
+                names_columns.append(name_column)
+
+        if unknown_columns:
+            raise ValueError(
+                f'Error: The columns {unknown_columns} do not exist in the entity "{self.schema}"."{name_entity}" '
+                f'(by the catalog of the schema, see "SchemaCatalog.refresh()").'
+            )
+
+        return names_columns
+
+    def __contains__(self, name_entity: str) -> bool:
+        return name_entity in self._get_relations()
+
+    def __len__(self) -> int:
+        return len(self._get_relations())
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(schema: {self.schema}, engine: {self.engine}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(schema: {self.schema}, engine: {self.engine}).'
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,359 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library for working with comments of all entities of the whole database (or of
+    the selected schemas) at once, for example, for backups of metadata (in the current version of the library,
+    only for PostgreSQL).
+
+    Unlike "SchemaCommenter", the data is not collected in memory: the comments are read page by page (keyset
+    pagination over "pg_class.oid") through a server-side cursor and written as JSON Lines, so the memory consumption
+    does not depend on the size of the catalog.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import time
+
+# -------------------------------- Local modules
+from .base import BaseCommenter
+from .metrics import QueryMetrics, instrumented
+from .sql.postgre_sql import *
+
+# SQLAlchemy (and "json", "typing") are imported on the first call, not when the library is imported:
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import IO, Iterator
+
+    from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class DatabaseCommenter(BaseCommenter):
+    """
+        "DatabaseCommenter" contains methods for exporting (and importing) comments on all entities (and their
+        columns) of the database or of the selected schemas (in the current version of the library, only for
+        PostgreSQL).
+    """
+
+    def __init__(
+            self,
+            engine: Engine,
+            schemas: list[str] | tuple[str, ...] | None = None,
+            page_size: int = 1000,
+            metrics: QueryMetrics | None = None
+    ):
+        super().__init__(engine, None, metrics=metrics)
+
+        # None - all schemas except the system ones:
+        self.schemas = None if schemas is None else self._stop_sql_injections_batch(
+            self._validator(schemas, list, tuple)
+        )
+
+        if self._validator(page_size, int) <= 0 or isinstance(page_size, bool):
+            raise ValueError(f'Invalid value of the "page_size" argument: "{page_size}", a positive int expected.')
+
+        self.page_size = page_size
+
+    def _get_cache_key_prefix(self) -> tuple[str, ...]:
+        """
+            *** A private method for getting the prefix of the cache keys of the instance. ***
+
+            The instance works with the whole database: writing comments invalidates all the records of the engine.
+
+            :return: (engine URL,).
+            :rtype: tuple[str, ...].
+        """
+
+        return (str(self.engine.url),)
+
+    def _prepare_import_chunk(self, records: list[dict]) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for preparing the restoration of one chunk of records in one round trip. ***
+
+            The records are prepared by "self._prepare_restore_comments()" (the types of entities are resolved by
+            the server inside the "DO" block, one query for the whole chunk). With drivers binding parameters on the
+            client side ("psycopg2"), both queries are sent as one statement (one round trip to the database).
+
+            :param records: A list of records (see "self._prepare_restore_comments()").
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+        """
+
+        return self._merge_statements(self._prepare_restore_comments(records))
+
+    @staticmethod
+    def _read_progress(progress_file: str | os.PathLike | None) -> int:
+        """
+            *** A private method for reading the number of lines already imported (see "import_comments()"). ***
+
+            :param progress_file: The path to the file of progress or None.
+            :return: The number of lines of the source committed by the previous (interrupted) import.
+            :rtype: int.
+        """
+
+        import json
+
+        if progress_file is None or not os.path.exists(progress_file):
+            return 0
+
+        with open(progress_file, encoding='utf-8') as file:
+            return int(json.load(file)['lines'])
+
+    @staticmethod
+    def _write_progress(progress_file: str | os.PathLike | None, lines: int, chunks: int) -> None:
+        """
+            *** A private method for saving the progress of the import after the commit of a chunk. ***
+
+            The file is replaced atomically ("os.replace()"), so an interruption never leaves it half-written.
+
+            :param progress_file: The path to the file of progress or None (nothing is saved).
+            :param lines: The number of lines of the source committed so far.
+            :param chunks: The number of chunks committed so far.
+            :return: None.
+        """
+
+        import json
+
+        if progress_file is None:
+            return
+
+        temporary_file = f'{os.fspath(progress_file)}.tmp'
+
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump({'lines': lines, 'chunks': chunks}, file)
+
+        os.replace(temporary_file, progress_file)
+
+    def iter_comments(self) -> Iterator[dict[str, str | dict]]:
+        """
+            *** A method for iterating over the comments of all entities of the database (or the selected schemas). ***
+
+            It is intended for reading the comments of any number of entities with a constant memory consumption
+            (in the current version of the library, only for PostgreSQL).
+
+            * Description of the mechanics:
+
+                The entities with comments are read in pages of "self.page_size" entities ordered by "pg_class.oid"
+                (keyset pagination: the next page starts after the last oid of the previous one, without OFFSET).
+                The rows of each page are received through a server-side cursor ("stream_results", "yield_per"),
+                the rows of one entity are collected into one record, which is returned as soon as the entity is
+                read. All pages are read on one connection in one transaction (or in the open session).
+                The records have the format of the server-side restoration of comments (see
+                "self._prepare_restore_comments()"): the "table_comment" key is present only if the entity itself
+                has a comment.
+
+            ***
+
+            * Example of a call:
+
+                database_commenter = DatabaseCommenter(engine=ENGINE, schemas=['audit'])
+
+                # -> {'schema': 'audit', 'table': 'sales', 'table_comment': 'comment', 'columns': {'id': 'comment'}}.
+                for record in database_commenter.iter_comments():
+                    ...
+
+            ***
+
+            :return: The iterator of records of entities.
+            :rtype: Iterator[dict[str, str | dict]].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        from sqlalchemy.exc import SQLAlchemyError
+
+        sql = self._get_text_clause(SQL_GET_COMMENTS_PAGE).execution_options(
+            stream_results=True, yield_per=self.page_size
+        )
+        last_oid = 0
+
+        try:
+
+            with self._connection_scope() as conn:
+
+                while True:
+                    result = conn.execute(
+                        sql, {'last_oid': last_oid, 'schemas': self.schemas, 'page_size': self.page_size}
+                    )
+                    self._count_metrics(statements=1)
+
+                    record, rows = None, 0
+
+                    for oid, name_schema, name_entity, column_name, description in result:
+                        rows += 1
+
+                        if oid != last_oid:
+
+                            if record is not None:
+                                yield record
+
+                            last_oid = oid
+                            record = {'schema': name_schema, 'table': name_entity, 'columns': {}}
+
+                        if column_name is None:
+                            record['table_comment'] = description
+                        else:
+                            record['columns'][column_name] = description
+
+                    self._count_metrics(rows=rows)
+
+                    # The last page (empty):
+                    if record is None:
+                        break
+
+                    yield record
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    @instrumented
+    def export_comments(self, file: str | os.PathLike | IO[str]) -> dict[str, int | float]:
+        """
+            *** A method for exporting the comments of all entities of the database to a JSON Lines file. ***
+
+            It is intended for backups of metadata of any size with a constant memory consumption (in the current
+            version of the library, only for PostgreSQL): each line of the file is one entity with its comments
+            (the records of "self.iter_comments()", for more information, see its description).
+
+            * Example of a call:
+
+                database_commenter = DatabaseCommenter(engine=ENGINE)
+
+                # -> {'relations': 200000, 'comments': 3500000, 'elapsed': 95.1}.
+                report = database_commenter.export_comments('comments.jsonl')
+
+                with gzip.open('comments.jsonl.gz', 'wt', encoding='utf-8') as file:
+                    database_commenter.export_comments(file)
+
+            ***
+
+            :param file: The path to the file (overwritten) or a text file-like object.
+            :return: Report of the type {'relations': 2, 'comments': 5, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError).
+        """
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'w', encoding='utf-8') as opened_file:
+                return self.export_comments(opened_file)
+
+        import json
+
+        start_time = time.perf_counter()
+        relations = comments = 0
+
+        for record in self.iter_comments():
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            relations += 1
+            comments += len(record['columns']) + int('table_comment' in record)
+
+        return {'relations': relations, 'comments': comments, 'elapsed': time.perf_counter() - start_time}
+
+    @instrumented
+    def import_comments(
+            self,
+            file: str | os.PathLike | IO[str],
+            chunk_size: int = 500,
+            progress_file: str | os.PathLike | None = None
+    ) -> dict[str, int | float]:
+        """
+            *** A method for importing comments of entities from a JSON Lines file in chunks. ***
+
+            It is the counterpart of "export_comments()": the file is read lazily (line by line), the records are
+            applied in chunks of "chunk_size" records, each chunk is one transaction and one round trip to the
+            database (in the current version of the library, only for PostgreSQL).
+
+            * Description of the mechanics:
+
+                Each line is a record of the type {'schema': ..., 'table': ..., 'table_comment': ..., 'columns': {...}}
+                (empty lines are skipped). The chunk is written by the server-side restoration of comments (see
+                "self._prepare_restore_comments()"): the type of each entity (table, view, materialized view, foreign
+                or partitioned table) is resolved by the server for the whole chunk at once, as in "save_comments()",
+                but without a separate query per entity. Entities and columns that do not exist are skipped, a
+                missing "table_comment" key leaves the comment on the entity unchanged.
+                If "progress_file" is passed, after the commit of each chunk the number of imported lines is saved
+                to it; the next call with the same file continues from the last committed chunk. After a successful
+                import, the file of progress is deleted. The import with progress is not allowed inside
+                "self.session()" (the chunks would be committed only together with the session).
+
+            ***
+
+            * Example of a call:
+
+                database_commenter = DatabaseCommenter(engine=ENGINE)
+
+                # -> {'relations': 200000, 'chunks': 400, 'resumed_lines': 0, 'elapsed': 120.3}.
+                report = database_commenter.import_comments(
+                    'comments.jsonl', chunk_size=500, progress_file='comments.progress'
+                )
+
+            ***
+
+            :param file: The path to the file or a text file-like object.
+            :param chunk_size: The number of records in one chunk (one transaction), by default 500.
+            :param progress_file: Optional, the path to the file of progress for resuming an interrupted import.
+            :return: Report of the type {'relations': 2, 'chunks': 1, 'resumed_lines': 0, 'elapsed': 0.0042}.
+            :rtype: dict[str, int | float].
+            :raises ValueError: If a line of the file is not a record of an entity or the progress is used inside \
+                the session, other exceptions are possible in nested utility methods (see their description).
+        """
+
+        if self._validator(chunk_size, int) <= 0 or isinstance(chunk_size, bool):
+            raise ValueError(f'Invalid value of the "chunk_size" argument: "{chunk_size}", a positive int expected.')
+
+        if progress_file is not None and self._connection is not None:
+            raise ValueError('The import with "progress_file" cannot be resumed inside the session.')
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, encoding='utf-8') as opened_file:
+                return self.import_comments(opened_file, chunk_size, progress_file)
+
+        import json
+
+        start_time = time.perf_counter()
+        resumed_lines = self._read_progress(progress_file)
+        lines = relations = chunks = 0
+        chunk: list[dict] = []
+
+        for line in file:
+            lines += 1
+
+            # Already committed by the interrupted import:
+            if lines <= resumed_lines or not line.strip():
+                continue
+
+            record = json.loads(line)
+
+            if not isinstance(record, dict) or not {'schema', 'table'} <= set(record):
+                raise ValueError(f'Line {lines}: a record of the type {{"schema": ..., "table": ...}} expected.')
+
+            chunk.append(record)
+
+            if len(chunk) == chunk_size:
+                self._batch_recorder(self._prepare_import_chunk(chunk))
+                relations, chunks, chunk = relations + len(chunk), chunks + 1, []
+                self._write_progress(progress_file, lines, chunks)
+
+        if chunk:
+            self._batch_recorder(self._prepare_import_chunk(chunk))
+            relations, chunks = relations + len(chunk), chunks + 1
+
+        if progress_file is not None and os.path.exists(progress_file):
+            os.remove(progress_file)
+
+        return {
+            'relations': relations,
+            'chunks': chunks,
+            'resumed_lines': resumed_lines,
+            'elapsed': time.perf_counter() - start_time
+        }
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(schemas: {self.schemas}, engine: {self.engine}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(schemas: {self.schemas}, engine: {self.engine}).'
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,177 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library with the instrumentation of queries: for each public method, the number of
+    calls and errors, SQL statements, rows returned, connection checkouts, the total and maximum latency are
+    accumulated. One instance of the metrics can be shared by any number of instances of the library classes, the
+    measurements of each call can be forwarded to external systems (Prometheus, StatsD, ...) via callbacks.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import functools
+from contextvars import ContextVar
+
+# "threading" and "typing" are imported when they are needed, not when the library is imported:
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+_CO_COROUTINE = 0x0080  # "inspect.CO_COROUTINE" (without importing "inspect").
+
+# The counters of the current call of the public method (None - there is no instrumented call):
+_CURRENT_CALL: ContextVar[dict[str, int] | None] = ContextVar('tcommenter_current_call', default=None)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class QueryMetrics:
+    """
+        "QueryMetrics" is a thread-safe accumulator of measurements of the public methods of the library (statements,
+        rows, connection checkouts, latency) with the registration of callbacks for forwarding measurements.
+    """
+
+    def __init__(self):
+        self._methods: dict[str, dict[str, int | float]] = {}
+        self._callbacks: list[Callable[[str, dict[str, int | float | bool]], None]] = []
+        import threading
+
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[str, dict[str, int | float | bool]], None]) -> None:
+        """
+            *** A method for registering a callback called after each call of the public method. ***
+
+            The callback receives the name of the method (with the class: 'Tcommenter.save_comments') and the
+            measurements of the call: {'statements': 2, 'rows': 0, 'checkouts': 1, 'elapsed': 0.0042, 'error': False}.
+            Exceptions in the callback do not change the result of the method: they are logged (the "tcommenter.metrics"
+            logger) and suppressed, the other callbacks are still called.
+
+            * Example of a call:
+
+                metrics.add_callback(lambda method, sample: histogram.labels(method).observe(sample['elapsed']))
+
+            ***
+
+            :param callback: The function (method name, measurements of the call).
+            :return: None.
+            :raises TypeError: If the callback is not callable.
+        """
+
+        if not callable(callback):
+            raise TypeError(f'Invalid callback: "{callback}", a callable object is expected.')
+
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[str, dict[str, int | float | bool]], None]) -> None:
+        """
+            *** A method for deleting the registered callback. ***
+
+            :param callback: The previously registered function.
+            :return: None.
+            :raises ValueError: If the callback is not registered.
+        """
+
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def record(self, method: str, sample: dict[str, int], elapsed: float, error: bool) -> None:
+        """
+            *** A method for accumulating the measurements of one call of the public method. ***
+
+            It is called by the library after each instrumented call.
+
+            :param method: The name of the method (with the class: 'Tcommenter.save_comments').
+            :param sample: The counters of the call: {'statements': 2, 'rows': 0, 'checkouts': 1}.
+            :param elapsed: The latency of the call (in seconds).
+            :param error: The call ended with an exception.
+            :return: None.
+        """
+
+        with self._lock:
+            stats = self._methods.setdefault(method, {
+                'calls': 0, 'errors': 0, 'statements': 0, 'rows': 0, 'checkouts': 0, 'total_time': 0.0, 'max_time': 0.0
+            })
+            stats['calls'] += 1
+            stats['errors'] += int(error)
+            stats['statements'] += sample['statements']
+            stats['rows'] += sample['rows']
+            stats['checkouts'] += sample['checkouts']
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(method, {**sample, 'elapsed': elapsed, 'error': error})
+
+            # A metrics sink (Prometheus, StatsD, ...) must not change the outcome of the measured call:
+            except Exception:
+                import logging
+
+                logging.getLogger(__name__).exception(
+                    'Error in the metrics callback "%r" (method: %s).', callback, method
+                )
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """
+            *** A method for getting the accumulated measurements by methods. ***
+
+            * Example of a call:
+
+                # -> {'Tcommenter.save_comments': {'calls': 1, 'errors': 0, 'statements': 3, 'rows': 1,
+                #                                  'checkouts': 2, 'total_time': 0.0061, 'max_time': 0.0061}, ...}.
+                metrics.stats()
+
+            ***
+
+            :return: A copy of the counters by the names of the methods (with the classes).
+            :rtype: dict[str, dict[str, int | float]].
+        """
+
+        with self._lock:
+            return {method: dict(stats) for method, stats in self._methods.items()}
+
+    def reset(self) -> None:
+        """
+            *** A method for resetting the accumulated measurements (the callbacks are preserved). ***
+        """
+
+        with self._lock:
+            self._methods.clear()
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(methods: {len(self._methods)}, callbacks: {len(self._callbacks)}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(methods: {len(self._methods)}, callbacks: {len(self._callbacks)}).'
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def instrumented(method: Callable) -> Callable:
+    """
+        *** A decorator of the public methods of the library classes for collecting metrics. ***
+
+        The call is measured by "self._instrument()" (if the instance has no metrics, the overhead is one check).
+        Supports both regular and asynchronous methods.
+    """
+
+    if method.__code__.co_flags & _CO_COROUTINE:
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            with self._instrument(method.__name__):
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._instrument(method.__name__):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,170 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    The module of the "Tcommenter" library for working with comments of all entities (tables, views, materialized
+    views, ...) of one database schema at once (in the current version of the library, only for PostgreSQL).
+
+    Unlike "Tcommenter", which is bound to one entity, "SchemaCommenter" is bound only to the schema, which allows
+    you to get (and save) the metadata of thousands of entities with a single query instead of creating a separate
+    instance of "Tcommenter" for each of them.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+# -------------------------------- Local modules
+from .base import BaseCommenter
+from .cache import MetadataCache
+from .metrics import QueryMetrics, instrumented
+from .sql.postgre_sql import *
+
+# SQLAlchemy is imported on the first query, not when the library is imported (see "__init__.py"):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+class SchemaCommenter(BaseCommenter):
+    """
+        "SchemaCommenter" contains methods for extracting and overloading comments on all entities (and their
+        columns) of one schema in the database (in the current version of the library, only for PostgreSQL).
+    """
+
+    def __init__(
+            self,
+            engine: Engine,
+            schema: str,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None
+    ):
+        super().__init__(engine, schema, cache, metrics)
+
+    @instrumented
+    def get_all_comments(self) -> dict[str, dict[str, str | dict]]:
+        """
+            *** A method for getting all comments for all entities of the schema (to them and their columns). ***
+
+            It is intended to receive all available comments for all entities of the schema (tables | views |
+            materialized views | foreign and partitioned tables), their own and their columns, with a single query
+            to the database (in the current version of the library, only for PostgreSQL).
+
+            * Description of the mechanics:
+
+                This method uses the nested service "self._reader()" with a single SQL query that joins the
+                PostgreSQL service tables "pg_namespace", "pg_class", "pg_attribute" and "pg_description".
+                Each row of the result is a comment on an entity (the column name is None) or on its column.
+                The result is converted into a dictionary, where the key is the name of the entity, and the value is
+                a dictionary in the format of the "Tcommenter.get_all_comments()" method (compatible with
+                "Tcommenter.save_comments()"). Entities without comments are not included in the result.
+
+            ***
+
+            * Example of a call:
+
+                schema_commenter = SchemaCommenter(engine=ENGINE, schema='audit')
+
+                # -> {'sales': {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}, ...}.
+                all_comments_schema_dict = schema_commenter.get_all_comments()
+
+            ***
+
+            :return: {'table_name': {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}}.
+            :rtype: dict[str, dict[str, str | dict]].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        # Getting all the comments of the schema in one query (list of tuples):
+        schema_comments_tuple_list: list[tuple] = self._reader(SQL_GET_SCHEMA_COMMENTS, schema=self.schema)
+
+        all_comments_schema_dict: dict[str, dict[str, str | dict]] = {}
+
+        for name_entity, column_name, description in schema_comments_tuple_list:
+
+            # If there is no comment on the entity itself, we leave an empty string (as in "Tcommenter"):
+            entity_comments_dict = all_comments_schema_dict.setdefault(name_entity, {'table': '', 'columns': {}})
+
+            if column_name is None:
+                entity_comments_dict['table'] = description
+            else:
+                entity_comments_dict['columns'][column_name] = description
+
+        return all_comments_schema_dict
+
+    @instrumented
+    def save_all_comments(self, all_comments_schema_dict: dict[str, dict[str, str | dict]]) -> dict[str, int | float]:
+        """
+            *** A method for saving comments on many entities of the schema (to them and their columns) at once. ***
+
+            It is the write-side counterpart of the "get_all_comments()" method: it accepts a snapshot of the comments
+            of the schema and applies it to all entities with a single transfer of data to the database (in the
+            current version of the library, only for PostgreSQL). It is used to restore the metadata after the
+            entities have been recreated (for example, "pandas.DataFrame.to_sql(if_exists='replace')").
+
+            * Description of the mechanics:
+
+                The snapshot is converted into a list of records, which is passed to the server in one JSON parameter
+                (for more information, see the description of "self._prepare_restore_comments()"). "COMMENT ON ..."
+                queries are generated and executed by the server itself, the type of each entity (table, view,
+                materialized view, ...) is determined there too. Everything is done on one connection in one
+                transaction. Entities and columns that do not exist in the database are skipped.
+
+            ***
+
+            * Example of a call:
+
+                schema_commenter = SchemaCommenter(engine=ENGINE, schema='audit')
+                all_comments_schema_dict = schema_commenter.get_all_comments()
+
+                # ... recreating tables ...
+
+                # -> {'statements': 2, 'elapsed': 0.0042}.
+                report = schema_commenter.save_all_comments(all_comments_schema_dict)
+
+            ***
+
+            :param all_comments_schema_dict: Type dictionary: \
+                {'table_name': {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}, ...}.
+            :return: Report of the type {'statements': 2, 'elapsed': 0.0042} (queries sent from the client).
+            :rtype: dict[str, int | float].
+            :raises ValueError: If the passed dictionary is empty or does not match the structure, other exceptions \
+                are possible in nested utility methods (see their description for details).
+        """
+
+        if not self._validator(all_comments_schema_dict, dict):
+            raise ValueError(
+                f'Error: there is no data to process! '
+                f'The passed argument "all_comments_schema_dict" does not contain information: '
+                f'"{all_comments_schema_dict}".'
+            )
+
+        records: list[dict] = []
+
+        for name_entity, comments_dict in all_comments_schema_dict.items():
+
+            # Allowed keys of the "service structure" (see "Tcommenter.save_comments()"):
+            if not self._validator(comments_dict, dict) or not set(comments_dict) <= {'table', 'columns'}:
+                structure = "{'table_name': {'table': 'table_comment', 'columns': {...}}}"
+                raise ValueError(
+                    f'Error: The passed "all_comments_schema_dict" argument does not match the required input data '
+                    f'service structure! The normal "service structure" looks like this: {structure}. '
+                    f'Received for "{name_entity}": {comments_dict}'
+                )
+
+            record = {'schema': self.schema, 'table': name_entity, 'columns': comments_dict.get('columns', {})}
+
+            if 'table' in comments_dict:
+                record['table_comment'] = comments_dict['table']
+
+            records.append(record)
+
+        return self._batch_recorder(self._merge_statements(self._prepare_restore_comments(records)))
+
+    def __str__(self):
+        return f'{self.__class__.__name__}(schema: {self.schema}, engine: {self.engine}).'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(schema: {self.schema}, engine: {self.engine}).'
+# ----------------------------------------------------------------------------------------------------------------------
@@ -3,111 +3,1042 @@
     same name.
 """
 
-SQL_SAVE_COMMENT = """COMMENT ON {entity_type} "{schema}"."{name_entity}" IS :comment"""
+# The identifiers are substituted already quoted by the dialect ("BaseCommenter._quote_identifier()"):
+SQL_SAVE_COMMENT = """COMMENT ON {entity_type} {schema}.{name_entity} IS :comment"""
 
-SQL_SAVE_COMMENT_COLUMN = """COMMENT ON {entity_type} "{schema}"."{name_entity}"."{name_column}" IS :comment"""
+SQL_SAVE_COMMENT_COLUMN = """COMMENT ON {entity_type} {schema}.{name_entity}.{name_column} IS :comment"""
 
 SQL_GET_TABLE_COMMENTS = """
     SELECT
         comments.description AS description
     FROM
-        pg_class AS all_entity
-    INNER JOIN
         pg_description AS comments
-    ON 
-        all_entity.oid = comments.objoid 
-    AND 
-        comments.objsubid = 0 
-    AND 
-        all_entity.relname = :name_entity
+    WHERE
+        comments.objoid = CAST(to_regclass(:relation) AS oid)
+    AND
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid = 0
 """
 
 SQL_GET_ALL_COLUMN_COMMENTS = """
     SELECT
-        cols.attname AS column_name, 
+        cols.attname AS column_name,
         comments.description AS description
     FROM
-        pg_class AS all_entity
+        pg_description AS comments
     INNER JOIN
+        pg_attribute AS cols
+    ON
+        cols.attrelid = comments.objoid
+    AND
+        cols.attnum = comments.objsubid
+    WHERE
+        comments.objoid = CAST(to_regclass(:relation) AS oid)
+    AND
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid > 0
+    ORDER BY
+        comments.objsubid
+"""
+
+SQL_GET_ALL_COMMENTS = """
+    SELECT
+        cols.attname AS column_name,
+        comments.description AS description
+    FROM
         pg_description AS comments
-    ON 
-        all_entity.oid = comments.objoid 
-    AND 
-        comments.objsubid > 0 
-    AND 
-        all_entity.relname = :name_entity
-    INNER JOIN 
-        pg_attribute AS cols                    
+    LEFT JOIN
+        pg_attribute AS cols
     ON
-        cols.attnum = comments.objsubid 
+        cols.attrelid = comments.objoid
+    AND
+        cols.attnum = comments.objsubid
+    WHERE
+        comments.objoid = CAST(to_regclass(:relation) AS oid)
     AND
-        cols.attrelid = all_entity.oid      
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid >= 0
+    ORDER BY
+        comments.objsubid
 """
 
 SQL_GET_COLUMN_COMMENTS_BY_INDEX = """
-    SELECT 
-        cols.attname AS column_name,       
-        comments.description AS description         
-    FROM 
+    SELECT
+        cols.attname AS column_name,
+        comments.description AS description
+    FROM
+        pg_description AS comments
+    INNER JOIN
+        pg_attribute AS cols
+    ON
+        cols.attrelid = comments.objoid
+    AND
+        cols.attnum = comments.objsubid
+    WHERE
+        comments.objoid = CAST(to_regclass(:relation) AS oid)
+    AND
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid = ANY(:columns)
+    ORDER BY
+        comments.objsubid
+"""
+
+SQL_GET_COLUMN_COMMENTS_BY_NAME = """
+    SELECT
+        cols.attname AS column_name,
+        comments.description AS description
+    FROM
+        pg_attribute AS cols
+    INNER JOIN
+        pg_description AS comments
+    ON
+        comments.objoid = cols.attrelid
+    AND
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid = cols.attnum
+    WHERE
+        cols.attrelid = CAST(to_regclass(:relation) AS oid)
+    AND
+        cols.attname = ANY(:columns)
+    AND
+        cols.attnum > 0
+    ORDER BY
+        cols.attnum
+"""
+
+SQL_CHECK_TYPE_ENTITY = """
+    SELECT
+        case all_entity.relkind
+            when 'r' then 'table'
+            when 'v' then 'view'
+            when 'm' then 'mview'
+            when 'i' then 'index'
+            when 'S' then 'sequence'
+            when 't' then 'toast'
+            when 'c' then 'composite_type'
+            when 'f' then 'foreign_table'
+            when 'p' then 'partitioned_table'
+            when 'I' then 'partitioned_index'
+        end as type_entity
+    FROM
+    pg_class as all_entity
+    WHERE
+    all_entity.oid = CAST(to_regclass(:relation) AS oid)
+"""
+
+SQL_GET_TYPES_ENTITIES = """
+    SELECT
+        schemas.nspname,
+        all_entity.relname,
+        case all_entity.relkind
+            when 'r' then 'table'
+            when 'v' then 'view'
+            when 'm' then 'mview'
+            when 'i' then 'index'
+            when 'S' then 'sequence'
+            when 't' then 'toast'
+            when 'c' then 'composite_type'
+            when 'f' then 'foreign_table'
+            when 'p' then 'partitioned_table'
+            when 'I' then 'partitioned_index'
+        end as type_entity
+    FROM
+        pg_class AS all_entity
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = all_entity.relnamespace
+    WHERE
+        all_entity.oid = ANY(
+            ARRAY(SELECT to_regclass(relations.relation) FROM unnest(CAST(:relations AS text[])) AS relations(relation))
+        )
+"""
+
+# The columns of many entities with one query (an entity without columns - one row with NULL):
+SQL_GET_ENTITIES_COLUMNS = """
+    SELECT
+        schemas.nspname,
+        all_entity.relname,
+        cols.attname
+    FROM
         pg_class AS all_entity
-    INNER JOIN 
-        pg_description AS comments              
-    ON 
-        all_entity.oid = comments.objoid
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = all_entity.relnamespace
+    LEFT JOIN
+        pg_attribute AS cols
+    ON
+        cols.attrelid = all_entity.oid
     AND
-        comments.objsubid > 0
+        cols.attnum > 0
     AND
-        all_entity.relname = :name_entity
-    INNER JOIN 
-        pg_attribute AS cols                  
+        NOT cols.attisdropped
+    WHERE
+        all_entity.oid = ANY(
+            ARRAY(SELECT to_regclass(relations.relation) FROM unnest(CAST(:relations AS text[])) AS relations(relation))
+        )
+    AND
+        all_entity.relkind IN ('r', 'v', 'm', 'f', 'p')
+"""
+
+SQL_GET_PARTITIONS = """
+    WITH RECURSIVE partitions AS (
+        SELECT
+            inherits.inhrelid AS oid,
+            1 AS level
+        FROM
+            pg_inherits AS inherits
+        WHERE
+            inherits.inhparent = CAST(to_regclass(:relation) AS oid)
+        UNION ALL
+        SELECT
+            inherits.inhrelid,
+            partitions.level + 1
+        FROM
+            pg_inherits AS inherits
+        INNER JOIN
+            partitions
+        ON
+            inherits.inhparent = partitions.oid
+    )
+    SELECT
+        schemas.nspname,
+        all_entity.relname
+    FROM
+        partitions
+    INNER JOIN
+        pg_class AS all_entity
     ON
-        cols.attnum = comments.objsubid 
+        all_entity.oid = partitions.oid
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = all_entity.relnamespace
+    WHERE
+        all_entity.relispartition
     AND
-        cols.attrelid = all_entity.oid      
-    WHERE 
-         comments.objsubid = ANY(:columns)
+        all_entity.relkind IN ('r', 'p', 'f')
+    ORDER BY
+        partitions.level,
+        schemas.nspname,
+        all_entity.relname
 """
 
-SQL_GET_COLUMN_COMMENTS_BY_NAME = """
-    SELECT 
-        cols.attname AS column_name, 
-        comments.description AS description    
-    FROM 
+SQL_GET_SCHEMA_CATALOG = """
+    SELECT
+        all_entity.oid,
+        all_entity.relname,
+        all_entity.relkind,
+        cols.attnum,
+        cols.attname
+    FROM
         pg_class AS all_entity
-    INNER JOIN 
-        pg_description AS comments             
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = all_entity.relnamespace
+    LEFT JOIN
+        pg_attribute AS cols
     ON
-        all_entity.oid = comments.objoid 
-    AND 
-        comments.objsubid > 0              
+        cols.attrelid = all_entity.oid
+    AND
+        cols.attnum > 0
+    AND
+        NOT cols.attisdropped
+    WHERE
+        schemas.nspname = :schema
+    AND
+        all_entity.relkind IN ('r', 'v', 'm', 'f', 'p')
+    ORDER BY
+        all_entity.oid,
+        cols.attnum
+"""
+
+SQL_GET_SCHEMA_COMMENTS = """
+    SELECT
+        all_entity.relname AS name_entity,
+        cols.attname AS column_name,
+        comments.description AS description
+    FROM
+        pg_namespace AS schemas
+    INNER JOIN
+        pg_class AS all_entity
+    ON
+        all_entity.relnamespace = schemas.oid
+    AND
+        schemas.nspname = :schema
+    AND
+        all_entity.relkind IN ('r', 'v', 'm', 'f', 'p')
+    INNER JOIN
+        pg_description AS comments
+    ON
+        comments.objoid = all_entity.oid
+    AND
+        comments.classoid = 'pg_class'::regclass
+    AND
+        comments.objsubid >= 0
+    LEFT JOIN
+        pg_attribute AS cols
+    ON
+        cols.attrelid = all_entity.oid
     AND
-        all_entity.relname = :name_entity 
-    INNER JOIN 
-        pg_attribute AS cols                    
+        cols.attnum = comments.objsubid
+    ORDER BY
+        all_entity.relname,
+        comments.objsubid
+"""
+
+SQL_GET_COMMENTS_PAGE = """
+    WITH page AS (
+        SELECT
+            all_entity.oid
+        FROM
+            pg_class AS all_entity
+        INNER JOIN
+            pg_namespace AS schemas
+        ON
+            schemas.oid = all_entity.relnamespace
+        WHERE
+            all_entity.oid > CAST(:last_oid AS oid)
+        AND
+            all_entity.relkind IN ('r', 'v', 'm', 'f', 'p')
+        AND
+            (
+                CAST(:schemas AS text[]) IS NULL
+                AND
+                schemas.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+                OR
+                schemas.nspname = ANY(CAST(:schemas AS text[]))
+            )
+        AND
+            EXISTS (
+                SELECT
+                    1
+                FROM
+                    pg_description AS comments
+                WHERE
+                    comments.objoid = all_entity.oid
+                AND
+                    comments.classoid = 'pg_class'::regclass
+            )
+        ORDER BY
+            all_entity.oid
+        LIMIT
+            :page_size
+    )
+    SELECT
+        CAST(all_entity.oid AS bigint) AS oid,
+        schemas.nspname AS name_schema,
+        all_entity.relname AS name_entity,
+        cols.attname AS column_name,
+        comments.description AS description
+    FROM
+        page
+    INNER JOIN
+        pg_class AS all_entity
     ON
-        cols.attnum = comments.objsubid 
+        all_entity.oid = page.oid
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = all_entity.relnamespace
+    INNER JOIN
+        pg_description AS comments
+    ON
+        comments.objoid = all_entity.oid
+    AND
+        comments.classoid = 'pg_class'::regclass
     AND
+        comments.objsubid >= 0
+    LEFT JOIN
+        pg_attribute AS cols
+    ON
         cols.attrelid = all_entity.oid
+    AND
+        cols.attnum = comments.objsubid
+    ORDER BY
+        all_entity.oid,
+        comments.objsubid
+"""
+
+SQL_SET_COMMENTS_PAYLOAD = """SELECT set_config('tcommenter.payload', :payload, true)"""
+
+SQL_RESTORE_COMMENTS = """
+    DO $tcommenter$
+    DECLARE
+        record_entity jsonb;
+        record_column record;
+        entity_oid oid;
+        entity_kind "char";
+        entity_type text;
+        missing_columns text;
+    BEGIN
+        FOR record_entity IN
+            SELECT jsonb_array_elements(current_setting('tcommenter.payload')::jsonb)
+        LOOP
+            entity_oid := NULL;
+
+            SELECT
+                all_entity.oid, all_entity.relkind
+            INTO
+                entity_oid, entity_kind
+            FROM
+                pg_class AS all_entity
+            INNER JOIN
+                pg_namespace AS schemas
+            ON
+                schemas.oid = all_entity.relnamespace
+            WHERE
+                schemas.nspname = record_entity ->> 'schema'
+            AND
+                all_entity.relname = record_entity ->> 'table'
+            AND
+                all_entity.relkind IN ('r', 'v', 'm', 'f', 'p');
+
+            -- The entity does not exist (for example, it has not been recreated yet):
+            IF entity_oid IS NULL THEN
+                IF COALESCE((record_entity ->> 'strict')::boolean, false) THEN
+                    RAISE EXCEPTION 'relation "%"."%" does not exist',
+                        record_entity ->> 'schema', record_entity ->> 'table';
+                END IF;
+
+                CONTINUE;
+            END IF;
+
+            -- The type of the entity can be set explicitly, otherwise it is determined by "relkind":
+            entity_type := COALESCE(
+                record_entity ->> 'entity_type',
+                CASE entity_kind
+                    WHEN 'v' THEN 'VIEW'
+                    WHEN 'm' THEN 'MATERIALIZED VIEW'
+                    WHEN 'f' THEN 'FOREIGN TABLE'
+                    ELSE 'TABLE'
+                END
+            );
+
+            IF entity_type NOT IN ('TABLE', 'VIEW', 'MATERIALIZED VIEW', 'FOREIGN TABLE') THEN
+                RAISE EXCEPTION 'invalid entity type "%"', entity_type;
+            END IF;
+
+            IF COALESCE((record_entity ->> 'strict')::boolean, false) THEN
+                SELECT
+                    string_agg(comments.key, ', ')
+                INTO
+                    missing_columns
+                FROM
+                    jsonb_object_keys(COALESCE(record_entity -> 'columns', '{}'::jsonb)) AS comments(key)
+                WHERE
+                    NOT EXISTS (
+                        SELECT
+                            1
+                        FROM
+                            pg_attribute AS cols
+                        WHERE
+                            cols.attrelid = entity_oid
+                        AND
+                            cols.attname = comments.key
+                        AND
+                            cols.attnum > 0
+                        AND
+                            NOT cols.attisdropped
+                    );
+
+                IF missing_columns IS NOT NULL THEN
+                    RAISE EXCEPTION 'column(s) % of relation "%"."%" do not exist',
+                        missing_columns, record_entity ->> 'schema', record_entity ->> 'table';
+                END IF;
+            END IF;
+
+            -- The key is missing (SQL NULL) - the comment on the entity is not changed, JSON null - it is deleted:
+            IF record_entity -> 'table_comment' IS NOT NULL THEN
+                EXECUTE format(
+                    'COMMENT ON %s %I.%I IS %L',
+                    entity_type,
+                    record_entity ->> 'schema',
+                    record_entity ->> 'table',
+                    record_entity ->> 'table_comment'
+                );
+            END IF;
+
+            -- Only existing columns (the rest are skipped):
+            FOR record_column IN
+                SELECT
+                    comments.key AS name_column,
+                    comments.value AS description
+                FROM
+                    jsonb_each_text(COALESCE(record_entity -> 'columns', '{}'::jsonb)) AS comments
+                INNER JOIN
+                    pg_attribute AS cols
+                ON
+                    cols.attrelid = entity_oid
+                AND
+                    cols.attname = comments.key
+                AND
+                    cols.attnum > 0
+                AND
+                    NOT cols.attisdropped
+            LOOP
+                EXECUTE format(
+                    'COMMENT ON COLUMN %I.%I.%I IS %L',
+                    record_entity ->> 'schema',
+                    record_entity ->> 'table',
+                    record_column.name_column,
+                    record_column.description
+                );
+            END LOOP;
+        END LOOP;
+    END
+    $tcommenter$
+"""
+
+# Copying of comments of the source entity to the target entities (the payload is set by SQL_SET_COMMENTS_PAYLOAD):
+SQL_COPY_COMMENTS = """
+    DO $tcommenter$
+    DECLARE
+        payload jsonb := current_setting('tcommenter.payload')::jsonb;
+        source_oid oid := to_regclass(payload ->> 'source');
+        match_by_position boolean := COALESCE((payload ->> 'by_position')::boolean, false);
+        strict_columns boolean := COALESCE((payload ->> 'strict')::boolean, false);
+        source_comment text;
+        source_columns_comments jsonb;
+        record_target jsonb;
+        record_column record;
+        target_oid oid;
+        target_kind "char";
+        missing_columns text;
+    BEGIN
+        IF source_oid IS NULL THEN
+            RAISE EXCEPTION 'relation % does not exist', payload ->> 'source';
+        END IF;
+
+        source_comment := obj_description(source_oid, 'pg_class');
+
+        -- The commented columns of the source are read once (the position does not count the dropped columns):
+        SELECT
+            COALESCE(jsonb_agg(source_columns ORDER BY source_columns.position), '[]'::jsonb)
+        INTO
+            source_columns_comments
+        FROM (
+            SELECT
+                cols.attname AS name,
+                row_number() OVER (ORDER BY cols.attnum) AS position,
+                col_description(cols.attrelid, cols.attnum) AS description
+            FROM
+                pg_attribute AS cols
+            WHERE
+                cols.attrelid = source_oid
+            AND
+                cols.attnum > 0
+            AND
+                NOT cols.attisdropped
+        ) AS source_columns
+        WHERE
+            source_columns.description IS NOT NULL;
+
+        FOR record_target IN
+            SELECT jsonb_array_elements(payload -> 'targets')
+        LOOP
+            target_oid := NULL;
+            missing_columns := NULL;
+
+            SELECT
+                all_entity.oid, all_entity.relkind
+            INTO
+                target_oid, target_kind
+            FROM
+                pg_class AS all_entity
+            INNER JOIN
+                pg_namespace AS schemas
+            ON
+                schemas.oid = all_entity.relnamespace
+            WHERE
+                schemas.nspname = record_target ->> 'schema'
+            AND
+                all_entity.relname = record_target ->> 'table'
+            AND
+                all_entity.relkind IN ('r', 'v', 'm', 'f', 'p');
+
+            IF target_oid IS NULL THEN
+                RAISE EXCEPTION 'relation "%"."%" does not exist',
+                    record_target ->> 'schema', record_target ->> 'table';
+            END IF;
+
+            -- There is no comment on the source entity - the comment on the target entity is not changed:
+            IF source_comment IS NOT NULL THEN
+                EXECUTE format(
+                    'COMMENT ON %s %I.%I IS %L',
+                    CASE target_kind
+                        WHEN 'v' THEN 'VIEW'
+                        WHEN 'm' THEN 'MATERIALIZED VIEW'
+                        WHEN 'f' THEN 'FOREIGN TABLE'
+                        ELSE 'TABLE'
+                    END,
+                    record_target ->> 'schema',
+                    record_target ->> 'table',
+                    source_comment
+                );
+            END IF;
+
+            -- Only the commented columns of the source, matched by name or by position (dropped columns skipped):
+            FOR record_column IN
+                SELECT
+                    source_columns.name AS source_column,
+                    CASE
+                        WHEN match_by_position THEN (
+                            SELECT
+                                cols.attname
+                            FROM
+                                pg_attribute AS cols
+                            WHERE
+                                cols.attrelid = target_oid
+                            AND
+                                cols.attnum > 0
+                            AND
+                                NOT cols.attisdropped
+                            ORDER BY
+                                cols.attnum
+                            OFFSET
+                                source_columns.position - 1
+                            LIMIT
+                                1
+                        )
+                        ELSE (
+                            SELECT
+                                cols.attname
+                            FROM
+                                pg_attribute AS cols
+                            WHERE
+                                cols.attrelid = target_oid
+                            AND
+                                cols.attname = source_columns.name
+                            AND
+                                cols.attnum > 0
+                            AND
+                                NOT cols.attisdropped
+                        )
+                    END AS target_column,
+                    source_columns.description
+                FROM
+                    jsonb_to_recordset(source_columns_comments) AS source_columns(
+                        name name, position bigint, description text
+                    )
+            LOOP
+                IF record_column.target_column IS NULL THEN
+                    missing_columns := concat_ws(', ', missing_columns, record_column.source_column);
+                    CONTINUE;
+                END IF;
+
+                EXECUTE format(
+                    'COMMENT ON COLUMN %I.%I.%I IS %L',
+                    record_target ->> 'schema',
+                    record_target ->> 'table',
+                    record_column.target_column,
+                    record_column.description
+                );
+            END LOOP;
+
+            IF missing_columns IS NOT NULL AND strict_columns THEN
+                RAISE EXCEPTION 'column(s) % of relation "%"."%" do not exist',
+                    missing_columns, record_target ->> 'schema', record_target ->> 'table';
+            END IF;
+        END LOOP;
+    END
+    $tcommenter$
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Automatic preservation of comments by the server (event triggers). The "{schema}" of the shadow table and functions
+# is inserted quoted (str.format, see "Tcommenter.install_comments_preservation()"), the bodies contain no braces.
+# The scripts are tuples of single statements: "asyncpg" executes them one by one, "psycopg2" - merged into one.
+# The comments are mirrored into the shadow table when they are written ("COMMENT", "ALTER ..."): when the "sql_drop"
+# event fires, the comments of the dropped relation are already deleted from "pg_description".
+SQL_INSTALL_COMMENTS_PRESERVATION = (
+    """
+        CREATE SCHEMA IF NOT EXISTS {schema}
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS {schema}.preserved_comments (
+            schema_name name NOT NULL,
+            relation_name name NOT NULL,
+            column_name name NOT NULL DEFAULT '',
+            relation_oid oid NOT NULL,
+            description text NOT NULL,
+            dropped_at timestamptz,
+            PRIMARY KEY (schema_name, relation_name, column_name)
+        )
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS preserved_comments_relation_oid_idx ON {schema}.preserved_comments (relation_oid)
+    """,
+    """
+        -- The comments of one existing relation are re-read from the system catalog (the names may have changed):
+        CREATE OR REPLACE FUNCTION {schema}.preserve_comments_snapshot(target_oid oid) RETURNS void
+        LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog AS $tcommenter$
+        BEGIN
+            DELETE FROM
+                {schema}.preserved_comments AS preserved
+            USING
+                pg_class AS all_entity
+            INNER JOIN
+                pg_namespace AS schemas
+            ON
+                schemas.oid = all_entity.relnamespace
+            WHERE
+                all_entity.oid = target_oid
+            AND
+                (
+                    preserved.relation_oid = target_oid
+                    OR (preserved.schema_name, preserved.relation_name) = (schemas.nspname, all_entity.relname)
+                );
+
+            INSERT INTO {schema}.preserved_comments (schema_name, relation_name, column_name, relation_oid, description)
+            SELECT
+                schemas.nspname,
+                all_entity.relname,
+                COALESCE(cols.attname, ''),
+                all_entity.oid,
+                comments.description
+            FROM
+                pg_description AS comments
+            INNER JOIN
+                pg_class AS all_entity
+            ON
+                all_entity.oid = comments.objoid
+            INNER JOIN
+                pg_namespace AS schemas
+            ON
+                schemas.oid = all_entity.relnamespace
+            LEFT JOIN
+                pg_attribute AS cols
+            ON
+                cols.attrelid = all_entity.oid
+            AND
+                cols.attnum = comments.objsubid
+            AND
+                comments.objsubid > 0
+            AND
+                NOT cols.attisdropped
+            WHERE
+                comments.objoid = target_oid
+            AND
+                comments.classoid = 'pg_class'::regclass
+            AND
+                (comments.objsubid = 0 OR cols.attname IS NOT NULL);
+        END
+        $tcommenter$
+    """,
+    """
+        CREATE OR REPLACE FUNCTION {schema}.preserve_comments_on_ddl() RETURNS event_trigger
+        LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog AS $tcommenter$
+        DECLARE
+            command record;
+            preserved record;
+            entity_name name;
+            entity_type text;
+            comment_value text;
+        BEGIN
+            FOR command IN
+                SELECT
+                    *
+                FROM
+                    pg_event_trigger_ddl_commands()
+                WHERE
+                    classid = 'pg_class'::regclass
+                AND
+                    object_type IN (
+                        'table', 'view', 'materialized view', 'foreign table',
+                        'table column', 'view column', 'materialized view column', 'foreign table column'
+                    )
+                AND
+                    schema_name NOT LIKE 'pg\\_%'
+                AND
+                    schema_name <> 'information_schema'
+            LOOP
+                SELECT relname INTO entity_name FROM pg_class WHERE oid = command.objid;
+
+                -- One comment has been written, only it is mirrored:
+                IF command.command_tag = 'COMMENT' THEN
+                    SELECT
+                        comments.description
+                    INTO
+                        comment_value
+                    FROM
+                        pg_description AS comments
+                    WHERE
+                        comments.objoid = command.objid
+                    AND
+                        comments.classoid = 'pg_class'::regclass
+                    AND
+                        comments.objsubid = command.objsubid;
+
+                    IF comment_value IS NULL THEN
+                        DELETE FROM
+                            {schema}.preserved_comments
+                        WHERE
+                            schema_name = command.schema_name
+                        AND
+                            relation_name = entity_name
+                        AND
+                            column_name = COALESCE(
+                                (SELECT attname FROM pg_attribute WHERE attrelid = command.objid
+                                    AND attnum = command.objsubid AND command.objsubid > 0), ''
+                            );
+                    ELSE
+                        INSERT INTO {schema}.preserved_comments AS preserved
+                            (schema_name, relation_name, column_name, relation_oid, description)
+                        SELECT
+                            command.schema_name,
+                            entity_name,
+                            COALESCE(
+                                (SELECT attname FROM pg_attribute WHERE attrelid = command.objid
+                                    AND attnum = command.objsubid AND command.objsubid > 0), ''
+                            ),
+                            command.objid,
+                            comment_value
+                        ON CONFLICT (schema_name, relation_name, column_name) DO UPDATE SET
+                            relation_oid = excluded.relation_oid,
+                            description = excluded.description,
+                            dropped_at = NULL;
+                    END IF;
+
+                    CONTINUE;
+                END IF;
+
+                -- A relation has been created: the comments of the dropped relation with the same name are re-applied:
+                IF command.command_tag IN (
+                    'CREATE TABLE', 'CREATE TABLE AS', 'SELECT INTO', 'CREATE VIEW',
+                    'CREATE MATERIALIZED VIEW', 'CREATE FOREIGN TABLE'
+                ) THEN
+                    SELECT
+                        CASE relkind
+                            WHEN 'v' THEN 'VIEW'
+                            WHEN 'm' THEN 'MATERIALIZED VIEW'
+                            WHEN 'f' THEN 'FOREIGN TABLE'
+                            ELSE 'TABLE'
+                        END
+                    INTO
+                        entity_type
+                    FROM
+                        pg_class
+                    WHERE
+                        oid = command.objid;
+
+                    FOR preserved IN
+                        SELECT
+                            preserved_comments.column_name,
+                            preserved_comments.description
+                        FROM
+                            {schema}.preserved_comments
+                        WHERE
+                            preserved_comments.schema_name = command.schema_name
+                        AND
+                            preserved_comments.relation_name = entity_name
+                        AND
+                            preserved_comments.dropped_at IS NOT NULL
+                        AND
+                            preserved_comments.relation_oid <> command.objid
+                        AND
+                            (
+                                preserved_comments.column_name = ''
+                                OR EXISTS (
+                                    SELECT
+                                        1
+                                    FROM
+                                        pg_attribute AS cols
+                                    WHERE
+                                        cols.attrelid = command.objid
+                                    AND
+                                        cols.attname = preserved_comments.column_name
+                                    AND
+                                        cols.attnum > 0
+                                    AND
+                                        NOT cols.attisdropped
+                                )
+                            )
+                    LOOP
+                        IF preserved.column_name = '' THEN
+                            EXECUTE format(
+                                'COMMENT ON %s %s IS %L', entity_type, command.objid::regclass, preserved.description
+                            );
+                        ELSE
+                            EXECUTE format(
+                                'COMMENT ON COLUMN %s.%I IS %L',
+                                command.objid::regclass, preserved.column_name, preserved.description
+                            );
+                        END IF;
+                    END LOOP;
+                END IF;
+
+                -- Created or altered (renamed, moved, columns added or dropped) relation - re-read:
+                PERFORM {schema}.preserve_comments_snapshot(command.objid);
+            END LOOP;
+        END
+        $tcommenter$
+    """,
+    """
+        -- The comments of the dropped relations are kept (marked) until a relation with the same name is created:
+        CREATE OR REPLACE FUNCTION {schema}.preserve_comments_on_drop() RETURNS event_trigger
+        LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog AS $tcommenter$
+        BEGIN
+            UPDATE
+                {schema}.preserved_comments AS preserved
+            SET
+                dropped_at = now()
+            FROM
+                pg_event_trigger_dropped_objects() AS dropped
+            WHERE
+                dropped.object_type IN ('table', 'view', 'materialized view', 'foreign table')
+            AND
+                preserved.relation_oid = dropped.objid
+            AND
+                preserved.dropped_at IS NULL;
+        END
+        $tcommenter$
+    """,
+    """
+        -- The comments of the existing relations are mirrored at installation (the comments of dropped ones are kept):
+        DELETE FROM {schema}.preserved_comments WHERE dropped_at IS NULL
+    """,
+    """
+        INSERT INTO {schema}.preserved_comments (schema_name, relation_name, column_name, relation_oid, description)
+        SELECT
+            schemas.nspname,
+            all_entity.relname,
+            COALESCE(cols.attname, ''),
+            all_entity.oid,
+            comments.description
+        FROM
+            pg_description AS comments
+        INNER JOIN
+            pg_class AS all_entity
+        ON
+            all_entity.oid = comments.objoid
+        INNER JOIN
+            pg_namespace AS schemas
+        ON
+            schemas.oid = all_entity.relnamespace
+        LEFT JOIN
+            pg_attribute AS cols
+        ON
+            cols.attrelid = all_entity.oid
+        AND
+            cols.attnum = comments.objsubid
+        AND
+            comments.objsubid > 0
+        AND
+            NOT cols.attisdropped
+        WHERE
+            comments.classoid = 'pg_class'::regclass
+        AND
+            all_entity.relkind IN ('r', 'v', 'm', 'f', 'p')
+        AND
+            schemas.nspname NOT LIKE 'pg\\_%'
+        AND
+            schemas.nspname <> 'information_schema'
+        AND
+            (comments.objsubid = 0 OR cols.attname IS NOT NULL)
+        ON CONFLICT (schema_name, relation_name, column_name) DO UPDATE SET
+            relation_oid = excluded.relation_oid,
+            description = excluded.description,
+            dropped_at = NULL
+    """,
+    """
+        DROP EVENT TRIGGER IF EXISTS tcommenter_preserve_comments_ddl
+    """,
+    """
+        DROP EVENT TRIGGER IF EXISTS tcommenter_preserve_comments_drop
+    """,
+    """
+        CREATE EVENT TRIGGER tcommenter_preserve_comments_ddl ON ddl_command_end
+        WHEN TAG IN (
+            'COMMENT', 'ALTER TABLE', 'ALTER VIEW', 'ALTER MATERIALIZED VIEW', 'ALTER FOREIGN TABLE',
+            'CREATE TABLE', 'CREATE TABLE AS', 'SELECT INTO', 'CREATE VIEW', 'CREATE MATERIALIZED VIEW',
+            'CREATE FOREIGN TABLE'
+        )
+        EXECUTE FUNCTION {schema}.preserve_comments_on_ddl()
+    """,
+    """
+        CREATE EVENT TRIGGER tcommenter_preserve_comments_drop ON sql_drop
+        WHEN TAG IN (
+            'DROP TABLE', 'DROP VIEW', 'DROP MATERIALIZED VIEW', 'DROP FOREIGN TABLE', 'DROP SCHEMA', 'DROP OWNED'
+        )
+        EXECUTE FUNCTION {schema}.preserve_comments_on_drop()
+    """,
+)
+
+SQL_UNINSTALL_COMMENTS_PRESERVATION = (
+    """
+        DROP EVENT TRIGGER IF EXISTS tcommenter_preserve_comments_ddl
+    """,
+    """
+        DROP EVENT TRIGGER IF EXISTS tcommenter_preserve_comments_drop
+    """,
+    """
+        DROP FUNCTION IF EXISTS {schema}.preserve_comments_on_ddl()
+    """,
+    """
+        DROP FUNCTION IF EXISTS {schema}.preserve_comments_on_drop()
+    """,
+    """
+        DROP FUNCTION IF EXISTS {schema}.preserve_comments_snapshot(oid)
+    """,
+)
+
+SQL_DROP_PRESERVED_COMMENTS = """DROP TABLE IF EXISTS {schema}.preserved_comments"""
+
+# Deleting the comments of the entities dropped (and not recreated) at least ":older_than" seconds ago:
+SQL_PRUNE_PRESERVED_COMMENTS = """
+    WITH pruned AS (
+        DELETE FROM
+            {schema}.preserved_comments
+        WHERE
+            dropped_at IS NOT NULL
+        AND
+            dropped_at <= now() - make_interval(secs => CAST(:older_than AS double precision))
+        RETURNING
+            schema_name,
+            relation_name
+    )
+    SELECT
+        count(DISTINCT (schema_name, relation_name)),
+        count(*)
+    FROM
+        pruned
+"""
+
+# The installed event triggers and the schema of their functions:
+SQL_GET_PRESERVATION_TRIGGERS = """
+    SELECT
+        triggers.evtname,
+        triggers.evtenabled <> 'D' AS enabled,
+        schemas.nspname
+    FROM
+        pg_event_trigger AS triggers
+    INNER JOIN
+        pg_proc AS functions
+    ON
+        functions.oid = triggers.evtfoid
+    INNER JOIN
+        pg_namespace AS schemas
+    ON
+        schemas.oid = functions.pronamespace
     WHERE
-         cols.attname = ANY(:columns)
+        triggers.evtname IN ('tcommenter_preserve_comments_ddl', 'tcommenter_preserve_comments_drop')
+    ORDER BY
+        triggers.evtname
 """
 
-SQL_CHECK_TYPE_ENTITY = """
+SQL_GET_PRESERVED_COMMENTS_STATS = """
     SELECT
-        case
-                when all_entity.relkind in ('r') then 'table'			
-                when all_entity.relkind in ('v') then 'view'			
-                when all_entity.relkind in ('m') then 'mview'
-                when all_entity.relkind in ('m') then 'index'
-                when all_entity.relkind in ('m') then 'sequence'
-                when all_entity.relkind in ('m') then 'toast'
-                when all_entity.relkind in ('m') then 'composite_type'
-                when all_entity.relkind in ('m') then 'foreign_table'
-                when all_entity.relkind in ('m') then 'partitioned_table'
-                when all_entity.relkind in ('m') then 'partitioned_index'    			
-        end as type_entity		
+        count(DISTINCT (schema_name, relation_name)) FILTER (WHERE dropped_at IS NULL),
+        count(DISTINCT (schema_name, relation_name)) FILTER (WHERE dropped_at IS NOT NULL),
+        count(*) FILTER (WHERE schema_name = :schema AND relation_name = :name_entity)
     FROM
-    pg_class as all_entity
-    WHERE		
-    all_entity.relname = :name_entity	
+        {schema_preserved}.preserved_comments
 """
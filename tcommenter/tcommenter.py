@@ -15,23 +15,33 @@
 """
 
 # ----------------------------------------------------------------------------------------------------------------------
-import re
-from typing import TypeVar
+from __future__ import annotations
 
-# ---------------------------------- Importing third-party libraries
-from sqlalchemy.engine import Engine
-from sqlalchemy import text
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import TextClause
+import time
+from contextlib import contextmanager
 
 # -------------------------------- Local modules
+from .base import BaseCommenter
+from .buffer import CommentBuffer
+from .cache import MetadataCache
+from .catalog import SchemaCatalog
+from .metrics import QueryMetrics, instrumented
 from .sql.postgre_sql import *
 
-any_types = TypeVar('any_types')  # Creating a generalized data type.
+# SQLAlchemy (and "typing") are imported on the first query, not when the library is imported (see "__init__.py"):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Iterator
+
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.sql.elements import TextClause
+
+    from .catalog import CatalogRelation
 
 
 # ----------------------------------------------------------------------------------------------------------------------
-class Tcommenter: # TableCommenter
+class Tcommenter(BaseCommenter): # TableCommenter
     """
         "Tcommenter" contains the necessary methods for creating, extracting, and overloading comments to tables
         (and other entities), columns in the database (in the current version of the library, only for PostgreSQL).
@@ -41,182 +51,88 @@ class Tcommenter: # TableCommenter
         'TABLE': 'TABLE',
         'VIEW': 'VIEW',
         'MATERIALIZED': 'MATERIALIZED VIEW',
+        'FOREIGN': 'FOREIGN TABLE',
         'COLUMN': 'COLUMN',
     }
 
-    def __init__(self, engine: Engine, name_table: str, schema: str):
-        self.engine = self._validator(engine, Engine)
-        self.name_entity: str = self._stop_sql_injections(self._validator(name_table, str))
-        self.schema = self._stop_sql_injections(self._validator(schema, str))
-
-    @staticmethod
-    def _validator(value: any_types, *check_type: type[any]) -> any_types:
-        """
-            *** Private validation method (basic). ***
+    # The types of entities ("get_type_entity()") that support comments and the corresponding keys of "_PARAMS_SQL":
+    _TYPES_ENTITIES_COMMENTS = {
+        'table': 'TABLE',
+        'partitioned_table': 'TABLE',
+        'view': 'VIEW',
+        'mview': 'MATERIALIZED',
+        'foreign_table': 'FOREIGN',
+    }
 
-            It is intended for checking the correct transmission of arguments in accordance with the required data type.
-            It is used as a nested method in other sections of the library code.
+    # "COMMENT ON ..." statements by identifiers (see "_get_comment_statement()"), shared by all instances:
+    _COMMENT_STATEMENTS: dict[tuple[str, str, str, str | None], TextClause] = {}
+    _COMMENT_STATEMENTS_MAXSIZE = 4096
 
-            * Description of the mechanics:
+    def __init__(
+            self,
+            engine: Engine,
+            name_table: str,
+            schema: str,
+            cache: MetadataCache | None = None,
+            metrics: QueryMetrics | None = None,
+            catalog: SchemaCatalog | None = None,
+            buffer: CommentBuffer | None = None
+    ):
+        super().__init__(engine, schema, cache, metrics)
+        self.name_entity: str = self._stop_sql_injections(self._validator(name_table, str))
 
-                According to the passed set of valid data types via the "*check_type" parameter,
-                The "value" argument being checked is being reconciled based on the "isinstance()" method.
-                If at least one of the data types matches, the passed argument "value" is returned,
-                otherwise, a TypeError exception is thrown.
+        # The write-behind buffer: the "set_*" methods and "save_comments()" only queue comments, see "CommentBuffer":
+        self.buffer = self._validator(buffer, CommentBuffer, type(None))
 
-            ***
+        # The catalog of the schema (the type of the entity and its columns without queries), see "SchemaCatalog":
+        self.catalog = self._validator(catalog, SchemaCatalog, type(None))
 
-            * Example of a call:
+        if catalog is not None and catalog.schema != self.schema:
+            raise ValueError(f'The catalog of the schema "{catalog.schema}" does not match the schema "{self.schema}".')
 
-                params = self._validator(_params, dict)
+        # The schema-qualified name of the entity is resolved into an OID by the server in each read query
+        # (to_regclass). The OID itself is not cached: "to_sql(if_exists='replace')" recreates the entity.
+        self._relation: str = f'{self._quote_identifier(self.schema)}.{self._quote_identifier(self.name_entity)}'
 
-            ***
-
-            :param value: The value to be checked.
-            :param check_type: One or more data types allowed for the value.
-            :return: Returns the passed original value if it matches one of the check_type types.
-            :rtype: any_types, returns the type of the original data type of the argument being checked.
-            :raises TypeError: If the value does not match any of the specified data types.
+    def _get_cache_key_prefix(self) -> tuple[str, ...]:
         """
+            *** A private method for getting the beginning of the cache keys of the instance (with the entity). ***
 
-        if isinstance(value, check_type):
-            return value
-        else:
-            raise TypeError(f'Invalid data type: "{type(value).__name__}", for the argument: "{value}".')
-
-    def _stop_sql_injections(self, sql_param_string: str) -> str:
+            :return: (engine URL, schema, entity).
+            :rtype: tuple[str, ...].
         """
-            *** A private method for escaping queries from SQL injections. ***
-
-            It is designed to prevent SQL injections from being passed to the main query of other methods
-            through arguments.
-            an instance of the class. Combines two approaches, increasing security:
 
-                - regular expressions
-                - checking for key SQL commands.
+        return *super()._get_cache_key_prefix(), self.name_entity
 
-            * Description of the mechanics:
-
-                1) Checking for allowed characters:
-                The regular expression ^[a-zA-Z0-9_.\\-]+$ does not skip empty lines and other expressions do
-                not match the allowed ones by throwing a ValueError exception. Only lines containing
-                are allowed.
-                these characters are without spaces:
-
-                    - lowercase and uppercase Latin letters (a-z, A-Z);
-                    - numbers (0-9);
-                    - underline;
-                    - period;
-                    - hyphen.
-
-                This allows you to use strings consisting of regular identifiers, table names, and columns.
-                or other SQL parameters, but excludes inappropriate characters such as quotation marks, spaces,
-                or special characters that may be part of an SQL injection.
-
-                2) Checking for SQL key commands:
-                After checking the characters, the string is additionally analyzed for reserved SQL keywords.
-                words that can be used in injections. If the string contains any of the following prohibited
-                For example, a ValueError exception will be thrown.:
-
-                    - DROP;
-                    - CREATE;
-                    - ALTER;
-                    - INSERT;
-                    - UPDATE;
-                    - DELETE;
-                    - SQL comment "--";
-                    - The command completion symbol ";".
-
-            This prevents the use of strings containing malicious SQL constructs that can
-            damage the database structure or its contents.
-
-
-            ***
-
-            * Example of a call:
-
-                self.name_entity: str = self._stop_sql_injections(self._validator(name_table, str))
-
-            ***
-
-            :param sql_param_string: A string that is passed for security verification before use \
-                in the SQL query.
-            :return: A validated string that is safe to use in an SQL query.
-            :rtype: str.
-            :raises ValueError: If the string contains invalid SQL characters or keywords, \
-                which may be part of the injection.
+    def _invalidate_cache(self) -> None:
         """
+            *** A private method for invalidating the cached comments of the entity after writing comments. ***
 
-        sql_param_string = self._validator(sql_param_string, str)
-
-        # Checking for allowed characters:
-        if not re.match(r'^[a-zA-Z0-9_.\-]+$', sql_param_string):
-            raise ValueError(
-                f'String validation error: "{sql_param_string}"! An invalid character was detected. '
-                f'Only letters of the Latin alphabet, numbers, symbols are allowed.: "_", ".", "-".'
-            )
-
-        # Checking for SQL keywords:
-        disallowed_keywords = ["DROP", "CREATE", "ALTER", "INSERT", "UPDATE", "DELETE", "--", ";"]
-        if any(keyword in sql_param_string.upper() for keyword in disallowed_keywords):
-            raise ValueError(
-                f'String verification error:"{sql_param_string}"! '
-                f'The presence of SQL keywords was detected:{disallowed_keywords}'
-            )
-
-        return sql_param_string
-
-    def _check_all_elements(self, check_type: type, args_array: dict | list | tuple) -> bool:  # *args_elements
+            The cached type of the entity is not invalidated (writing comments does not change it).
         """
-            *** A private method for validating the entire set of arguments against a single data type. ***
-
-            It is designed to ensure the correct transmission of the entire passed set of arguments "args_array"
-            in accordance with the required data type (specified for verification in "check_type"). Used as
-            a nested method in other parts of the library code to control the logic of further data processing
-            (redirecting data to condition blocks).
 
-            * Description of the mechanics:
+        if self.cache is not None:
+            self.cache.invalidate(*self._get_cache_key_prefix(), 'comments')
 
-                In accordance with the passed data type (acceptable) through the "check_type" parameter, the following
-                is performed reconciliation of the checked array of arguments "args_array" based on the collaboration
-                of the "all" and "isinstance" methods. Validation is pre-performed using the "self._validator()" method
-                for valid values for arguments:
-                "check_type" - checking the transmission of a data type, for example "str", an invalid value, for
-                example, "test";
-                "args_array" - will be checked for compliance with dict|list | tuple.
-
-            ***
+    def _get_catalog_relation(self) -> CatalogRelation | None:
+        """
+            *** A private method for getting the record of the entity from the catalog of the schema. ***
 
-            * Example of a call:
+            If the catalog is not set, or there is no entity in it (for example, it was created after loading the
+            catalog), None is returned, and the methods work with queries to the database.
 
-                if self._check_all_elements(str, param_column_index_or_name):
-                    pass
-
-            ***
-
-            :param check_type: One or more data types allowed for the value.
-            :param args_array: An array of arguments to check element-by-element, only dict|list|tuple \
-                types are allowed.
-            :return: Returns True if "args_array" matches the type "check_type" \
-                and the validation was passed, otherwise False.
-            :rtype: bool.
-            :raises: Exceptions are possible in nested utility methods (see their description for details).
+            :return: The record of the entity or None.
+            :rtype: CatalogRelation | None.
         """
 
-        # Validation of the passed argument (corresponds to the data type) for further verification:
-        valid_type = self._validator(check_type, type)
-        # Allowed types for args_array:
-        valid_args_array = self._validator(args_array, (dict, list, tuple,))
-
-        # Check if all the elements have the same type:
-        return all(isinstance(element, valid_type) for element in valid_args_array)
+        return self.catalog.get_relation(self.name_entity) if self.catalog is not None else None
 
     def _insert_params_in_sql(self, sql: str, **sql_params) -> str:
         """
             *** A private method for substituting entity name and other parameters in sql queries, if necessary. ***
 
             Basically, this method is designed to insert the value "self.name_entity" (table name |
-            a materialized view|representation) obtained from "__init__". This method
+            a materialized view|representation) obtained from "__init__" (quoted by the dialect). This method
             It does not provide checks for SQL injection, self.name_entity" is checked during class initialization.
             It is unsafe to use "**sql_params" without first checking in "self._stop_sql_injections".
             It is used as a nested method in other sections of the library code.
@@ -251,10 +167,10 @@ class Tcommenter: # TableCommenter
             if not sql_params:
                 # Injection check passed during initialization:
                 # !: an error occurs if not all keys are transferred
-                fin_sql = valid_sql.format(name_entity=self.name_entity)
+                fin_sql = valid_sql.format(name_entity=self._quote_identifier(self.name_entity))
                 # todo: maybe you still need to transfer the schema!?
             else:
-                fin_sql = valid_sql.format(name_entity=self.name_entity, **sql_params)
+                fin_sql = valid_sql.format(name_entity=self._quote_identifier(self.name_entity), **sql_params)
 
             return fin_sql
 
@@ -381,108 +297,123 @@ class Tcommenter: # TableCommenter
                     )
         # todo there is no else block, there is no action on emptiness.
 
-    def _reader(self, sql: str | TextClause, **params: str | int | list) -> list[tuple]:
+    def _get_comment_statement(self, type_comment: str, name_column: str | None = None) -> TextClause:
         """
-           *** Private method of reading data in an SQL database. ***
+            *** A private method for getting the "COMMENT ON ..." statement from the cache of statements. ***
 
-            It is designed to execute SQL queries to read data with or without parameter substitution.
-            It is used as a nested method in other sections of the library code.
-
-            * Description of the mechanics:
-
-                The method is based on the "SQLAlchemy" ("execute()") library. Optional parameter transmission,
-                allows you to make a self._reader () is universal. Transmission mechanism via Multi params
-                conn.execute (sql, multiparams) provides protection against SQL injection.
-                If an error occurs when a request is made, a RuntimeError exception is thrown.
-                with errors (SQLAlchemy Error).
-
-            ***
+            It is designed to avoid formatting the SQL template and building "sqlalchemy.text()" for each comment:
+            the statement is built once for each combination of identifiers (type of comment, schema, entity,
+            column) and is shared by all instances of the class. The cache is limited to
+            "self._COMMENT_STATEMENTS_MAXSIZE" statements (when it is full, it is cleared). The identifiers must
+            be checked ("self._stop_sql_injections()") before the call.
 
             * Example of a call:
 
-                result = self._reader(sql, placeholder_sales='sales')
+                statement = self._get_comment_statement('COLUMN', 'sales')
+                self._recorder(statement, comment='pass')
 
             ***
 
-            :param sql:SQL query template.
-            :param params: kwargs (key: placeholder name in the SQL template, value: required data).
-            :return: Returns a list of tuples, example result: [(1, 'Alice'), (2, 'Bob'), (3, 'Charlie')] or [].
-            :rtype: list[tuple].
-            :raises RuntimeError: If (SQLAlchemyError).
+            :param type_comment: The value of the entity type, for example, 'TABLE' or 'COLUMN'.
+            :param name_column: Optional, if type_comment == 'COLUMN'.
+            :return: "TextClause" of the statement with the ":comment" parameter.
+            :rtype: TextClause.
         """
 
-        _params = params or None
-        engine: Engine = self.engine
+        cache_key = (type_comment, self.schema, self.name_entity, name_column)
+        statement = self._COMMENT_STATEMENTS.get(cache_key)
 
-        try:
+        if statement is None:
 
-            if isinstance(sql, str):
-                sql = text(sql)
+            if name_column is None:
+                sql = self._insert_params_in_sql(
+                    SQL_SAVE_COMMENT,
+                    entity_type=self._PARAMS_SQL.get(type_comment),
+                    # There is an injection check at the top level during initialization:
+                    schema=self._quote_identifier(self.schema),
+                )
+            else:
+                sql = self._insert_params_in_sql(
+                    SQL_SAVE_COMMENT_COLUMN,
+                    entity_type=self._PARAMS_SQL.get(type_comment),
+                    # There is an injection check at the top level during initialization:
+                    schema=self._quote_identifier(self.schema),
+                    name_column=self._quote_identifier(name_column),
+                )
 
-            with engine.connect() as conn:
-                with conn.begin():
-                    if _params:
-                        _params: dict = self._validator(_params, dict)
-                        result = conn.execute(sql, _params)
-                    else:
-                        result = conn.execute(sql)
-        except SQLAlchemyError as e:
-            raise RuntimeError(f"Error executing query: {e}")
+            if len(self._COMMENT_STATEMENTS) >= self._COMMENT_STATEMENTS_MAXSIZE:
+                self._COMMENT_STATEMENTS.clear()
 
-        # tuple_list = result.fetchall()  # Returns the Row object
-        tuple_list = [tuple(row) for row in result.fetchall()]  # fetchall() returns [] if there is no data.
+            statement = self._COMMENT_STATEMENTS[cache_key] = self._get_text_clause(sql)
 
-        # Even if fetchall() returns an empty list, the generator will safely return [].
-        return tuple_list
+        return statement
 
-    def _recorder(self, sql: str | TextClause, **params: None | str | int) -> None:
+    def _prepare_comment(
+            self,
+            type_comment: str,
+            comment_value: str,
+            name_column: str = None
+    ) -> tuple[TextClause, dict[str, str]]:
         """
-            *** A private method for writing data to an SQL database. ***
+            *** A private universal method for preparing SQL queries to create comments on database entities. ***
 
-            It is designed to execute SQL queries for writing data with or without parameter substitution.
-            It is used as a nested method in other sections of the library code.
+            Designed to prepare (without execution) an SQL query and its parameters for creating comments on various
+            entities in the database, such as (columns| tables | materialized views|representations). The result is
+            used both for a single entry ("self._create_comment()") and for a batch entry in one transaction
+            ("self._batch_recorder()").
 
             * Description of the mechanics:
 
-                The method is based on the "SQLAlchemy" ("execute()") library. Optional parameter transmission,
-                allows you to make a self._recorder () is universal. Transmission mechanism via Multi params
-                conn.execute (sql, multiparams) provides protection against SQL injection.
-                If an error occurs when a request is made, a RuntimeError exception is thrown.
-                with errors (SQLAlchemy Error).
+                According to the passed key in "type_comment", for example, 'COLUMN' or 'TABLE', the logic is defined
+                further processing by inserting an SQL query (recording comments) into the form.
+                The logic is divided into two main processing branches:
+                    - if it is a comment to a column in the database;
+                    - otherwise, it is a comment on an entity, such as a table, view, or materialized
+                performance.
+                After determining the type, the statement is taken from the cache of statements by identifiers
+                ("self._get_comment_statement()"), the SQL form is formatted only on the first use of the identifiers.
+                The comment itself is passed as a parameter.
+                If type_comment == 'COLUMN' and the "name_column" argument is not passed, it is called
+                the TypeError exception.
 
             ***
 
             * Example of a call:
 
-                self._recorder(sql, sales='This comment will be recorded in the metadata for the columns.')
+                sql, params = self._prepare_comment(type_comment='TABLE', comment_value=comment)
 
             ***
 
-            :param sql: SQL query template.
-            :param params: kwargs (key: placeholder name in the SQL template, value: optional data).
-            :return: None.
-            :rtype: Note.
-            :raises Runtime Error: is (SQLAlchemy Error).
+            :param type_comment: The value of the entity type, for example, 'TABLE'.
+            :param comment_value: A comment to be written to an entity in the database.
+            :param name_column: Optional, if type_comment == 'COLUMN'.
+            :return: SQL query and a dictionary of parameters, example: (TextClause('COMMENT ON ...'), \
+                {'comment': 'pass'}).
+            :rtype: tuple[TextClause, dict[str, str]].
+            :raise TypeError: If the value "name_column" is not passed, provided if type_comment == 'COLUMN', \
+            and other exceptions are possible in nested utility methods (see their description for details).
         """
 
-        _params = params or None
-        engine: Engine = self.engine
+        if type_comment == 'COLUMN':
+            if name_column:
 
-        try:
+                comment_value = self._validator(comment_value, str)
 
-            if isinstance(sql, str):
-                sql = text(sql)
+                # Passing comment to write parameters is safe (SQLAlchemy methods).
+                return self._get_comment_statement(type_comment, self._stop_sql_injections(name_column)), {
+                    'comment': comment_value
+                }
 
-            with engine.connect() as conn:
-                with conn.begin():
+            else:
+                raise TypeError(
+                    f'The required named argument "name_column" is missing! If the type of comment being created is a '
+                    f'column (type_comment == "COLUMN"), passing the "name_column" argument is required! '
+                    f'In all other cases, it is optional.'
+                )
 
-                    if _params:
-                        _params: dict = self._validator(_params, dict)
-                        conn.execute(sql, _params)
-                    else:
-                        conn.execute(sql)
-        except SQLAlchemyError as e:
-            raise RuntimeError(f"Error executing query: {e}")
+        # If a comment is not for a column, it means for any other entity (table, view, ...)
+        else:
+            return self._get_comment_statement(type_comment), {'comment': comment_value}
 
     def _create_comment(self, type_comment: str, comment_value: str, name_column: str = None) -> None:
         """
@@ -495,17 +426,11 @@ class Tcommenter: # TableCommenter
 
             * Description of the mechanics:
 
-                According to the passed key in "type_comment", for example, 'COLUMN' or 'TABLE', the logic is defined
-                further processing by inserting an SQL query (recording comments) into the form and transmitting
-                it's a private method responsible for writing information to the database "self._recorder()".
-                The logic is divided into two main processing branches:
-                - if it is a comment to a column in the database;
-                    - otherwise, it is a comment on an entity, such as a table, view, or materialized
-                performance.
-                After determining the type, the SQL query form is formatted, filling it with values.,
-                such as "schema", "name_column", etc. Next, transfer the prepared SQL to "self._recorder()".
-                If type_comment == 'COLUMN' and the "name_column" argument is not passed, it is called
-                the ValueError exception.
+                The SQL query and its parameters are prepared by the "self._prepare_comment()" method (for more
+                information, see its description), after which the prepared SQL is transferred to the private method
+                responsible for writing information to the database "self._recorder()".
+                If the write-behind buffer is set ("CommentBuffer"), the comment is only queued in it (the type of the
+                entity is determined by the server when the buffer is written).
 
             ***
 
@@ -520,87 +445,516 @@ class Tcommenter: # TableCommenter
             :param name_column: Optional, if type_comment == 'COLUMN'.
             :return: None, in case of a successful write to the database.
             :rtype: Note.
-            :raise ValueError: If the value "name_column" is not passed, provided if type_comment == 'COLUMN', \
+            :raise TypeError: If the value "name_column" is not passed, provided if type_comment == 'COLUMN', \
             and other exceptions are possible in nested utility methods (see their description for details).
         """
 
-        if type_comment == 'COLUMN':
-            if name_column:
+        if self.buffer is not None:
+            if type_comment == 'COLUMN':
+                self.buffer.set_column_comment(self.schema, self.name_entity, **{name_column: comment_value})
+            else:
+                self.buffer.set_table_comment(self.schema, self.name_entity, comment_value)
 
-                comment_value = self._validator(comment_value, str)
-                # todo: it may need to be moved by default to _insert_params_in_sql
-                mutable_sql_variant = self._insert_params_in_sql(
-                    SQL_SAVE_COMMENT_COLUMN,
-                    entity_type=self._PARAMS_SQL.get(type_comment),
-                    schema=self.schema,  # There is an injection check at the top level during initialization:
-                    name_column=self._stop_sql_injections(name_column),
+            return None
+
+        mutable_sql_variant, params = self._prepare_comment(type_comment, comment_value, name_column)
+        self._recorder(mutable_sql_variant, **params)
+
+    def _resolve_catalog_columns(self, columns: Iterable[int | str]) -> list[str] | None:
+        """
+            *** A private method for resolving the columns of the entity by the catalog of the schema (if set). ***
+
+            The indexes are resolved into names, the names are checked for existence (see
+            "SchemaCatalog.resolve_columns()"). The catalog could have been loaded before the entity was recreated
+            with other columns (for example, by "pandas.DataFrame.to_sql()" of another client), so if a column is not
+            found, the catalog is reloaded once and the columns are resolved again. If the catalog is not set or
+            there is no entity in it, None is returned, and the columns are checked by the server.
+
+            :param columns: The indexes or names of the columns.
+            :return: The names of the columns (in the order of the arguments) or None.
+            :rtype: list[str] | None.
+            :raises ValueError: If there are no columns in the entity after reloading the catalog.
+        """
+
+        if self._get_catalog_relation() is None:
+            return None
+
+        columns = list(columns)
+
+        try:
+            return self.catalog.resolve_columns(self.name_entity, columns)
+
+        except ValueError:
+            self.catalog.refresh()
+
+            if self._get_catalog_relation() is None:
+                return None
+
+            return self.catalog.resolve_columns(self.name_entity, columns)
+
+    def _check_catalog_columns(self, names_columns: Iterable[str]) -> None:
+        """
+            *** A private method for checking the existence of columns by the catalog of the schema (if it is set). ***
+
+            Unknown columns are reported before the transaction is started (or before the comments are queued in the
+            buffer), and not by the server in the middle of a batch (see "self._resolve_catalog_columns()").
+
+            :param names_columns: The names of the columns.
+            :return: None.
+            :raises ValueError: If there are no columns in the entity (see "SchemaCatalog.resolve_columns()").
+        """
+
+        self._resolve_catalog_columns(names_columns)
+
+    def _prepare_column_comments(self, comments_columns_dict: dict) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for preparing SQL queries to create comments on columns in the database. ***
+
+            Designed to prepare (without execution) SQL queries for creating comments on columns of entities (tables,
+            views, etc.) in a database (in the current version of the library, only for PostgreSQL).
+            It is used as the basis in "save_comments()" and "set_column_comment()", the prepared queries are
+            written in one transaction via "self._batch_recorder()".
+
+            * Description of the mechanics:
+
+                This method uses the service "self._prepare_comment()" as a nested method with
+                type_comment='COLUMN', ensuring the execution of the basic logic. (for more information, see its
+                description). The names of all columns are checked for SQL injections in one pass
+                ("self._stop_sql_injections_batch()") and, if the catalog of the schema is set, for existence
+                ("SchemaCatalog.resolve_columns()"), after which a separate query is prepared for each column
+                (SQL syntax provides entry to only one column).
+
+            ***
+
+            * Example of a call:
+
+                params = {'sales': 'This comment will be recorded in the metadata for the column.'}
+                statements = self._prepare_column_comments(params)
+
+            ***
+
+            :param comments_columns_dict: Dictionary of the type {'column_name': 'comment'}.
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+            :raises ValueError: If the dictionary is empty, other exceptions are possible in nested utility methods \
+                (see their description for details).
+        """
+
+        if self._validator(comments_columns_dict, dict):
+            self._stop_sql_injections_batch(comments_columns_dict)
+
+            self._check_catalog_columns(comments_columns_dict)
+
+            # The names are checked, the statements are taken from the cache ("self._prepare_comment()" logic):
+            return [
+                (
+                    self._get_comment_statement('COLUMN', key_name_column),
+                    {'comment': self._validator(value_comment, str)}
                 )
+                for key_name_column, value_comment in comments_columns_dict.items()
+            ]
+        else:
+            raise ValueError(
+                f'Error: The "comments_columns_dict" argument cannot be empty. '
+                f' The transmitted dictionary does not contain any values: {comments_columns_dict}.'
+            )
 
-                # Passing comment to write parameters is safe (SQLAlchemy methods).
-                self._recorder(mutable_sql_variant, comment=comment_value)
+    def _parse_table_comments(self, table_comment_tuple_list: list[tuple], service_mode: bool) -> str | dict[str, str]:
+        """
+            *** A private method for converting the result of reading the comment on an entity. ***
+
+            It is used in "get_table_comments()" (and its asynchronous version) after reading the data.
+
+            :param table_comment_tuple_list: The result of "self._reader()", example: [('comment',)] or [].
+            :param service_mode: The "Switch" of the output type.
+            :return: If service_mode=False -> str, if service_mode=True -> dict[str, str].
+            :rtype: str | dict[str, str].
+        """
+
+        # Convert (refer to the first element in the list (to a tuple, there will always be only one) and unpack:
+        if table_comment_tuple_list:
+            table_comment = table_comment_tuple_list[0][0]
+        else:
+            table_comment = ''  # If there is no comment, we return an empty string.
+
+        return {'table': table_comment} if service_mode else table_comment
+
+    def _parse_column_comments(
+            self,
+            column_comments_tuple_list: list[tuple],
+            service_mode: bool
+    ) -> dict[str, str] | dict[str, dict[str, str]]:
+        """
+            *** A private method for converting the result of reading comments on columns. ***
+
+            It is used in "get_column_comments()" (and its asynchronous version) after reading the data.
 
+            :param column_comments_tuple_list: The result of "self._reader()", example: [('column', 'comment')].
+            :param service_mode: The "Switch" of the output type.
+            :return: If service_mode=False -> dict[str, str], if service_mode=True -> dict[str, dict[str, str]].
+            :rtype: dict[str, str] | dict[str, dict[str, str]].
+        """
+
+        # Generating a dictionary from a list of tuples:
+        # Unpacks a tuple of 2 elements (1, 'Alice'), taking the first as key and the second as value:
+        _column_comments_dict = {key: value for key, value in column_comments_tuple_list}
+
+        return {'columns': _column_comments_dict} if service_mode else _column_comments_dict
+
+    def _parse_all_comments(self, all_comments_tuple_list: list[tuple]) -> dict[str, str | dict]:
+        """
+            *** A private method for converting the result of reading all comments on an entity. ***
+
+            It is used in "get_all_comments()" (and its asynchronous version) after reading the data.
+            The column name is None for the comment on the entity itself.
+
+            :param all_comments_tuple_list: The result of "self._reader()", example: [(None, 'pass'), ('id', 'pass')].
+            :return: {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :rtype: dict[str, str | dict].
+        """
+
+        # If there is no comment, we return an empty string:
+        table_comment = ''
+        column_comments_dict = {}
+
+        # Converting the received data into a single dictionary (the column name is None for the entity comment):
+        for column_name, description in all_comments_tuple_list:
+            if column_name is None:
+                table_comment = description
             else:
-                raise TypeError(
-                    f'The required named argument "name_column" is missing! If the type of comment being created is a '
-                    f'column (type_comment == "COLUMN"), passing the "name_column" argument is required! '
-                    f'In all other cases, it is optional.'
-                )
+                column_comments_dict[column_name] = description
 
+        return {'table': table_comment, 'columns': column_comments_dict}
+
+    def _validate_comments_dict(self, comments_dict: dict[str, str | dict]) -> dict[str, str | dict]:
+        """
+            *** A private method for checking the argument of "save_comments()" before accessing the database. ***
+
+            :param comments_dict: Type dictionary: {'table': 'table_comment', 'columns': {...}}.
+            :return: The passed dictionary.
+            :rtype: dict[str, str | dict].
+            :raise ValueError: If the dictionary is empty, other exceptions are possible in nested utility methods.
+        """
+
+        if comments_dict:
+
+            # Validation for the data type of input arguments \
+            # (only if there is a dictionary, we continue processing further):
+            return self._validator(comments_dict, dict)
 
-        # If a comment is not for a column, it means for any other entity (table, view, ...)
         else:
-            # todo: it may need to be moved by default to _insert_params_in_sql
-            mutable_sql_variant = self._insert_params_in_sql(
-                SQL_SAVE_COMMENT,
-                entity_type=self._PARAMS_SQL.get(type_comment),
-                schema=self.schema,  # There is an injection check at the top level during initialization:
+            raise ValueError(
+                f'Error: data is being deleted for processing! '
+                f'The passed argument "comments_dict" does not contain information:"{comments_dict}".'
             )
 
-            self._recorder(mutable_sql_variant, comment=comment_value)
+    def _dispatch_comments_dict(
+            self,
+            comments_dict: dict[str, str | dict],
+            type_entity: str | None
+    ) -> dict[str, str | dict[str, str]]:
+        """
+            *** A private method for distributing the "service structure" by the types of comments being created. ***
+
+            It is designed to analyze the argument of "save_comments()" (and its asynchronous version): the 'table' |
+            'columns' keys are markers for enabling specific type of processing logic comments on entities or their
+            columns. The comment on the entity receives the key of the type corresponding to the type of the entity
+            ('TABLE' - also for partitioned tables, 'VIEW', 'MATERIALIZED', 'FOREIGN'), the comments on the columns -
+            the 'COLUMN' key.
+
+            ***
+
+            * Example of a call:
+
+                # -> {'VIEW': 'table_comment', 'COLUMN': {'column_1': 'column_1_comment'}}.
+                dispatched = self._dispatch_comments_dict(comments_dict, type_entity='view')
+
+            ***
 
-    def _set_column_comment(self, comments_columns_dict: dict) -> None:
+            :param comments_dict: Type dictionary: {'table': 'table_comment', 'columns': {...}}.
+            :param type_entity: The type of entity ('table', 'view', 'mview', ...), see "get_type_entity()".
+            :return: Type dictionary: {'TABLE': 'table_comment', 'COLUMN': {'column_1': 'column_1_comment', ...}}.
+            :rtype: dict[str, str | dict[str, str]].
+            :raise ValueError: An exception will be thrown if an attempt is made to save comments on the entity type \
+                not provided in the current library implementation, or the dictionary does not match the structure.
         """
-            *** A private method for creating comments on columns in the database. ***
 
-            Designed to create comments on columns of entities (tables, views, etc.) in a database
-            (in the current version of the library, only for PostgreSQL).
-            It is almost the same as "self.set_column_comment()", the only difference is in the places of application
-            (this method it is used as the basis in "save_comments()") and the type of the accepted argument
-            (accepts dict).
+        # We perform validation (we exclude working with database entities that are unsupported by the method):
+        if type_entity not in self._TYPES_ENTITIES_COMMENTS:
+            raise ValueError(
+                f'Error: It is impossible to save a comment to the entity specified in the class instance! '
+                f'The method only works with tables (including partitioned and foreign tables), views, and '
+                f'materialized views. '
+                f'Entity type {type_entity}, schema: "{self.schema}", name: "{self.name_entity}").'
 
+            )
 
-            * Description of the mechanics:
+        dispatched_dict: dict[str, str | dict[str, str]] = {}
+
+        # Input data analysis:
+        for key, value in comments_dict.items():
+
+            # If the input data contains comments on entities:
+            if key == 'table':
+
+                dispatched_dict[self._TYPES_ENTITIES_COMMENTS[type_entity]] = value
+
+            # If the input data contains comments on the entity columns:
+            elif key == 'columns':
+
+                # Void checking and validation:
+                if self._validator(value, dict):
+                    dispatched_dict['COLUMN'] = value
+
+                else:
+                    raise ValueError(f'Error: there is no data to process (comments for columns)! '
+                                     f'Received: {comments_dict}!')
+
+            else:
+                structure = "{'columns': {...}} | {'table': 'table_comment'} | {'columns': {...}, \
+                table': 'table_comment'}"
+                raise ValueError(
+                    f'Error: The passed "comments_dict" argument does not match the required input data service '
+                    f'structure set in the method for proper operation! The normal "service structure" '
+                    f'looks like this: {structure}. Received: {comments_dict}'
+                )
+
+        return dispatched_dict
+
+    def _diff_comments_dict(
+            self,
+            comments_dict: dict[str, str | dict],
+            current_dict: dict[str, str | dict]
+    ) -> tuple[dict[str, str | dict], dict[str, dict]]:
+        """
+            *** A private method for comparing the comments being saved with the current comments of the entity. ***
+
+            It is designed for "save_comments(only_changed=True)": leaves in the "service structure" only the comments
+            that differ from the current ones, and distributes all the comments being saved by the result of the
+            comparison: 'written' (new or changed), 'skipped' (match the current ones), 'cleared' (an empty value
+            deletes the current comment). An empty string and None are considered the absence of a comment: None
+            is written as an empty string (for the entity and for the columns), the summary keeps the passed value.
+            Keys that do not match the "service structure" are left as they are (the error is thrown by
+            "self._dispatch_comments_dict()").
+
+            ***
+
+            * Example of a call:
+
+                current_dict = {'table': 'pass', 'columns': {'id': 'old'}}
+
+                comments_dict = {'table': 'pass', 'columns': {'id': 'new'}}
+
+                # -> ({'columns': {'id': 'new'}}, {'written': {'columns': {'id': 'new'}}, 'skipped': {'table': 'pass'},
+                #      'cleared': {}}).
+                changed_dict, summary = self._diff_comments_dict(comments_dict, current_dict)
+
+            ***
+
+            :param comments_dict: Type dictionary: {'table': 'table_comment', 'columns': {...}}.
+            :param current_dict: The current comments in the format of "get_all_comments()".
+            :return: The dictionary of changed comments and the summary of the comparison.
+            :rtype: tuple[dict[str, str | dict], dict[str, dict]].
+        """
+
+        changed_dict: dict[str, str | dict] = {}
+        summary: dict[str, dict] = {'written': {}, 'skipped': {}, 'cleared': {}}
+
+        def get_status(new_comment: str | None, current_comment: str | None) -> str:
+            if (new_comment or '') == (current_comment or ''):
+                return 'skipped'
+            return 'written' if new_comment else 'cleared'
+
+        for key, value in comments_dict.items():
+
+            if key == 'table':
+                status = get_status(value, current_dict.get('table'))
+                summary[status]['table'] = value
+
+                if status != 'skipped':
+                    changed_dict['table'] = '' if value is None else value
+
+            elif key == 'columns' and isinstance(value, dict) and value:
+                current_columns_dict = current_dict.get('columns', {})
+
+                for name_column, comment in value.items():
+                    status = get_status(comment, current_columns_dict.get(name_column))
+                    summary[status].setdefault('columns', {})[name_column] = comment
+
+                    if status != 'skipped':
+                        changed_dict.setdefault('columns', {})[name_column] = '' if comment is None else comment
+
+            # Errors of the structure are handled during the distribution by the types of comments:
+            else:
+                changed_dict[key] = value
+
+        return changed_dict, summary
+
+    def _prepare_preserved_comments(self, snapshot_dict: dict[str, str | dict]) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for preparing the restoration of the snapshot of comments of the entity. ***
+
+            It is designed to prepare (without execution) the server-side restoration of the snapshot of comments
+            (the output of "get_all_comments()") after the entity has been recreated
+            ("self._prepare_restore_comments()"). The entity that no longer exists and the columns that have been
+            dropped are skipped by the server, the columns that have been added are not affected. An empty comment
+            on the entity is not restored.
+
+            :param snapshot_dict: {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+        """
+
+        snapshot_dict = self._validator(snapshot_dict, dict)
+        record = {'schema': self.schema, 'table': self.name_entity, 'columns': snapshot_dict.get('columns', {})}
+
+        if snapshot_dict.get('table'):
+            record['table_comment'] = snapshot_dict['table']
+
+        return self._prepare_restore_comments([record])
+
+    def _prepare_copy_comments(
+            self,
+            targets: Iterable[tuple[str, str]],
+            by_position: bool,
+            strict: bool
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, dict[str, str]]]]:
+        """
+            *** A private method for preparing the server-side copying of comments to the target entities. ***
+
+            It is designed to prepare (without execution) the copying of comments of the entity to other entities
+            ("copy_comments_to()", "broadcast_comments_to()"): only the names of the target entities (one JSON
+            parameter) are transferred to the database, the comments are read and written by the server itself
+            ("SQL_COPY_COMMENTS"). The names are checked by "self._validate_targets()".
+
+            :param targets: Tuples (schema, entity name).
+            :param by_position: The "Switch" of matching columns by position instead of by name.
+            :param strict: The "Switch" of the exception for commented columns missing in a target entity.
+            :return: The checked targets and a list of pairs (SQL query, dictionary of parameters).
+            :rtype: tuple[list[tuple[str, str]], list[tuple[str, dict[str, str]]]].
+            :raises ValueError: If the list of targets is empty.
+        """
+
+        import json
+
+        valid_targets = self._validate_targets(targets)
+
+        if not valid_targets:
+            raise ValueError('Error: The "targets" argument cannot be empty.')
+
+        payload = json.dumps(
+            {
+                'source': self._relation,
+                'targets': [{'schema': schema, 'table': table} for schema, table in valid_targets],
+                'by_position': self._validator(by_position, bool),
+                'strict': self._validator(strict, bool),
+            },
+            ensure_ascii=False
+        )
+
+        statements = [(SQL_SET_COMMENTS_PAYLOAD, {'payload': payload}), (SQL_COPY_COMMENTS, {})]
+
+        return valid_targets, self._merge_statements(statements)
+
+    def _prepare_partitions_comments(
+            self,
+            dispatched_dict: dict[str, str | dict[str, str]],
+            partitions: list[tuple[str, str]]
+    ) -> list[dict]:
+        """
+            *** A private method for preparing the records of comments of the partitions of the entity. ***
+
+            It is designed to push the comments being saved on a partitioned table (see
+            "self._dispatch_comments_dict()") down to all its partitions ("save_comments(propagate=True)"): the
+            records are written by the server-side restoration of comments ("self._prepare_restore_comments()"),
+            the columns missing in a partition are skipped, the type of each partition is determined by the server.
+
+            :param dispatched_dict: Type dictionary: {'TABLE': 'table_comment', 'COLUMN': {'column_1': 'comment'}}.
+            :param partitions: Tuples (schema, partition name), see "get_partitions()".
+            :return: A list of records: [{'schema': 'audit', 'table': 'events_1', 'columns': {...}, ...}, ...].
+            :rtype: list[dict].
+        """
+
+        record: dict[str, str | dict[str, str]] = {'columns': {}}
+
+        for type_comment, value in dispatched_dict.items():
+
+            if type_comment == 'COLUMN':
+                record['columns'] = {
+                    name_column: self._validator(comment, str) for name_column, comment in value.items()
+                }
+            else:
+                record['table_comment'] = value
+
+        return [{'schema': schema, 'table': table, **record} for schema, table in partitions]
+
+    def _prepare_preservation_statements(
+            self,
+            scripts: tuple[str, ...],
+            shadow_schema: str
+    ) -> list[tuple[str, dict[str, str]]]:
+        """
+            *** A private method for preparing the statements of (un)installing the preservation of comments. ***
+
+            The scripts are tuples of single statements (see "SQL_INSTALL_COMMENTS_PRESERVATION"): the synchronous
+            version merges them into one query ("self._merge_statements()"), the asynchronous one executes them
+            one by one ("asyncpg" does not accept several statements in one query).
+
+            :param scripts: The statements with the "{schema}" placeholder.
+            :param shadow_schema: The schema of the shadow table and functions.
+            :return: A list of pairs (SQL query, dictionary of parameters).
+            :rtype: list[tuple[str, dict[str, str]]].
+            :raises ValueError: If the name of the schema contains invalid SQL characters or keywords.
+        """
+
+        shadow_schema = self._quote_identifier(self._stop_sql_injections(shadow_schema))
+
+        return [(sql.format(schema=shadow_schema), {}) for sql in scripts]
+
+    def _prepare_prune_preserved_comments(
+            self,
+            older_than_days: int | float,
+            shadow_schema: str
+    ) -> tuple[str, dict[str, float]]:
+        """
+            *** A private method for preparing the deletion of the preserved comments of dropped entities. ***
 
-                This method uses the service "self._create_comment()" as a nested method with
-                type_comment='COLUMN', ensuring the execution of the basic logic. (for more information, see its
-                description). By iterating through the entire dictionary, column comments are written one at a time
-                (SQL syntax provides entry to only one column).
+            :param older_than_days: The entities dropped at least so many days ago.
+            :param shadow_schema: The schema of the shadow table.
+            :return: (SQL query, dictionary of parameters).
+            :rtype: tuple[str, dict[str, float]].
+            :raises ValueError: If the number of days is negative or the name of the schema is invalid.
+        """
 
-            ***
+        if self._validator(older_than_days, int, float) < 0 or isinstance(older_than_days, bool):
+            raise ValueError(
+                f'Invalid value of the "older_than_days" argument: "{older_than_days}", a non-negative number expected.'
+            )
 
-            * Example of a call:
+        shadow_schema = self._quote_identifier(self._stop_sql_injections(shadow_schema))
 
-                params = {'sales': 'This comment will be recorded in the metadata for the column.'}
-                self._set_column_comment(params)
+        return SQL_PRUNE_PRESERVED_COMMENTS.format(schema=shadow_schema), {'older_than': older_than_days * 86400.0}
 
-            ***
+    @staticmethod
+    def _parse_preservation_triggers(triggers_tuple_list: list[tuple]) -> dict[str, bool | str | dict | None]:
+        """
+            *** A private method for converting the installed event triggers into the state of the preservation. ***
 
-            :param comments_columns_dict: A comment to be written to an entity in the database.
-            :return: None, in case of a successful write to the database.
-            :rtype: Note.
-            :raises: Other exceptions are possible in nested utility methods (see their description for details).
+            :param triggers_tuple_list: The result of "SQL_GET_PRESERVATION_TRIGGERS": [(name, enabled, schema), ...].
+            :return: {'installed': True, 'schema': 'tcommenter', 'triggers': {'tcommenter_preserve_comments_ddl': True,
+                ...}}.
+            :rtype: dict[str, bool | str | dict | None].
         """
 
-        if self._validator(comments_columns_dict, dict):
+        triggers = {name_trigger: enabled for name_trigger, enabled, _ in triggers_tuple_list}
 
-            for key_name_column, value_comment in comments_columns_dict.items():
-                self._create_comment(type_comment='COLUMN', comment_value=value_comment, name_column=key_name_column)
-        else:
-            raise ValueError(
-                f'Error: The "comments_columns_dict" argument cannot be empty. '
-                f' The transmitted dictionary does not contain any values: {comments_columns_dict}.'
-            )
+        return {
+            'installed': len(triggers) == 2 and all(triggers.values()),
+            'schema': triggers_tuple_list[0][2] if triggers_tuple_list else None,
+            'triggers': triggers,
+        }
 
+    @instrumented
     def get_type_entity(self) -> str:
         """
            *** A method for determining the type of entity ('table', 'view', 'view', ...) of a database by its name. ***
@@ -625,7 +979,9 @@ class Tcommenter: # TableCommenter
                 'table', 'view', 'mview', 'index', 'sequence', 'toast', 'composite_type', 'foreign_table',
                 'partitioned_table', 'partitioned_index'.
                 Passing arguments is not required, instance arguments are used.
-                of the class during initialization (self.name_entity).
+                of the class during initialization (self.schema, self.name_entity).
+                If the catalog of the schema is set ("SchemaCatalog") and contains the entity, the type is taken
+                from it without a query.
                 There may be other exceptions in nested utility methods (see their description for details).
 
             ***
@@ -641,11 +997,18 @@ class Tcommenter: # TableCommenter
             :rtype: str.
         """
 
+        # The type is known from the catalog of the schema, we do not access the database:
+        relation = self._get_catalog_relation()
+
+        if relation is not None:
+            return relation.type_entity
+
         # Defining the type of entity (options: 'table', 'view', 'view'):
-        type_entity = self._reader(SQL_CHECK_TYPE_ENTITY, name_entity=self.name_entity)
+        type_entity = self._cached_reader('type', SQL_CHECK_TYPE_ENTITY, relation=self._relation)
 
         return type_entity[0][0] if type_entity else None
 
+    @instrumented
     def set_table_comment(self, comment: str) -> None:
         """
             *** A method for creating comments to tables in a database. ***
@@ -676,6 +1039,7 @@ class Tcommenter: # TableCommenter
 
         self._create_comment(type_comment='TABLE', comment_value=comment)
 
+    @instrumented
     def set_view_comment(self, comment: str) -> None:
         """
             *** A method for creating comments on views in the database. ***
@@ -706,6 +1070,7 @@ class Tcommenter: # TableCommenter
 
         self._create_comment(type_comment='VIEW', comment_value=comment)
 
+    @instrumented
     def set_materialized_view_comment(self, comment: str) -> None:
         """
             ***A method for creating comments on materialized views in a database. ***
@@ -738,30 +1103,34 @@ class Tcommenter: # TableCommenter
 
         self._create_comment(type_comment='MATERIALIZED', comment_value=comment)
 
-    def set_column_comment(self, **comments_columns: str) -> None:
+    @instrumented
+    def set_column_comment(self, **comments_columns: str) -> dict[str, int | float]:
         """
             *** A method for creating comments on columns in the database. ***
 
             Designed to create comments on columns of entities (tables, views, etc.) in a database
             (in the current version of the library, only for PostgreSQL).
-            It is almost the same as "_self.set_column_comment()", the only difference is in the places of application
-            (this method used as public for its intended purpose) and the type of argument being accepted
+            It is almost the same as "save_comments({'columns': {...}})", the only difference is in the places of
+            application (this method used as public for its intended purpose) and the type of argument being accepted
             (accepts kwargs).
 
 
             * Description of the mechanics:
 
-                This method uses the service "self._create_comment()" as a nested method with
-                type_comment='COLUMN', ensuring the execution of the basic logic. (for more information,
-                see its description). By iterating through the entire dictionary, column comments are written one at a
-                time (SQL syntax provides entry to only one column).
+                This method uses the service "self._prepare_column_comments()" as a nested method, ensuring the
+                execution of the basic logic. (for more information, see its description). A separate query is
+                prepared for each column (SQL syntax provides entry to only one column), after which all queries are
+                written on one connection in one transaction ("self._batch_recorder()"): either all comments are
+                saved, or none.
+                If the write-behind buffer is set ("CommentBuffer"), the comments are only queued in it, and the
+                report of the buffer is returned.
 
             ***
 
             * Example of a call:
 
-                params = {'sales':'This comment will be recorded in the metadata for the column.'}
-                self._set_column_comment(params)
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+                report = comments.set_column_comment(sales='This comment will be recorded in the metadata.')
 
             ***
 
@@ -769,14 +1138,22 @@ class Tcommenter: # TableCommenter
                 key: column name,
                 value: comments to be written to a column in the database
                 ).
-            :return: None, in case of a successful write to the database.
-            :rtype: Note.
+            :return: Report of the type {'statements': 1, 'elapsed': 0.0042} \
+                (with the buffer - {'buffered': 1, 'pending': 120}).
+            :rtype: dict[str, int | float].
             :raises: Other exceptions are possible in nested utility methods (see their description for details).
         """
 
-        for key_name_column, value_comment in comments_columns.items():
-            self._create_comment(type_comment='COLUMN', comment_value=value_comment, name_column=key_name_column)
+        if self.buffer is not None:
+            self._check_catalog_columns(comments_columns)
+
+            return self.buffer.set_column_comment(self.schema, self.name_entity, **comments_columns)
 
+        statements = self._prepare_column_comments(comments_columns) if comments_columns else []
+
+        return self._batch_recorder(statements)
+
+    @instrumented
     def get_table_comments(self, service_mode: bool = False) -> str | dict[str, str]:
         """
             *** A method for getting comments on tables (and other entities other than columns) in a database. ***
@@ -788,8 +1165,9 @@ class Tcommenter: # TableCommenter
 
             * Description of the mechanics:
 
-                This method uses the nested service "self._reader()". It gets "self.name_entity"
-                from "__init__" as the value for the placeholder in an SQL query for comments from
+                This method uses the nested service "self._reader()". It gets the schema-qualified name of the
+                entity ("self.schema", "self.name_entity") from "__init__" as the value for the placeholder in an
+                SQL query (the entity is resolved into its OID, "to_regclass()") for comments from
                 PostgreSQL service tables responsible for storing various statistics and metadata.
                 (tps://postgrespro.ru/docs/postgresql/14/monitoring-stats).
 
@@ -827,18 +1205,13 @@ class Tcommenter: # TableCommenter
         service_mode = self._validator(service_mode, bool)
 
         # Getting the raw data after the request (list of tuples):
-        table_comment_tuple_list: list[tuple] = self._reader(
-            SQL_GET_TABLE_COMMENTS, name_entity=self.name_entity
+        table_comment_tuple_list: list[tuple] = self._cached_reader(
+            'comments', SQL_GET_TABLE_COMMENTS, relation=self._relation
         )
 
-        # Convert (refer to the first element in the list (to a tuple, there will always be only one) and unpack:
-        if table_comment_tuple_list:
-            table_comment = table_comment_tuple_list[0][0]
-        else:
-            table_comment = ''  # If there is no comment, we return an empty string.
-
-        return {'table': table_comment} if service_mode else table_comment
+        return self._parse_table_comments(table_comment_tuple_list, service_mode)
 
+    @instrumented
     def get_column_comments(self,
                             *column_index_or_name: int | str,
                             service_mode: bool = False
@@ -851,11 +1224,15 @@ class Tcommenter: # TableCommenter
 
             * Description of the mechanics:
 
-                This method uses the nested service "self._reader()". He gets "self.name_entity"
-                from "__init__", as well as the "*column_index_or_name" passed by the user - the name or index of
-                the required columns as values for placeholders in an SQL query. Comments on entities are stored
+                This method uses the nested service "self._reader()". He gets the schema-qualified name of the
+                entity ("self.schema", "self.name_entity") from "__init__", as well as the "*column_index_or_name"
+                passed by the user - the name or index of the required columns as values for placeholders in an SQL
+                query. Comments on entities are stored
                 in PostgreSQL service tables responsible for processing various statistics and metadata
                 (tps://postgrespro.ru/docs/postgresql/14/monitoring-stats).
+                If the catalog of the schema is set ("SchemaCatalog"), the indexes are resolved into names locally,
+                and a ValueError is thrown for unknown columns (instead of their absence in the result), if they are
+                not found after reloading the catalog.
 
                 Next, the response result is converted:
                 either to a dictionary of the type ({'columns': {'column_name': 'comment'}}) - by default
@@ -902,27 +1279,32 @@ class Tcommenter: # TableCommenter
                 param_column_index_or_name
             )
 
+            # With the catalog of the schema, the indexes are resolved into names (unknown columns are reported):
+            names_columns = self._resolve_catalog_columns(params_list_only_from_indexes_or_name)
+
+            if names_columns is not None:
+                sql, params_list_only_from_indexes_or_name = SQL_GET_COLUMN_COMMENTS_BY_NAME, names_columns
+
             # Passing the updated sql and parameters:
-            column_comments_tuple_list: list[tuple] = self._reader(
+            column_comments_tuple_list: list[tuple] = self._cached_reader(
+                'comments',
                 sql,
-                name_entity=self.name_entity,
+                relation=self._relation,
                 columns=params_list_only_from_indexes_or_name
             )
 
         else:
 
             # Passing sql to extract all comments without parameters:
-            column_comments_tuple_list: list[tuple] = self._reader(
+            column_comments_tuple_list: list[tuple] = self._cached_reader(
+                'comments',
                 SQL_GET_ALL_COLUMN_COMMENTS,
-                name_entity=self.name_entity
+                relation=self._relation
             )
 
-        # Generating a dictionary from a list of tuples:
-        # Unpacks a tuple of 2 elements (1, 'Alice'), taking the first as key and the second as value:
-        _column_comments_dict = {key: value for key, value in column_comments_tuple_list}
-
-        return {'columns': _column_comments_dict} if service_mode else _column_comments_dict
+        return self._parse_column_comments(column_comments_tuple_list, service_mode)
 
+    @instrumented
     def get_all_comments(self) -> dict[str, str | dict]:
         """
             *** A method for getting all comments for an entity (to it and its columns) in the database. ***
@@ -932,7 +1314,11 @@ class Tcommenter: # TableCommenter
 
             * Description of the mechanics:
 
-                The main and only logic is to add two dictionaries obtained as a result of the work.
+                This method uses the nested service "self._reader()" with a single SQL query, which returns both
+                the comment on the entity and the comments on all its columns in one result set (one round trip to
+                the database instead of two). The row of the entity comment has no column name (None), the rest of
+                the rows are comments on the columns (in the order of their position in the entity).
+                The result is converted into a dictionary similar to the union of the output of the methods
                 "get_table_comments()" and "get_column_comments()" with service_mode=True.
 
             ***
@@ -952,16 +1338,24 @@ class Tcommenter: # TableCommenter
             :raises: There may be other exceptions in nested utility methods (see their description for details).
         """
 
-        # Getting all the comments:
-        table_comment = self.get_table_comments(service_mode=True)
-        column_comments_dict = self.get_column_comments(service_mode=True)
+        # Getting all the comments in one query (list of tuples):
+        all_comments_tuple_list: list[tuple] = self._cached_reader(
+            'comments', SQL_GET_ALL_COMMENTS, relation=self._relation
+        )
 
-        # Converting the received data into a single dictionary:
-        all_comments_table_dict = table_comment | column_comments_dict
+        all_comments_table_dict = self._parse_all_comments(all_comments_tuple_list)
 
         return all_comments_table_dict  # на выходе: {'table': set_table_comment, 'columns': column_comments_dict}
 
-    def save_comments(self, comments_dict: dict[str, str | dict]) -> None:  # Self , schema: str
+    @instrumented
+    def save_comments(
+            self,
+            comments_dict: dict[str, str | dict],
+            atomic: bool = True,
+            only_changed: bool = False,
+            type_entity: str | None = None,
+            propagate: bool = False
+    ) -> dict[str, int | float | dict]:  # Self , schema: str
         """
             *** A method for saving comments of any type (to entities or their columns) to a database. ***
 
@@ -978,7 +1372,32 @@ class Tcommenter: # TableCommenter
                 service_mode=True): {'columns': {...}} | {'table': 'table_comment'}, ensure their correct operation
                 processing. The 'table' | 'columns' keys are markers for enabling specific type of processing logic
                 comments on entities or their columns. Next, the method automatically determines the type of entity
-                and calls the appropriate methods to save metadata.
+                and prepares the SQL queries to save metadata.
+
+                By default (atomic=True), all prepared queries are written on one connection in one transaction
+                ("self._batch_recorder()"): either all comments are saved, or none (for example, in case of an error
+                in the name of one of the columns). If atomic=False, each query is written on a separate connection
+                in a separate transaction (the behavior of previous versions of the library).
+                In both modes, a report with the number of executed queries and the elapsed time is returned.
+
+                If only_changed=True, the current comments of the entity are read first (one query, bypassing the
+                cache), and only the comments that differ from them are written (each "COMMENT ON ..." takes a lock
+                on the entity and writes to the system catalog). In this case, the report is supplemented with
+                the "service structures" of written, skipped (unchanged) and cleared (empty value) comments.
+                If nothing has changed, there is no more access to the database.
+
+                The type of the entity is requested from the database ("get_type_entity()"), unless it is passed
+                in the "type_entity" argument (for example, resolved for many entities with one query by
+                "get_types_entities()"). Partitioned and foreign tables are supported.
+
+                If propagate=True and the entity is a partitioned table, the same comments are also written to all
+                its partitions (of all levels, "get_partitions()") in the same transaction: the partitions are found
+                with one query, and their comments are written by the server (one batch instead of one
+                "save_comments()" per partition). The report is supplemented with the 'partitions' key.
+
+                If the write-behind buffer is set ("CommentBuffer"), the comments are only queued in it (the last
+                write of each comment wins), and the report of the buffer is returned: "only_changed" and "propagate"
+                are not combined with the buffer (they require reading the database at the moment of the call).
 
             ***
 
@@ -996,81 +1415,556 @@ class Tcommenter: # TableCommenter
                 comment_table_dict = comments.get_all_comments(service_mode=True)
                 comments.save_comments(comment_table_dict)
 
+                # -> {'statements': 401, 'elapsed': 0.0853}.
+                report = comments.save_comments(comment_table_dict)
+
+                # -> {'written': {'columns': {'column_1': 'new'}}, 'skipped': {'table': 'table_comment', ...},
+                #     'cleared': {}, 'statements': 1, 'elapsed': 0.0012}.
+                report = comments.save_comments(comment_table_dict, only_changed=True)
+
             ***
 
             :param comments_dict: Type dictionary:
                 {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}} |
                 {'table': 'table_comment'} | {'columns': {'column_1': 'column_1_comment', ...}}.
-            :return: None.
-            :rtype: Note.
+            :param atomic: The "Switch" of the recording mode (one transaction for all comments), by default True.
+            :param only_changed: The "Switch" of writing only changed comments, by default False.
+            :param type_entity: The type of the entity, if it is already known (see "get_types_entities()"), \
+                by default None (requested from the database).
+            :param propagate: The "Switch" of writing the comments to all partitions of a partitioned table, \
+                by default False.
+            :return: Report of the type {'statements': 401, 'elapsed': 0.0853} (if only_changed=True, \
+                supplemented with the 'written', 'skipped', 'cleared' keys, if propagate=True - 'partitions'; \
+                with the buffer - {'buffered': 2, 'pending': 120}).
+            :rtype: dict[str, int | float | dict].
             :raise ValueError: An exception will be thrown if an attempt is made to save comments on the entity type. \
                 not provided in the current library implementation. The method only works with tables, \
             views, and materialized views.
                 There may be other exceptions in nested utility methods (see their description for details).
         """
 
-        if comments_dict:
+        comments_dict = self._validate_comments_dict(comments_dict)
+        atomic = self._validator(atomic, bool)
+        only_changed = self._validator(only_changed, bool)
+        propagate = self._validator(propagate, bool)
 
-            # Validation for the data type of input arguments \
-            # (only if there is a dictionary, we continue processing further):
-            comments_dict = self._validator(comments_dict, dict)
+        if self.buffer is not None:
+            if only_changed or propagate:
+                raise ValueError(
+                    'Error: The "only_changed" and "propagate" arguments cannot be used with the write-behind buffer.'
+                )
+
+            self._check_catalog_columns(comments_dict.get('columns', {}))
+
+            return self.buffer.save_comments(self.schema, self.name_entity, comments_dict)
+
+        summary: dict[str, dict] = {}
+
+        if only_changed:
 
-            # # Defining the type of entity (options: 'table', 'view', 'view'):
+            # The current comments are read bypassing the cache (the comparison must not be based on stale data):
+            current_dict = self._parse_all_comments(self._reader(SQL_GET_ALL_COMMENTS, relation=self._relation))
+            comments_dict, summary = self._diff_comments_dict(comments_dict, current_dict)
+
+            # Nothing has changed, we do not access the database anymore:
+            if not comments_dict:
+                return summary | {'statements': 0, 'elapsed': 0.0}
+
+        # # Defining the type of entity (options: 'table', 'view', 'view'), if it is not passed:
+        if type_entity is None:
             type_entity = self.get_type_entity()
 
-            # We perform validation (we exclude working with database entities that are unsupported by the method):
-            if type_entity not in ('table', 'view', 'mview'):
-                raise ValueError(
-                    f'Error: It is impossible to save a comment to the entity specified in the class instance! '
-                    f'The method only works with tables, views, and materialized views. '
-                    f'Entity type {type_entity}, schema: "{self.schema}", name: "{self.name_entity}").'
+        # Queries prepared for recording (SQL, parameters):
+        statements: list[tuple[str, dict[str, str]]] = []
+        dispatched_dict = self._dispatch_comments_dict(comments_dict, type_entity)
+
+        for type_comment, value in dispatched_dict.items():
+
+            if type_comment == 'COLUMN':
+                statements.extend(self._prepare_column_comments(value))
+            else:
+                statements.append(self._prepare_comment(type_comment=type_comment, comment_value=value))
+
+        # The comments of all partitions (of all levels) are written by the server in one batch:
+        partitions_statements: list[tuple[str, dict[str, str]]] = []
+
+        if propagate:
+            partitions = self.get_partitions() if type_entity == 'partitioned_table' else []
+            summary['partitions'] = len(partitions)
 
+            if partitions:
+                partitions_statements = self._merge_statements(
+                    self._prepare_restore_comments(self._prepare_partitions_comments(dispatched_dict, partitions))
                 )
 
-            # Input data analysis:
-            for key, value in comments_dict.items():
+        try:
+            # All comments in one transaction:
+            if atomic:
+                return summary | self._batch_recorder(statements + partitions_statements)
 
-                # If the input data contains comments on entities:
-                if key == 'table':
+            # Each comment in a separate transaction (the partitions - in one more):
+            start_time = time.perf_counter()
 
-                    if type_entity == 'table':
-                        self.set_table_comment(value)
+            for sql, params in statements:
+                self._recorder(sql, **params)
 
-                    elif type_entity == 'view':
-                        self.set_view_comment(value)
+            self._batch_recorder(partitions_statements)
 
-                    elif type_entity == 'mview':
-                        self.set_materialized_view_comment(value)
+            return summary | {
+                'statements': len(statements) + len(partitions_statements),
+                'elapsed': time.perf_counter() - start_time
+            }
 
-                # If the input data contains comments on the entity columns:
-                elif key == 'columns':
+        finally:
+            if partitions_statements:
+                self._invalidate_targets_cache(partitions)
 
-                    # Void checking and validation:
-                    if self._validator(value, dict):
+    @instrumented
+    def copy_comments_to(
+            self,
+            schema: str,
+            table: str,
+            by_position: bool = False,
+            strict: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** A method for copying comments of the entity to another entity on the server side. ***
 
-                        # The method accepts a dictionary:
-                        self._set_column_comment(value)
+            It is designed to copy the comment on the entity and the comments on its columns to another entity
+            with the same (or a compatible) structure, without reading the comments into Python and writing them
+            back column by column ("get_all_comments()" + "save_comments()").
 
-                    else:
-                        raise ValueError(f'Error: there is no data to process (comments for columns)! '
-                                         f'Received: {comments_dict}!')
+            * Description of the mechanics:
 
+                Only the name of the target entity is transferred to the database, the comments of the source entity
+                are read from the system catalog and written to the target entity by the server itself (one "DO"
+                block, one transaction, with "psycopg2" - one statement). The type of the target entity (table,
+                view, materialized view, foreign table) is determined by the server.
+                The columns are matched by name, or by position (by_position=True, the dropped columns are not
+                counted). Only commented columns of the source are copied, the other comments of the target entity
+                are not changed (as well as its comment, if the source entity has no comment). The commented columns
+                missing in the target entity are skipped, if strict=True, an exception is thrown instead (the whole
+                transaction is rolled back). If the target entity does not exist, an exception is thrown.
 
-                else:
-                    structure = "{'columns': {...}} | {'table': 'table_comment'} | {'columns': {...}, \
-                    table': 'table_comment'}"
-                    raise ValueError(
-                        f'Error: The passed "comments_dict" argument does not match the required input data service '
-                        f'structure set in the method for proper operation! The normal "service structure" '
-                        f'looks like this: {structure}. Received: {comments_dict}'
-                    )
+            ***
 
-        else:
-            raise ValueError(
-                f'Error: data is being deleted for processing! '
-                f'The passed argument "comments_dict" does not contain information:"{comments_dict}".'
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'statements': 1, 'elapsed': 0.0021}.
+                report = comments.copy_comments_to('audit', 'sales_copy')
+                report = comments.copy_comments_to('archive', 'sales_2024', by_position=True)
+
+            ***
+
+            :param schema: The schema of the target entity.
+            :param table: The name of the target entity.
+            :param by_position: The "Switch" of matching columns by position instead of by name, by default False.
+            :param strict: The "Switch" of the exception for commented columns missing in the target entity, \
+                by default False.
+            :return: Report of the type {'statements': 1, 'elapsed': 0.0021}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If the source or target entity does not exist (or, if strict=True, a column is \
+                missing), there may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        targets, statements = self._prepare_copy_comments([(schema, table)], by_position, strict)
+
+        try:
+            return self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @instrumented
+    def broadcast_comments_to(
+            self,
+            targets: Iterable[tuple[str, str]],
+            by_position: bool = False,
+            strict: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** A method for copying comments of the entity to many entities on the server side. ***
+
+            The same as "copy_comments_to()" (for more information, see its description), but for any number of
+            target entities (for example, per-tenant replicas of the table) in one statement and one transaction:
+            either the comments are copied to all target entities, or to none of them.
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'statements': 1, 'elapsed': 0.0853}.
+                report = comments.broadcast_comments_to([(f'tenant_{number}', 'sales') for number in range(300)])
+
+            ***
+
+            :param targets: Tuples (schema, entity name).
+            :param by_position: The "Switch" of matching columns by position instead of by name, by default False.
+            :param strict: The "Switch" of the exception for commented columns missing in a target entity, \
+                by default False.
+            :return: Report of the type {'statements': 1, 'elapsed': 0.0853}.
+            :rtype: dict[str, int | float].
+            :raises ValueError: If the list of targets is empty.
+            :raises RuntimeError: If the source or a target entity does not exist (or, if strict=True, a column is \
+                missing), there may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        targets, statements = self._prepare_copy_comments(targets, by_position, strict)
+
+        try:
+            return self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @instrumented
+    def get_partitions(self) -> list[tuple[str, str]]:
+        """
+            *** A method for getting all partitions of a partitioned table (of all levels). ***
+
+            The tree of partitions is read with one recursive query to "pg_inherits" (the children of the
+            inheritance that are not partitions are not included). For an entity that is not a partitioned table,
+            an empty list is returned.
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='events', schema='audit')
+
+                # -> [('audit', 'events_2025_01_01'), ('audit', 'events_2025_01_02'), ...].
+                partitions = comments.get_partitions()
+
+            ***
+
+            :return: Tuples (schema, partition name) by levels of the tree.
+            :rtype: list[tuple[str, str]].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        return [tuple(partition) for partition in self._reader(SQL_GET_PARTITIONS, relation=self._relation)]
+
+    @instrumented
+    def propagate_comments(self, strict: bool = False) -> dict[str, int | float]:
+        """
+            *** A method for pushing the comments of a partitioned table down to all its partitions. ***
+
+            It is designed to document the partitions (including new ones, for example, created every night) with
+            the comments of the parent table: the partitions are found with one query ("get_partitions()"), and the
+            comment on the table and the comments on its columns are copied to all of them on the server side with
+            one statement ("broadcast_comments_to()", the columns are matched by name).
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='events', schema='audit')
+
+                # -> {'partitions': 700, 'statements': 1, 'elapsed': 0.2311}.
+                report = comments.propagate_comments()
+
+            ***
+
+            :param strict: See "copy_comments_to()", by default False.
+            :return: Report of the type {'partitions': 700, 'statements': 1, 'elapsed': 0.2311}.
+            :rtype: dict[str, int | float].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        partitions = self.get_partitions()
+
+        # There are no partitions, we do not access the database anymore:
+        if not partitions:
+            return {'partitions': 0, 'statements': 0, 'elapsed': 0.0}
+
+        targets, statements = self._prepare_copy_comments(partitions, False, strict)
+
+        try:
+            return {'partitions': len(targets)} | self._batch_recorder(statements)
+        finally:
+            self._invalidate_targets_cache(targets)
+
+    @contextmanager
+    def preserve_comments(self) -> Iterator[dict[str, str | dict]]:
+        """
+            *** A context manager for preserving comments of the entity when it is recreated. ***
+
+            It is designed to preserve all comments of the entity (its own and its columns) while the entity is
+            recreated inside the block (for example, "pandas.DataFrame.to_sql(if_exists='replace')" deletes the
+            table along with all its comments).
+
+            * Description of the mechanics:
+
+                When entering the block, one snapshot of all comments is taken (one query, bypassing the cache).
+                When exiting the block without an exception, the snapshot is restored by one server-side batch
+                ("self._prepare_restore_comments()"): one connection, one transaction. If the entity no longer exists,
+                nothing is written. The comments of the columns dropped inside the block are skipped, the columns
+                added inside the block remain without comments (or with the comments written inside the block).
+                The snapshot dictionary is returned to the block: it can be changed before the restoration (for
+                example, to add comments on new columns). If an exception occurred in the block, the snapshot is not
+                restored, the exception is passed on.
+                Inside "self.session()", both the snapshot and the restoration are executed in the transaction of the
+                session, so the entity is never visible to other readers without comments.
+
+            ***
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                with comments.preserve_comments() as snapshot:
+                    dataframe.to_sql('sales', ENGINE, schema='audit', if_exists='replace', index=False)
+                    snapshot['columns']['new_column'] = 'new_column_comment'
+
+                with ENGINE.begin() as conn, comments.session(conn), comments.preserve_comments():
+                    dataframe.to_sql('sales', conn, schema='audit', if_exists='replace', index=False)
+
+            ***
+
+            :return: The snapshot: {'table': 'table_comment', 'columns': {'column_1': 'column_1_comment', ...}}.
+            :rtype: Iterator[dict[str, str | dict]].
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        with self._instrument('preserve_comments.snapshot'):
+            snapshot_dict = self._parse_all_comments(self._reader(SQL_GET_ALL_COMMENTS, relation=self._relation))
+
+        yield snapshot_dict
+
+        with self._instrument('preserve_comments.restore'):
+            self._batch_recorder(self._merge_statements(self._prepare_preserved_comments(snapshot_dict)))
+
+    @instrumented
+    def to_sql(
+            self,
+            dataframe: 'pandas.DataFrame',
+            connection: Connection | None = None,
+            index: bool = False,
+            chunksize: int | None = None,
+            method: str | Callable | None = None,
+            **to_sql_kwargs: object
+    ) -> int | None:
+        """
+            *** A method for recreating the entity from a DataFrame with the preservation of all its comments. ***
+
+            It is designed to replace the common three-step approach (getting comments, "pandas.DataFrame.to_sql()"
+            with if_exists='replace', saving comments) with one call: deleting, creating, inserting data and
+            restoring comments are executed on one connection in one transaction (one commit), so readers never see
+            the table without comments (or without data).
+
+            * Description of the mechanics:
+
+                The method opens "self.session()" (or joins the session / transaction of the passed connection),
+                takes the snapshot of comments ("self.preserve_comments()"), calls "dataframe.to_sql()" with
+                if_exists='replace' on the connection of the session and restores the snapshot by one server-side
+                batch. The arguments "index", "chunksize", "method" (for example, 'multi' or a function using
+                "COPY") and other keyword arguments ("dtype", ...) are passed to "pandas.DataFrame.to_sql()".
+                The library does not import pandas, any object with a compatible "to_sql()" method is accepted.
+                If the catalog of the schema is set ("SchemaCatalog"), it is reloaded on the connection of the session
+                (the entity could have been recreated with other columns).
+
+            ***
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                rows = comments.to_sql(dataframe, chunksize=10_000, method='multi')
+
+            ***
+
+            :param dataframe: "pandas.DataFrame" with new data of the table.
+            :param connection: Optional, the SQLAlchemy connection of the caller (see "self.session()").
+            :param index: Writing the index of the DataFrame as a column, by default False.
+            :param chunksize: Passed to "pandas.DataFrame.to_sql()".
+            :param method: Passed to "pandas.DataFrame.to_sql()".
+            :param to_sql_kwargs: Other keyword arguments of "pandas.DataFrame.to_sql()" (except "if_exists").
+            :return: The number of rows written (the output of "pandas.DataFrame.to_sql()").
+            :rtype: int | None.
+            :raises: There may be other exceptions in nested utility methods (see their description for details).
+        """
+
+        with self.session(connection), self.preserve_comments():
+            rows = dataframe.to_sql(
+                self.name_entity,
+                self._connection,
+                schema=self.schema,
+                if_exists='replace',
+                index=index,
+                chunksize=chunksize,
+                method=method,
+                **to_sql_kwargs
             )
 
+            if self.catalog is not None:
+                with self.catalog.session(self._connection):
+                    self.catalog.refresh()
+
+        return rows
+
+    @instrumented
+    def install_comments_preservation(self, shadow_schema: str = 'tcommenter') -> dict[str, int | float]:
+        """
+            *** A method for installing the automatic preservation of comments by the server (event triggers). ***
+
+            It is designed to preserve the comments of entities recreated by any client (for example, every
+            "pandas.DataFrame.to_sql(if_exists='replace')" of the database) without "preserve_comments()" and its
+            snapshot / restoration round trips: the server itself re-applies the comments of the dropped entity
+            when an entity with the same schema-qualified name is created. It works for the whole database (not only
+            for the entity of the instance), creating event triggers requires superuser privileges.
+
+            * Description of the mechanics:
+
+                The shadow table "<shadow_schema>.preserved_comments" and the trigger functions are created (the
+                comments of all existing entities are mirrored into the table). By the time the "sql_drop" event
+                fires, the comments of the dropped entity are already deleted from the system catalog, so they are
+                mirrored when they are written: the "ddl_command_end" trigger updates the table after each
+                "COMMENT" (one row) and "ALTER ..." (the entity is re-read: renaming, dropped columns). The
+                "sql_drop" trigger marks the comments of the dropped entities, and the "ddl_command_end" trigger of
+                "CREATE TABLE | VIEW | ..." re-applies the marked comments of the entity with the same name (the
+                comments of the columns that no longer exist are discarded). The installation is repeatable (the
+                functions are replaced, the comments of the dropped entities are kept). The comments of the entities
+                dropped for good stay in the shadow table ("get_comments_preservation_status()", the 'dropped' key)
+                until they are deleted by "prune_preserved_comments()".
+
+            ***
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'statements': 1, 'elapsed': 0.0421}.
+                report = comments.install_comments_preservation()
+
+                # The comments are re-applied by the server:
+                dataframe.to_sql('sales', ENGINE, schema='audit', if_exists='replace', index=False)
+
+            ***
+
+            :param shadow_schema: The schema of the shadow table and functions (created if it does not exist), \
+                by default 'tcommenter'.
+            :return: Report of the type {'statements': 1, 'elapsed': 0.0421}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError), for example, there are no superuser privileges, see \
+                "self._batch_recorder()".
+        """
+
+        statements = self._prepare_preservation_statements(SQL_INSTALL_COMMENTS_PRESERVATION, shadow_schema)
+
+        return self._batch_recorder(self._merge_statements(statements))
+
+    @instrumented
+    def uninstall_comments_preservation(
+            self,
+            shadow_schema: str = 'tcommenter',
+            keep_comments: bool = False
+    ) -> dict[str, int | float]:
+        """
+            *** A method for removing the automatic preservation of comments by the server. ***
+
+            The event triggers and their functions are dropped (the schema itself is not dropped). The shadow table
+            is dropped too, unless keep_comments=True (for example, to reinstall the preservation later without
+            losing the comments of the dropped entities).
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'statements': 1, 'elapsed': 0.0093}.
+                report = comments.uninstall_comments_preservation()
+
+            ***
+
+            :param shadow_schema: The schema passed to "install_comments_preservation()", by default 'tcommenter'.
+            :param keep_comments: The "Switch" of keeping the shadow table, by default False.
+            :return: Report of the type {'statements': 1, 'elapsed': 0.0093}.
+            :rtype: dict[str, int | float].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._batch_recorder()".
+        """
+
+        scripts = SQL_UNINSTALL_COMMENTS_PRESERVATION
+
+        if not self._validator(keep_comments, bool):
+            scripts += (SQL_DROP_PRESERVED_COMMENTS,)
+
+        statements = self._prepare_preservation_statements(scripts, shadow_schema)
+
+        return self._batch_recorder(self._merge_statements(statements))
+
+    @instrumented
+    def prune_preserved_comments(
+            self,
+            older_than_days: int | float = 0,
+            shadow_schema: str = 'tcommenter'
+    ) -> dict[str, int]:
+        """
+            *** A method for deleting the preserved comments of the dropped entities that were not recreated. ***
+
+            The comments of a dropped entity are kept in the shadow table until an entity with the same name is
+            created (see "install_comments_preservation()"): the entities dropped for good accumulate there. The
+            method deletes the comments of the entities dropped at least "older_than_days" days ago (by default,
+            all of them) with one query; it can be called periodically (for example, by a maintenance DAG).
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'relations': 3, 'comments': 41}.
+                report = comments.prune_preserved_comments(older_than_days=30)
+
+            ***
+
+            :param older_than_days: The age of the drop in days, by default 0 (all the dropped entities).
+            :param shadow_schema: The schema passed to "install_comments_preservation()", by default 'tcommenter'.
+            :return: The number of entities and comments deleted: {'relations': 3, 'comments': 41}.
+            :rtype: dict[str, int].
+            :raises RuntimeError: If (SQLAlchemyError), for example, there is no shadow table, see "self._reader()".
+        """
+
+        sql, params = self._prepare_prune_preserved_comments(older_than_days, shadow_schema)
+        relations, comments = self._reader(sql, **params)[0]
+
+        return {'relations': relations, 'comments': comments}
+
+    @instrumented
+    def get_comments_preservation_status(self) -> dict[str, bool | str | int | dict | None]:
+        """
+            *** A method for getting the state of the automatic preservation of comments by the server. ***
+
+            * Description of the mechanics:
+
+                The event triggers are read from the system catalog (one query). If they are installed, the number
+                of entities with mirrored comments, the number of dropped entities whose comments are waiting for
+                re-application and the number of mirrored comments of the entity of the instance are read from the
+                shadow table (one more query).
+
+            ***
+
+            * Example of a call:
+
+                comments = Tcommenter(engine=ENGINE, name_table='sales', schema='audit')
+
+                # -> {'installed': True, 'schema': 'tcommenter', 'triggers': {'tcommenter_preserve_comments_ddl': True,
+                #     'tcommenter_preserve_comments_drop': True}, 'relations': 120, 'dropped': 1, 'entity_comments': 6}.
+                status = comments.get_comments_preservation_status()
+
+            ***
+
+            :return: The state ('installed': both triggers exist and are enabled; without triggers - only the \
+                'installed', 'schema' (None) and 'triggers' keys).
+            :rtype: dict[str, bool | str | int | dict | None].
+            :raises RuntimeError: If (SQLAlchemyError), see "self._reader()".
+        """
+
+        status = self._parse_preservation_triggers(self._reader(SQL_GET_PRESERVATION_TRIGGERS))
+
+        if status['schema'] is None:
+            return status
+
+        relations, dropped, entity_comments = self._reader(
+            SQL_GET_PRESERVED_COMMENTS_STATS.format(schema_preserved=self._quote_identifier(status['schema'])),
+            schema=self.schema,
+            name_entity=self.name_entity
+        )[0]
+
+        return status | {'relations': relations, 'dropped': dropped, 'entity_comments': entity_comments}
+
     def __str__(self):
         return (
             f'{self.__class__.__name__}(schema: {self.schema},'
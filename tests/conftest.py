@@ -0,0 +1,85 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Fixtures of the tests of the "Tcommenter" library.
+
+    The integration tests are executed against a real PostgreSQL database, the URL of which is taken from the
+    "TCOMMENTER_TEST_URL" environment variable (for example, "postgresql+psycopg2://postgres@localhost/postgres").
+    If the variable is not set, they are skipped, the tests that do not need a database are executed anyway.
+    Each integration test works in its own schema, which is dropped after it.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import uuid
+
+import pytest
+
+TEST_URL = os.environ.get('TCOMMENTER_TEST_URL')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def engine():
+    """The engine of the test database (the test is skipped if "TCOMMENTER_TEST_URL" is not set)."""
+
+    if not TEST_URL:
+        pytest.skip('The "TCOMMENTER_TEST_URL" environment variable is not set.')
+
+    from sqlalchemy import create_engine
+
+    engine = create_engine(TEST_URL)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def offline_engine():
+    """An engine that is never connected (for the tests of the methods that do not query the database)."""
+
+    from sqlalchemy import create_engine
+
+    return create_engine('sqlite://')
+
+
+@pytest.fixture(scope='session')
+def async_url(engine):
+    """The URL of the test database with the "asyncpg" driver (the test is skipped if it is not installed)."""
+
+    pytest.importorskip('asyncpg')
+    from sqlalchemy.engine import make_url
+
+    return make_url(TEST_URL).set(drivername='postgresql+asyncpg')
+
+
+@pytest.fixture
+def schema(engine):
+    """The name of an empty schema created for the test (dropped with all its entities after the test)."""
+
+    from sqlalchemy import text
+
+    name = f'tcommenter_test_{uuid.uuid4().hex[:8]}'
+
+    with engine.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{name}"'))
+
+    yield name
+
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA IF EXISTS "{name}" CASCADE'))
+
+
+@pytest.fixture
+def execute(engine):
+    """Executes SQL statements (in one transaction) on the test database."""
+
+    from sqlalchemy import text
+
+    def execute(*statements: str) -> None:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+
+    return execute
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,214 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "AsyncTcommenter" ("asyncpg" driver): the methods are awaited inside "asyncio.run()", the statements
+    are sent one by one (the driver does not accept several statements in one query).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import asyncio
+
+import pytest
+
+from tcommenter import Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def run(async_url, coroutine_function):
+    """Executes "coroutine_function(async_engine)" in a new event loop and disposes of the engine."""
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async def main():
+        async_engine = create_async_engine(async_url)
+
+        try:
+            return await coroutine_function(async_engine)
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(main())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_comments_round_trip(async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    execute(f'CREATE TABLE "{schema}"."Sales-2024" ("Order-Id" int, amount numeric)')
+    comments = {'table': "It's 100% sales", 'columns': {'Order-Id': 'The "key" %s', 'amount': '50%'}}
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='Sales-2024', schema=schema)
+        await commenter.save_comments(comments)
+
+        return await commenter.get_all_comments(), await commenter.get_type_entity()
+
+    assert run(async_url, scenario) == (comments, 'table')
+
+
+def test_missing_column(async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+
+        with pytest.raises(RuntimeError):
+            await commenter.save_comments({'table': 'Sales', 'columns': {'missing': 'Missing'}})
+
+        # The whole batch is rolled back, as with the synchronous class:
+        return await commenter.get_all_comments()
+
+    assert run(async_url, scenario) == {'table': '', 'columns': {}}
+
+
+def test_session_is_scoped_to_the_task(async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+        written, release = asyncio.Event(), asyncio.Event()
+
+        async def writer():
+            async with commenter.session():
+                await commenter.set_table_comment('Uncommitted')
+                written.set()
+                await release.wait()
+
+        async def reader():
+            await written.wait()
+
+            try:
+                # Another task does not join the open session (the comment is not committed yet):
+                return await commenter.get_table_comments()
+            finally:
+                release.set()
+
+        _, seen = await asyncio.gather(writer(), reader())
+
+        return seen, await commenter.get_table_comments()
+
+    assert run(async_url, scenario) == ('', 'Uncommitted')
+
+
+def test_preserve_comments(async_url, schema, execute):
+    from sqlalchemy import text
+
+    from tcommenter import AsyncTcommenter
+
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+        await commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+        async with commenter.session(), commenter.preserve_comments():
+            await commenter._connection.execute(text(f'DROP TABLE "{schema}".sales'))
+            await commenter._connection.execute(text(f'CREATE TABLE "{schema}".sales (id int)'))
+
+        return await commenter.get_all_comments()
+
+    assert run(async_url, scenario) == {'table': 'Sales', 'columns': {'id': 'Key'}}
+
+
+def test_to_sql(engine, async_url, schema, execute):
+    pandas = pytest.importorskip('pandas')
+    from tcommenter import AsyncTcommenter
+
+    execute(f'CREATE TABLE "{schema}".sales (id bigint)')
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+        await commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+        await commenter.to_sql(pandas.DataFrame({'id': [1, 2, 3]}))
+
+        return await commenter.get_all_comments()
+
+    assert run(async_url, scenario) == {'table': 'Sales', 'columns': {'id': 'Key'}}
+    assert pandas.read_sql_table('sales', engine, schema=schema)['id'].tolist() == [1, 2, 3]
+
+
+def test_copy_comments_to(engine, async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    execute(
+        f'CREATE TABLE "{schema}".sales (id int, amount numeric)',
+        f'CREATE TABLE "{schema}".sales_copy (sale_id int, total numeric)'
+    )
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+        await commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+        await commenter.copy_comments_to(schema, 'sales_copy', by_position=True)
+
+    run(async_url, scenario)
+
+    assert Tcommenter(engine=engine, name_table='sales_copy', schema=schema).get_all_comments() == {
+        'table': 'Sales',
+        'columns': {'sale_id': 'Key', 'total': 'Amount'}
+    }
+
+
+def test_propagate_comments(engine, async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    execute(
+        f'CREATE TABLE "{schema}".events (id int, kind int) PARTITION BY LIST (kind)',
+        f'CREATE TABLE "{schema}".events_1 PARTITION OF "{schema}".events FOR VALUES IN (1)'
+    )
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='events', schema=schema)
+        await commenter.save_comments({'table': 'Events', 'columns': {'id': 'Key', 'kind': 'Kind'}})
+
+        return await commenter.get_partitions(), await commenter.propagate_comments()
+
+    partitions, report = run(async_url, scenario)
+
+    assert partitions == [(schema, 'events_1')]
+    assert report['partitions'] == 1
+    assert Tcommenter(engine=engine, name_table='events_1', schema=schema).get_all_comments() == {
+        'table': 'Events',
+        'columns': {'id': 'Key', 'kind': 'Kind'}
+    }
+
+
+def test_comments_preservation(async_url, schema, execute):
+    from tcommenter import AsyncTcommenter
+
+    shadow_schema = f'{schema}_shadow'
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    async def scenario(async_engine):
+        commenter = AsyncTcommenter(engine=async_engine, name_table='sales', schema=schema)
+
+        try:
+            await commenter.install_comments_preservation(shadow_schema)
+        except RuntimeError as error:
+            pytest.skip(f'The event triggers cannot be installed: {error}')
+
+        try:
+            await commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+            execute(f'DROP TABLE "{schema}".sales', f'CREATE TABLE "{schema}".sales (id int)')
+            status = await commenter.get_comments_preservation_status()
+            reapplied = await commenter.get_all_comments()
+            execute(f'DROP TABLE "{schema}".sales')
+            pruned = await commenter.prune_preserved_comments(shadow_schema=shadow_schema)
+        finally:
+            await commenter.uninstall_comments_preservation(shadow_schema)
+            execute(f'DROP SCHEMA IF EXISTS "{shadow_schema}" CASCADE')
+
+        return status, reapplied, pruned, await commenter.get_comments_preservation_status()
+
+    status, reapplied, pruned, uninstalled = run(async_url, scenario)
+
+    assert status['installed'] is True
+    assert status['schema'] == shadow_schema
+    assert reapplied == {'table': 'Sales', 'columns': {'id': 'Key'}}
+    assert pruned == {'relations': 1, 'comments': 2}
+    assert uninstalled['installed'] is False
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,71 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of the private methods of "BaseCommenter" that do not query the database: the cache of SQL statements and
+    the checks of identifiers.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import pytest
+
+from tcommenter import Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_text_clause_cache():
+    from sqlalchemy import text
+
+    sql = 'SELECT 1 AS one'
+    text_clause = text('SELECT 2 AS two')
+
+    assert Tcommenter._get_text_clause(sql) is Tcommenter._get_text_clause(sql)
+    assert Tcommenter._get_text_clause(text_clause) is text_clause
+
+
+def test_comment_statements_are_shared(offline_engine):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+    other_commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+
+    assert commenter._get_comment_statement('COLUMN', 'id') is other_commenter._get_comment_statement('COLUMN', 'id')
+    assert commenter._get_comment_statement('TABLE') is not commenter._get_comment_statement('VIEW')
+
+
+@pytest.mark.parametrize('identifier', ['sales', 'updated_at', 'created_by', 'Sales-2024', 'audit.sales', 'dropped'])
+def test_valid_identifiers(offline_engine, identifier):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+
+    assert commenter._stop_sql_injections(identifier) == identifier
+    assert commenter._stop_sql_injections_batch([identifier, 'id']) == [identifier, 'id']
+
+
+@pytest.mark.parametrize('identifier', [
+    'drop', 'audit.DROP', 'sales;', 'sales--', "sales'", 'sales"', 'my sales', 'sales\nid', '',
+])
+def test_invalid_identifiers(offline_engine, identifier):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+
+    with pytest.raises(ValueError):
+        commenter._stop_sql_injections(identifier)
+
+    with pytest.raises(ValueError, match='String'):
+        commenter._stop_sql_injections_batch(['id', identifier, 'amount'])
+
+
+def test_batch_check(offline_engine):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+    names = [f'column_{number}' for number in range(10000)]
+
+    assert commenter._stop_sql_injections_batch(iter(names)) == names
+    assert commenter._stop_sql_injections_batch([]) == []
+
+    with pytest.raises(TypeError):
+        commenter._stop_sql_injections_batch(['id', 1])
+
+
+def test_quote_identifier(offline_engine):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+
+    assert commenter._quote_identifier('Sales-2024') == '"Sales-2024"'
+    assert commenter._quote_identifier('sales') == '"sales"'
+# ----------------------------------------------------------------------------------------------------------------------
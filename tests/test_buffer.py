@@ -0,0 +1,161 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "CommentBuffer": the merging of the repeated writes of comments in memory, their writing by batches
+    (by "flush()", the background thread and "close()") and the write-behind mode of "Tcommenter".
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import threading
+import time
+
+import pytest
+
+from tcommenter import CommentBuffer, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('arguments', [
+    {'max_size': 0}, {'max_size': True}, {'flush_interval': 0}, {'flush_interval': -1.5},
+])
+def test_invalid_arguments(offline_engine, arguments):
+    with pytest.raises(ValueError):
+        CommentBuffer(engine=offline_engine, **arguments)
+
+
+def test_invalid_comments_are_rejected(offline_engine):
+    buffer = CommentBuffer(engine=offline_engine)
+
+    with pytest.raises(ValueError):
+        buffer.set_table_comment('audit', 'sales; DROP TABLE x', 'Sales')
+
+    with pytest.raises(TypeError):
+        buffer.set_column_comment('audit', 'sales', id=1)
+
+    assert len(buffer) == 0
+
+
+def test_closed_buffer_rejects_comments(offline_engine):
+    buffer = CommentBuffer(engine=offline_engine)
+
+    assert buffer.close()['comments'] == 0
+
+    with pytest.raises(RuntimeError):
+        buffer.set_table_comment('audit', 'sales', 'Sales')
+
+
+def test_writes_are_merged(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)', f'CREATE TABLE "{schema}".dags (id int)')
+    buffer = CommentBuffer(engine=engine, flush_interval=60)
+
+    for number in range(100):
+        buffer.set_column_comment(schema, 'sales', id=f'Key {number}', amount=f'Amount {number}')
+
+    buffer.save_comments(schema, 'dags', {'table': 'Dags', 'columns': {'id': 'Key'}})
+
+    assert buffer.stats()['pending'] == 4
+    assert buffer.stats()['enqueued'] == 202
+
+    report = buffer.flush()
+
+    assert report['comments'] == 4
+    assert report['relations'] == 2
+    assert report['statements'] == 1
+    assert Tcommenter(engine=engine, name_table='sales', schema=schema).get_all_comments() == {
+        'table': '',
+        'columns': {'id': 'Key 99', 'amount': 'Amount 99'}
+    }
+    assert Tcommenter(engine=engine, name_table='dags', schema=schema).get_all_comments() == {
+        'table': 'Dags',
+        'columns': {'id': 'Key'}
+    }
+
+    buffer.close()
+
+
+def test_size_threshold_and_context_manager(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+    with CommentBuffer(engine=engine, max_size=1, flush_interval=60) as buffer:
+        Tcommenter(engine=engine, name_table='sales', schema=schema, buffer=buffer).set_table_comment('Sales')
+
+        # The background thread writes the buffer without waiting for the interval:
+        for _ in range(100):
+            if buffer.stats()['flushes']:
+                break
+            time.sleep(0.05)
+
+        assert commenter.get_table_comments() == 'Sales'
+
+        Tcommenter(engine=engine, name_table='sales', schema=schema, buffer=buffer).set_column_comment(id='Key')
+
+    # The rest of the buffer is written on exit:
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key'}}
+    assert buffer.stats()['pending'] == 0
+
+
+def test_unknown_entities_and_columns_are_skipped(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    buffer = CommentBuffer(engine=engine, flush_interval=60)
+    buffer.save_comments(schema, 'sales', {'table': 'Sales', 'columns': {'id': 'Key', 'typo': 'Typo'}})
+    buffer.set_table_comment(schema, 'missing', 'Missing')
+
+    report = buffer.close()
+
+    assert report['comments'] == 2
+    assert sorted(report['skipped']) == [(schema, 'missing', None), (schema, 'sales', 'typo')]
+    assert buffer.stats()['flushed'] == 2
+    assert buffer.stats()['skipped'] == 2
+    assert Tcommenter(engine=engine, name_table='sales', schema=schema).get_all_comments() == {
+        'table': 'Sales',
+        'columns': {'id': 'Key'}
+    }
+
+
+def test_unreachable_database():
+    pytest.importorskip('psycopg2')
+    from sqlalchemy import create_engine
+
+    engine = create_engine('postgresql+psycopg2://postgres@127.0.0.1:1/postgres')
+    buffer = CommentBuffer(engine=engine, flush_interval=60)
+    buffer.set_table_comment('audit', 'sales', 'Sales')
+
+    with pytest.raises(RuntimeError, match='Error executing query'):
+        buffer.flush()
+
+    # The comments are returned to the buffer:
+    assert buffer.stats()['pending'] == 1
+    assert buffer.stats()['errors'] == 1
+
+    with pytest.raises(RuntimeError):
+        buffer.close()
+
+
+def test_write_racing_with_close(offline_engine):
+    buffer = CommentBuffer(engine=offline_engine)
+    lock = buffer._lock
+
+    class ClosingLock:
+        """Closes the buffer (in another thread) right before the write takes the lock."""
+
+        def __enter__(self):
+            buffer._lock = lock
+            closing = threading.Thread(target=buffer.close)
+            closing.start()
+            closing.join()
+
+            return lock.__enter__()
+
+        def __exit__(self, *exc_info):
+            return lock.__exit__(*exc_info)
+
+    buffer._lock = ClosingLock()
+
+    # The comment is either written by "close()" or rejected, it is not left in the closed buffer:
+    with pytest.raises(RuntimeError):
+        buffer.set_table_comment('audit', 'sales', 'Sales')
+
+    assert len(buffer) == 0
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,85 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "BulkCommenter": saving and reading comments of many entities in a pool of threads.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import pytest
+
+from tcommenter import BulkCommenter, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_save_and_get_all_comments(engine, schema, execute):
+    execute(*[f'CREATE TABLE "{schema}".sales_{number} (id int)' for number in range(20)])
+    bulk_commenter = BulkCommenter(engine=engine, max_workers=4)
+
+    results = bulk_commenter.save_comments([
+        (schema, f'sales_{number}', {'table': f'Sales {number}', 'columns': {'id': 'Key'}}) for number in range(20)
+    ])
+
+    assert [result['error'] for result in results] == [None] * 20
+    assert [result['table'] for result in results] == [f'sales_{number}' for number in range(20)]
+
+    results = bulk_commenter.get_all_comments([(schema, f'sales_{number}') for number in range(20)])
+
+    assert [result['result'] for result in results] == [
+        {'table': f'Sales {number}', 'columns': {'id': 'Key'}} for number in range(20)
+    ]
+
+
+def test_failed_job_does_not_stop_the_others(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    results = BulkCommenter(engine=engine, max_workers=2).save_comments([
+        (schema, 'missing', {'table': 'Missing'}),
+        (schema, 'sales', {'table': 'Sales'}),
+    ])
+
+    assert results[0]['error'] is not None
+    assert results[1]['error'] is None
+    assert Tcommenter(engine=engine, name_table='sales', schema=schema).get_table_comments() == 'Sales'
+
+
+def test_malformed_job(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    results = BulkCommenter(engine=engine, max_workers=2).save_comments([
+        (schema,),
+        (schema, 'sales; DROP TABLE x', {'table': 'Sales'}),
+        (schema, 'sales', {'table': 'Sales'}),
+    ])
+
+    assert isinstance(results[0]['error'], IndexError)
+    assert isinstance(results[1]['error'], ValueError)
+    assert results[2] == {'schema': schema, 'table': 'sales', 'result': results[2]['result'], 'error': None}
+    assert Tcommenter(engine=engine, name_table='sales', schema=schema).get_table_comments() == 'Sales'
+
+
+@pytest.mark.parametrize('max_workers', [0, -1, True, 1.5])
+def test_invalid_max_workers(offline_engine, max_workers):
+    with pytest.raises((TypeError, ValueError)):
+        BulkCommenter(engine=offline_engine, max_workers=max_workers)
+
+
+def test_default_max_workers(offline_engine):
+    import os
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import NullPool, QueuePool
+
+    default_max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    # By the size of "QueuePool" (the overflow is not counted, see "BulkCommenter"):
+    for max_overflow in (5, -1):
+        engine = create_engine('sqlite://', poolclass=QueuePool, pool_size=3, max_overflow=max_overflow)
+        assert BulkCommenter(engine=engine).max_workers == 3
+
+    # Other pools - the default of "ThreadPoolExecutor":
+    assert BulkCommenter(engine=create_engine('sqlite://', poolclass=NullPool)).max_workers == default_max_workers
+    assert BulkCommenter(engine=offline_engine).max_workers == default_max_workers
+
+    assert BulkCommenter(engine=engine, max_workers=8).max_workers == 8
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "MetadataCache": the lifetime (TTL) and the size (LRU) of the records, the invalidation by the prefix of
+    the key and the invalidation of the cached comments after writing them through the library.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import time
+
+import pytest
+
+from tcommenter import MetadataCache, SchemaCommenter, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_get_and_set():
+    cache = MetadataCache()
+
+    assert cache.get(('url', 'audit', 'sales')) == (False, None)
+
+    cache.set(('url', 'audit', 'sales'), {'table': 'Sales'})
+
+    assert cache.get(('url', 'audit', 'sales')) == (True, {'table': 'Sales'})
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 1024, 'ttl': 60.0}
+
+
+def test_ttl():
+    cache = MetadataCache(ttl=0.01)
+    cache.set(('url', 'audit', 'sales'), 'Sales')
+
+    time.sleep(0.02)
+
+    assert cache.get(('url', 'audit', 'sales')) == (False, None)
+    assert len(cache) == 0
+
+
+def test_lru():
+    cache = MetadataCache(maxsize=2)
+    cache.set(('url', 'audit', 'sales'), 'Sales')
+    cache.set(('url', 'audit', 'dags'), 'Dags')
+
+    # The record becomes the most recently used one:
+    cache.get(('url', 'audit', 'sales'))
+    cache.set(('url', 'audit', 'events'), 'Events')
+
+    assert cache.get(('url', 'audit', 'dags')) == (False, None)
+    assert cache.get(('url', 'audit', 'sales')) == (True, 'Sales')
+    assert cache.get(('url', 'audit', 'events')) == (True, 'Events')
+
+
+def test_invalidate():
+    cache = MetadataCache()
+    cache.set(('url', 'audit', 'sales', 'comments'), 'Sales')
+    cache.set(('url', 'audit', 'sales', 'type'), 'table')
+    cache.set(('url', 'audit', 'dags', 'comments'), 'Dags')
+    cache.set(('url', 'public', 'sales', 'comments'), 'Public sales')
+
+    assert cache.invalidate('url', 'audit', 'sales') == 2
+    assert cache.invalidate('url', 'audit') == 1
+    assert len(cache) == 1
+
+    cache.clear()
+
+    assert cache.stats()['size'] == cache.stats()['hits'] == 0
+
+
+@pytest.mark.parametrize('arguments', [{'ttl': 0}, {'ttl': True}, {'maxsize': 0}, {'maxsize': 1.5}])
+def test_invalid_arguments(arguments):
+    with pytest.raises(ValueError):
+        MetadataCache(**arguments)
+
+
+def test_reads_through_the_cache(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    cache = MetadataCache()
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, cache=cache)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key'}}
+
+    # A change bypassing the library is not visible until the record expires or is invalidated:
+    execute(f'COMMENT ON TABLE "{schema}".sales IS \'Changed\'')
+    hits = cache.stats()['hits']
+
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key'}}
+    assert cache.stats()['hits'] == hits + 1
+
+    # Writing through the library invalidates the comments of the entity (of all instances with this cache):
+    Tcommenter(engine=engine, name_table='sales', schema=schema, cache=cache).set_column_comment(id='New key')
+
+    assert commenter.get_all_comments() == {'table': 'Changed', 'columns': {'id': 'New key'}}
+
+
+def test_schema_writes_invalidate_the_entities(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    cache = MetadataCache()
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, cache=cache)
+
+    assert commenter.get_table_comments() == ''
+
+    SchemaCommenter(engine=engine, schema=schema, cache=cache).save_all_comments({'sales': {'table': 'Sales'}})
+
+    assert commenter.get_table_comments() == 'Sales'
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "SchemaCatalog": the records of the entities of the schema ("CatalogRelation") and the use of the catalog
+    by "Tcommenter" (the types of the entities and the columns without queries to the database).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import pytest
+
+from tcommenter import SchemaCatalog, Tcommenter
+from tcommenter.catalog import CatalogRelation
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('relkind, type_entity', [
+    ('r', 'table'), ('v', 'view'), ('m', 'mview'), ('f', 'foreign_table'), ('p', 'partitioned_table'), ('i', None),
+])
+def test_relation_type_entity(relkind, type_entity):
+    assert CatalogRelation(1, 'sales', relkind, ()).type_entity == type_entity
+
+
+def test_relation_columns():
+    # The second column has been dropped:
+    relation = CatalogRelation(1, 'sales', 'r', ('id', None, 'amount'))
+
+    assert [relation.get_column_name(attnum) for attnum in range(5)] == [None, 'id', None, 'amount', None]
+    assert relation.get_column_number('amount') == 3
+    assert relation.get_column_number('missing') is None
+
+
+def test_catalog(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}".sales (id int, removed text, amount numeric)',
+        f'ALTER TABLE "{schema}".sales DROP COLUMN removed',
+        f'CREATE VIEW "{schema}".sales_view AS SELECT 1 AS one',
+        f'CREATE TABLE "{schema}".events (id int, kind int) PARTITION BY LIST (kind)'
+    )
+    catalog = SchemaCatalog(engine=engine, schema=schema)
+
+    assert len(catalog) == 3
+    assert 'sales' in catalog and 'missing' not in catalog
+    assert catalog.get_type_entity('sales_view') == 'view'
+    assert catalog.get_type_entity('events') == 'partitioned_table'
+    assert catalog.get_relation_by_oid(catalog.get_oid('sales')).name == 'sales'
+    assert catalog.resolve_columns('sales', [3, 'id']) == ['amount', 'id']
+
+    with pytest.raises(ValueError, match=r"\[2, 'missing'\]"):
+        catalog.resolve_columns('sales', [2, 'missing'])
+
+    with pytest.raises(ValueError):
+        catalog.resolve_columns('missing', ['id'])
+
+    execute(f'CREATE TABLE "{schema}".dags (id int)')
+
+    assert 'dags' not in catalog
+    assert catalog.refresh() == 4
+    assert catalog.get_type_entity('dags') == 'table'
+
+
+def test_tcommenter_with_catalog(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    catalog = SchemaCatalog(engine=engine, schema=schema)
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, catalog=catalog)
+
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    assert commenter.get_type_entity() == 'table'
+    assert commenter.get_column_comments(2) == {'amount': 'Amount'}
+
+    with pytest.raises(ValueError):
+        Tcommenter(engine=engine, name_table='sales', schema='public', catalog=catalog)
+
+
+def test_catalog_miss_refreshes_the_catalog(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    catalog = SchemaCatalog(engine=engine, schema=schema)
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, catalog=catalog)
+
+    assert commenter.get_type_entity() == 'table'
+
+    # The entity is recreated with a new column after the catalog has been loaded:
+    execute(f'DROP TABLE "{schema}".sales', f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    commenter.save_comments({'table': 'Sales', 'columns': {'amount': 'Amount'}})
+
+    assert commenter.get_column_comments('amount') == {'amount': 'Amount'}
+    assert catalog.resolve_columns('sales', ['amount']) == ['amount']
+
+    # The columns that do not exist after the refresh are still reported before the transaction:
+    with pytest.raises(ValueError):
+        commenter.save_comments({'table': 'New', 'columns': {'missing': 'Missing'}})
+
+    assert commenter.get_table_comments() == 'Sales'
+
+
+def test_to_sql_refreshes_the_catalog(engine, schema, execute):
+    pandas = pytest.importorskip('pandas')
+
+    execute(f'CREATE TABLE "{schema}".sales (id bigint)')
+    catalog = SchemaCatalog(engine=engine, schema=schema)
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, catalog=catalog)
+
+    assert catalog.get_relation('sales').columns == ('id',)
+
+    commenter.to_sql(pandas.DataFrame({'id': [1], 'amount': [2.5]}))
+
+    assert catalog.get_relation('sales').columns == ('id', 'amount')
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "DatabaseCommenter": the export of the comments of the database to JSON Lines (by pages of entities)
+    and their import (by chunks, with the resumption from the progress file).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import io
+import json
+
+import pytest
+from tcommenter import DatabaseCommenter, SchemaCommenter, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def entities(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}"."Sales-2024" ("Order-Id" int, amount numeric)',
+        f'CREATE VIEW "{schema}".sales_view AS SELECT 1 AS one',
+        f'CREATE MATERIALIZED VIEW "{schema}".sales_mview AS SELECT 1 AS one',
+        f'CREATE TABLE "{schema}".uncommented (id int)'
+    )
+    entities = {
+        'Sales-2024': {'table': "It's 100% sales", 'columns': {'Order-Id': 'The "key" %s', 'amount': "50% o'clock"}},
+        'sales_view': {'table': 'View', 'columns': {'one': 'One'}},
+        'sales_mview': {'table': 'Materialized view', 'columns': {}},
+    }
+    SchemaCommenter(engine=engine, schema=schema).save_all_comments(entities)
+
+    return entities
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('page_size', [1, 2, 1000])
+def test_export_comments(engine, schema, entities, tmp_path, page_size):
+    file = tmp_path / 'comments.jsonl'
+
+    report = DatabaseCommenter(engine=engine, schemas=[schema], page_size=page_size).export_comments(file)
+
+    assert report['relations'] == 3
+    assert report['comments'] == 6
+
+    # The entities without comments are not exported:
+    records = {record['table']: record for record in map(json.loads, file.read_text(encoding='utf-8').splitlines())}
+
+    assert records == {
+        name: {'schema': schema, 'table': name, 'columns': comments['columns'], 'table_comment': comments['table']}
+        for name, comments in entities.items()
+    }
+
+
+
+@pytest.mark.parametrize('page_size', [0, -1, True, '10'])
+def test_invalid_page_size(offline_engine, page_size):
+    with pytest.raises((TypeError, ValueError)):
+        DatabaseCommenter(engine=offline_engine, page_size=page_size)
+
+
+def test_export_import_round_trip(engine, schema, entities, tmp_path):
+    database_commenter = DatabaseCommenter(engine=engine, schemas=[schema], page_size=2)
+    file = tmp_path / 'comments.jsonl'
+    database_commenter.export_comments(file)
+
+    # Deleting all comments and restoring them from the file:
+    SchemaCommenter(engine=engine, schema=schema).save_all_comments({
+        name: {'table': None, 'columns': {column: None for column in comments['columns']}}
+        for name, comments in entities.items()
+    })
+    assert SchemaCommenter(engine=engine, schema=schema).get_all_comments() == {}
+
+    report = database_commenter.import_comments(file, chunk_size=2)
+
+    assert report['relations'] == 3
+    assert report['chunks'] == 2
+    assert report['resumed_lines'] == 0
+    assert SchemaCommenter(engine=engine, schema=schema).get_all_comments() == entities
+
+
+def test_import_resumes_from_progress(engine, schema, entities, tmp_path):
+    lines = [
+        json.dumps({'schema': schema, 'table': name, 'table_comment': f'Imported {number}'})
+        for number, name in enumerate(entities)
+    ]
+    progress_file = tmp_path / 'comments.progress'
+    progress_file.write_text(json.dumps({'lines': 2, 'chunks': 2}), encoding='utf-8')
+
+    report = DatabaseCommenter(engine=engine).import_comments(
+        io.StringIO('\n'.join(lines)), chunk_size=1, progress_file=progress_file
+    )
+
+    assert report['resumed_lines'] == 2
+    assert report['relations'] == 1
+    assert not progress_file.exists()
+
+    # Only the line after the saved progress is imported:
+    assert Tcommenter(engine=engine, name_table='Sales-2024', schema=schema).get_table_comments() == "It's 100% sales"
+    assert Tcommenter(engine=engine, name_table='sales_mview', schema=schema).get_table_comments() == 'Imported 2'
+# ----------------------------------------------------------------------------------------------------------------------
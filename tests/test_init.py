@@ -0,0 +1,37 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of the lazy imports of the package: "import tcommenter" does not import SQLAlchemy.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_import_does_not_load_sqlalchemy():
+    code = 'import sys, tcommenter; print(any(name.split(".")[0] == "sqlalchemy" for name in sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == 'False'
+
+
+@pytest.mark.parametrize('name', tcommenter.__all__)
+def test_public_names(name):
+    assert getattr(tcommenter, name).__name__ == name
+    assert name in dir(tcommenter)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        getattr(tcommenter, 'Missing')
+# ----------------------------------------------------------------------------------------------------------------------
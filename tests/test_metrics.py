@@ -0,0 +1,111 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "QueryMetrics": the accumulation of the measurements of the public methods and the callbacks.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import logging
+
+import pytest
+
+from tcommenter import QueryMetrics, SchemaCommenter, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_record_and_stats():
+    metrics = QueryMetrics()
+    samples = []
+    metrics.add_callback(lambda method, sample: samples.append((method, sample)))
+
+    metrics.record('save_comments', {'statements': 2, 'rows': 0, 'checkouts': 1}, 0.5, False)
+    metrics.record('save_comments', {'statements': 1, 'rows': 3, 'checkouts': 1}, 0.25, True)
+
+    assert metrics.stats() == {
+        'save_comments': {
+            'calls': 2, 'errors': 1, 'statements': 3, 'rows': 3, 'checkouts': 2, 'total_time': 0.75, 'max_time': 0.5
+        }
+    }
+    assert samples[1] == (
+        'save_comments', {'statements': 1, 'rows': 3, 'checkouts': 1, 'elapsed': 0.25, 'error': True}
+    )
+
+    metrics.reset()
+
+    assert metrics.stats() == {}
+
+
+def test_callbacks():
+    metrics = QueryMetrics()
+    samples = []
+
+    def callback(method, sample):
+        samples.append(method)
+
+    with pytest.raises(TypeError):
+        metrics.add_callback('not callable')
+
+    metrics.add_callback(callback)
+    metrics.record('get_all_comments', {'statements': 1, 'rows': 1, 'checkouts': 1}, 0.1, False)
+    metrics.remove_callback(callback)
+    metrics.record('get_all_comments', {'statements': 1, 'rows': 1, 'checkouts': 1}, 0.1, False)
+
+    assert samples == ['get_all_comments']
+
+    with pytest.raises(ValueError):
+        metrics.remove_callback(callback)
+
+
+def test_instrumented_methods(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    metrics = QueryMetrics()
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, metrics=metrics)
+
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+    commenter.get_all_comments()
+
+    with pytest.raises(RuntimeError):
+        commenter.set_column_comment(missing='Missing')
+
+    stats = metrics.stats()
+
+    save_comments, get_all_comments = stats['Tcommenter.save_comments'], stats['Tcommenter.get_all_comments']
+    set_column_comment = stats['Tcommenter.set_column_comment']
+
+    assert save_comments['calls'] == 1
+    assert save_comments['statements'] >= 1
+    assert get_all_comments['statements'] == 1
+    assert get_all_comments['rows'] == 2
+    assert set_column_comment['errors'] == 1
+
+
+def test_failed_callback_does_not_change_the_result(engine, schema, execute, caplog):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    metrics = QueryMetrics()
+    samples = []
+
+    def failed_callback(method, sample):
+        raise ConnectionError('The metrics sink is down.')
+
+    metrics.add_callback(failed_callback)
+    metrics.add_callback(lambda method, sample: samples.append(method))
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema, metrics=metrics)
+
+    with caplog.at_level(logging.ERROR, logger='tcommenter.metrics'):
+        commenter.set_table_comment('Sales')
+
+    assert commenter.get_table_comments() == 'Sales'
+    assert len(samples) == 2
+    assert 'The metrics sink is down.' in caplog.text
+
+
+def test_methods_are_keyed_by_class(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    metrics = QueryMetrics()
+
+    Tcommenter(engine=engine, name_table='sales', schema=schema, metrics=metrics).get_all_comments()
+    SchemaCommenter(engine=engine, schema=schema, metrics=metrics).get_all_comments()
+
+    assert {'Tcommenter.get_all_comments', 'SchemaCommenter.get_all_comments'} <= set(metrics.stats())
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,103 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Integration tests of the automatic preservation of comments by the server (event triggers, superuser privileges
+    are required): re-applying comments after DROP / CREATE, tracking renames and pruning of dropped entities.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import pytest
+
+from tcommenter import Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def preservation(engine, schema, execute):
+    """Tcommenter of the "sales" table with the preservation of comments installed in its own shadow schema."""
+
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    shadow_schema = f'{schema}_shadow'
+
+    try:
+        commenter.install_comments_preservation(shadow_schema)
+    except RuntimeError as error:
+        pytest.skip(f'The event triggers cannot be installed: {error}')
+
+    yield commenter, shadow_schema
+
+    commenter.uninstall_comments_preservation(shadow_schema)
+    execute(f'DROP SCHEMA IF EXISTS "{shadow_schema}" CASCADE')
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_comments_reapplied_after_drop_create(preservation, schema, execute):
+    commenter, shadow_schema = preservation
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric, removed text)')
+    commenter.save_comments({
+        'table': "It's 100% sales",
+        'columns': {'id': 'Key', 'amount': 'Amount', 'removed': 'Removed'}
+    })
+
+    execute(
+        f'DROP TABLE "{schema}".sales',
+        f'CREATE TABLE "{schema}".sales (id int, amount numeric)'
+    )
+
+    assert commenter.get_all_comments() == {'table': "It's 100% sales", 'columns': {'id': 'Key', 'amount': 'Amount'}}
+
+    status = commenter.get_comments_preservation_status()
+    assert status['installed'] is True
+    assert status['schema'] == shadow_schema
+    assert status['dropped'] == 0
+    assert status['entity_comments'] == 3
+
+
+def test_renames_are_tracked(preservation, schema, execute):
+    commenter, _ = preservation
+    execute(f'CREATE TABLE "{schema}".sales_old (id int)')
+    Tcommenter(engine=commenter.engine, name_table='sales_old', schema=schema).save_comments(
+        {'table': 'Sales', 'columns': {'id': 'Key'}}
+    )
+
+    execute(
+        f'ALTER TABLE "{schema}".sales_old RENAME TO sales',
+        f'ALTER TABLE "{schema}".sales RENAME COLUMN id TO sale_id',
+        f'DROP TABLE "{schema}".sales',
+        f'CREATE TABLE "{schema}".sales (sale_id int)'
+    )
+
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'sale_id': 'Key'}}
+
+
+def test_prune_preserved_comments(preservation, schema, execute):
+    commenter, shadow_schema = preservation
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+    execute(f'DROP TABLE "{schema}".sales')
+
+    assert commenter.get_comments_preservation_status()['dropped'] == 1
+    assert commenter.prune_preserved_comments(older_than_days=1, shadow_schema=shadow_schema) == {
+        'relations': 0,
+        'comments': 0
+    }
+    assert commenter.prune_preserved_comments(shadow_schema=shadow_schema) == {'relations': 1, 'comments': 2}
+
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+
+    assert commenter.get_all_comments() == {'table': '', 'columns': {}}
+
+
+@pytest.mark.parametrize('older_than_days', [-1, True, 'week'])
+def test_prune_preserved_comments_invalid_age(offline_engine, older_than_days):
+    with pytest.raises((TypeError, ValueError)):
+        Tcommenter(engine=offline_engine, name_table='sales').prune_preserved_comments(older_than_days)
+
+
+def test_uninstall(preservation):
+    commenter, shadow_schema = preservation
+    commenter.uninstall_comments_preservation(shadow_schema)
+
+    assert commenter.get_comments_preservation_status() == {'installed': False, 'schema': None, 'triggers': {}}
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "SchemaCommenter": the snapshot of the comments of all entities of the schema and its server-side
+    restoration ("DO" block).
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import pytest
+
+from tcommenter import SchemaCommenter, Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def entities(schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}"."Sales-2024" ("Order-Id" int, amount numeric)',
+        f'CREATE VIEW "{schema}".sales_view AS SELECT 1 AS one',
+        f'CREATE MATERIALIZED VIEW "{schema}".sales_mview AS SELECT 1 AS one',
+        f'CREATE TABLE "{schema}".uncommented (id int)'
+    )
+
+    return {
+        'Sales-2024': {'table': "It's 100% sales", 'columns': {'Order-Id': 'The "key" %s', 'amount': "50% o'clock"}},
+        'sales_view': {'table': 'View', 'columns': {'one': 'One'}},
+        'sales_mview': {'table': 'Materialized view', 'columns': {}},
+    }
+
+
+def restore(engine, records: list[dict]) -> dict:
+    commenter = SchemaCommenter(engine=engine, schema='public')
+
+    return commenter._batch_recorder(commenter._prepare_restore_comments(records))
+
+
+def test_get_all_comments(engine, schema, entities):
+    for name_entity, comments in entities.items():
+        # "save_comments()" does not accept an empty dictionary of comments on columns:
+        Tcommenter(engine=engine, name_table=name_entity, schema=schema).save_comments(
+            {key: value for key, value in comments.items() if value}
+        )
+
+    # Only the commented entities:
+    assert SchemaCommenter(engine=engine, schema=schema).get_all_comments() == entities
+
+
+def test_save_all_comments_round_trip(engine, schema, entities):
+    schema_commenter = SchemaCommenter(engine=engine, schema=schema)
+
+    schema_commenter.save_all_comments(entities)
+
+    assert schema_commenter.get_all_comments() == entities
+
+    # One round trip (the payload and the "DO" block in one statement):
+    assert schema_commenter.save_all_comments(entities)['statements'] == 1
+
+
+def test_restore_skips_missing_entities_and_columns(engine, schema, entities):
+    restore(engine, [
+        {'schema': schema, 'table': 'Sales-2024', 'table_comment': 'Sales', 'columns': {'missing': 'Missing'}},
+        {'schema': schema, 'table': 'missing', 'table_comment': 'Missing'},
+    ])
+
+    assert Tcommenter(engine=engine, name_table='Sales-2024', schema=schema).get_all_comments() == {
+        'table': 'Sales',
+        'columns': {}
+    }
+
+
+def test_restore_keeps_and_deletes_table_comment(engine, schema, entities):
+    commenter = Tcommenter(engine=engine, name_table='Sales-2024', schema=schema)
+    commenter.set_table_comment('Sales')
+
+    # Without the "table_comment" key, the comment on the entity is not changed:
+    restore(engine, [{'schema': schema, 'table': 'Sales-2024', 'columns': {'amount': 'Amount'}}])
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'amount': 'Amount'}}
+
+    # None deletes it:
+    restore(engine, [{'schema': schema, 'table': 'Sales-2024', 'table_comment': None}])
+    assert commenter.get_table_comments() == ''
+
+
+def test_restore_rejects_unsafe_names(engine, schema):
+    with pytest.raises(ValueError):
+        restore(engine, [{'schema': schema, 'table': 'sales; DROP TABLE x', 'table_comment': 'Sales'}])
+
+
+@pytest.mark.parametrize('record, message', [
+    ({'table': 'missing', 'table_comment': 'Missing', 'strict': True}, 'does not exist'),
+    ({'table': 'Sales-2024', 'columns': {'missing': 'Missing'}, 'strict': True}, 'missing'),
+    ({'table': 'Sales-2024', 'table_comment': 'Sales', 'entity_type': 'SCHEMA'}, 'invalid entity type'),
+    ({'table': 'Sales-2024', 'entity_type': "TABLE x IS ''; DROP TABLE y; --"}, 'invalid entity type'),
+])
+def test_restore_errors_roll_back(engine, schema, entities, record, message):
+    commenter = Tcommenter(engine=engine, name_table='Sales-2024', schema=schema)
+
+    with pytest.raises(RuntimeError, match=message):
+        restore(engine, [
+            {'schema': schema, 'table': 'Sales-2024', 'table_comment': 'First'},
+            {'schema': schema} | record,
+        ])
+
+    assert commenter.get_table_comments() == ''
+
+
+def test_restore_explicit_entity_type(engine, schema, entities):
+    restore(engine, [
+        {'schema': schema, 'table': 'sales_mview', 'table_comment': 'Explicit', 'entity_type': 'MATERIALIZED VIEW'}
+    ])
+
+    assert Tcommenter(engine=engine, name_table='sales_mview', schema=schema).get_table_comments() == 'Explicit'
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,343 @@
+# Copyright (c) 2025 ArtemXYZ
+# This project is licensed under the MIT License - see the LICENSE file for details.
+
+"""
+    Tests of "Tcommenter": writing and reading comments of one entity and its columns.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+import contextvars
+from contextlib import ExitStack
+
+import pytest
+
+from tcommenter import Tcommenter
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+def test_save_comments_round_trip(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}"."Sales-2024" ("Order-Id" int, amount numeric)')
+    commenter = Tcommenter(engine=engine, name_table='Sales-2024', schema=schema)
+
+    report = commenter.save_comments({
+        'table': "It's 100% sales",
+        'columns': {'Order-Id': 'The "key" %s', 'amount': '50%'}
+    })
+
+    assert set(report) >= {'statements', 'elapsed'}
+    assert commenter.get_table_comments() == "It's 100% sales"
+    assert commenter.get_column_comments() == {'Order-Id': 'The "key" %s', 'amount': '50%'}
+
+
+def test_save_comments_is_atomic(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+    with pytest.raises(RuntimeError):
+        commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'missing': 'Missing'}})
+
+    with pytest.raises(RuntimeError):
+        commenter.set_column_comment(id='Key', missing='Missing')
+
+    # Nothing is written, the comments are saved in one transaction:
+    assert commenter.get_table_comments() == ''
+    assert commenter.get_column_comments() == {}
+
+
+def test_get_all_comments(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric, note text)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.set_column_comment(note='Note', id='Key')
+
+    assert commenter.get_all_comments() == {'table': '', 'columns': {'id': 'Key', 'note': 'Note'}}
+
+    commenter.set_table_comment('Sales')
+    comments = commenter.get_all_comments()
+
+    assert comments == {'table': 'Sales', 'columns': {'id': 'Key', 'note': 'Note'}}
+    # The columns are in the order of the entity:
+    assert list(comments['columns']) == ['id', 'note']
+
+
+def test_same_name_in_another_schema(engine, schema, execute):
+    other_schema = f'{schema}_other'
+    execute(
+        f'CREATE SCHEMA "{other_schema}"',
+        f'CREATE TABLE "{schema}".sales (id int)',
+        f'CREATE TABLE "{other_schema}".sales (id int)'
+    )
+
+    try:
+        Tcommenter(engine=engine, name_table='sales', schema=other_schema).save_comments(
+            {'table': 'Other', 'columns': {'id': 'Other key'}}
+        )
+        commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+        assert commenter.get_all_comments() == {'table': '', 'columns': {}}
+        assert commenter.get_table_comments() == ''
+        assert commenter.get_column_comments() == {}
+    finally:
+        execute(f'DROP SCHEMA "{other_schema}" CASCADE')
+
+
+def test_save_comments_only_changed(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    report = commenter.save_comments(
+        {'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Sum'}}, only_changed=True
+    )
+
+    assert report['statements'] == 1
+    assert report['written'] == {'columns': {'amount': 'Sum'}}
+    assert report['skipped'] == {'table': 'Sales', 'columns': {'id': 'Key'}}
+    assert commenter.get_column_comments() == {'id': 'Key', 'amount': 'Sum'}
+
+    report = commenter.save_comments({'table': 'Sales'}, only_changed=True)
+
+    assert report['statements'] == 0
+
+
+def test_diff_comments_dict(offline_engine):
+    commenter = Tcommenter(engine=offline_engine, name_table='sales', schema='audit')
+
+    changed_dict, summary = commenter._diff_comments_dict(
+        {'table': '', 'columns': {'id': 'Key', 'amount': 'Sum', 'note': None}},
+        {'table': None, 'columns': {'id': 'Key', 'amount': 'Amount', 'note': 'Note'}}
+    )
+
+    # None is written as an empty string, the summary keeps the passed value:
+    assert changed_dict == {'columns': {'amount': 'Sum', 'note': ''}}
+    assert summary == {
+        'written': {'columns': {'amount': 'Sum'}},
+        'skipped': {'table': '', 'columns': {'id': 'Key'}},
+        'cleared': {'columns': {'note': None}},
+    }
+
+
+@pytest.mark.parametrize('empty_comment', [None, ''])
+def test_save_comments_only_changed_clears(engine, schema, execute, empty_comment):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    report = commenter.save_comments(
+        {'table': empty_comment, 'columns': {'id': empty_comment, 'amount': 'Amount'}}, only_changed=True
+    )
+
+    assert report['cleared'] == {'table': empty_comment, 'columns': {'id': empty_comment}}
+    assert commenter.get_all_comments() == {'table': '', 'columns': {'amount': 'Amount'}}
+
+
+def test_session_rolls_back(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+    with pytest.raises(ZeroDivisionError):
+        with commenter.session():
+            commenter.set_table_comment('Sales')
+            1 / 0
+
+    assert commenter.get_table_comments() == ''
+
+
+def test_session_joins_the_transaction_of_the_caller(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+    with engine.connect() as conn:
+        transaction = conn.begin()
+
+        with commenter.session(conn):
+            commenter.set_table_comment('Sales')
+            assert commenter.get_table_comments() == 'Sales'
+
+        transaction.rollback()
+
+    assert commenter.get_table_comments() == ''
+
+
+def test_sessions_share_one_context_variable(offline_engine):
+    commenters = [
+        Tcommenter(engine=offline_engine, name_table=f'sales_{number}', schema='audit') for number in range(50)
+    ]
+    variables = len(contextvars.copy_context())
+
+    with offline_engine.connect() as conn, ExitStack() as stack:
+        for commenter in commenters:
+            stack.enter_context(commenter.session(conn))
+
+        assert all(commenter._connection is conn for commenter in commenters)
+        assert len(contextvars.copy_context()) <= variables + 1
+
+    assert all(commenter._connection is None for commenter in commenters)
+    assert len(contextvars.copy_context()) <= variables + 1
+
+
+def test_preserve_comments(engine, schema, execute):
+    execute(f'CREATE TABLE "{schema}".sales (id int, amount numeric)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    with commenter.preserve_comments() as snapshot:
+        execute(
+            f'DROP TABLE "{schema}".sales',
+            f'CREATE TABLE "{schema}".sales (id int, price numeric)'
+        )
+        snapshot['columns']['price'] = 'Price'
+
+    # The comment of the removed column is skipped:
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key', 'price': 'Price'}}
+
+
+def test_to_sql(engine, schema, execute):
+    pandas = pytest.importorskip('pandas')
+    execute(f'CREATE TABLE "{schema}".sales (id bigint, amount double precision)')
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    commenter.to_sql(pandas.DataFrame({'id': [1, 2], 'amount': [1.5, 2.5]}))
+
+    assert commenter.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}}
+    assert pandas.read_sql_table('sales', engine, schema=schema)['id'].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize('by_position, target_columns, expected', [
+    (False, '(amount numeric, id int, extra text)', {'id': 'Key', 'amount': 'Amount'}),
+    (True, '(order_id int, total numeric)', {'order_id': 'Key', 'total': 'Amount'}),
+])
+def test_copy_comments_to(engine, schema, execute, by_position, target_columns, expected):
+    execute(
+        f'CREATE TABLE "{schema}".sales (id int, amount numeric)',
+        f'CREATE TABLE "{schema}".sales_copy {target_columns}'
+    )
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    commenter.copy_comments_to(schema, 'sales_copy', by_position=by_position)
+
+    assert Tcommenter(engine=engine, name_table='sales_copy', schema=schema).get_all_comments() == {
+        'table': 'Sales',
+        'columns': expected
+    }
+
+
+def test_copy_comments_to_strict(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}".sales (id int, amount numeric)',
+        f'CREATE TABLE "{schema}".sales_copy (id int)'
+    )
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key', 'amount': 'Amount'}})
+
+    with pytest.raises(RuntimeError):
+        commenter.copy_comments_to(schema, 'sales_copy', strict=True)
+
+    # The whole statement is rolled back:
+    assert Tcommenter(engine=engine, name_table='sales_copy', schema=schema).get_all_comments() == {
+        'table': '',
+        'columns': {}
+    }
+
+
+def test_broadcast_comments_to(engine, schema, execute):
+    execute(*[f'CREATE TABLE "{schema}".sales_{number} (id int)' for number in range(4)])
+    commenter = Tcommenter(engine=engine, name_table='sales_0', schema=schema)
+    commenter.save_comments({'table': 'Sales', 'columns': {'id': 'Key'}})
+
+    commenter.broadcast_comments_to([(schema, f'sales_{number}') for number in range(1, 4)])
+
+    for number in range(1, 4):
+        target = Tcommenter(engine=engine, name_table=f'sales_{number}', schema=schema)
+        assert target.get_all_comments() == {'table': 'Sales', 'columns': {'id': 'Key'}}
+
+
+def test_types_entities(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}".sales (id int)',
+        f'CREATE VIEW "{schema}".sales_view AS SELECT 1 AS one',
+        f'CREATE MATERIALIZED VIEW "{schema}".sales_mview AS SELECT 1 AS one',
+        f'CREATE TABLE "{schema}".events (id int) PARTITION BY LIST (id)'
+    )
+    commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+
+    assert commenter.get_types_entities([
+        (schema, 'sales'), (schema, 'sales_view'), (schema, 'sales_mview'), (schema, 'events'), (schema, 'missing')
+    ]) == {
+        (schema, 'sales'): 'table',
+        (schema, 'sales_view'): 'view',
+        (schema, 'sales_mview'): 'mview',
+        (schema, 'events'): 'partitioned_table',
+        (schema, 'missing'): None,
+    }
+
+    for name_entity in ('sales_view', 'sales_mview', 'events'):
+        entity_commenter = Tcommenter(engine=engine, name_table=name_entity, schema=schema)
+        entity_commenter.save_comments({'table': name_entity.title()})
+
+        assert entity_commenter.get_type_entity() == commenter.get_types_entities([(schema, name_entity)])[
+            (schema, name_entity)
+        ]
+        assert entity_commenter.get_table_comments() == name_entity.title()
+
+
+def test_foreign_table(engine, schema, execute):
+    try:
+        execute(
+            f'CREATE FOREIGN DATA WRAPPER "{schema}_fdw"',
+            f'CREATE SERVER "{schema}_server" FOREIGN DATA WRAPPER "{schema}_fdw"',
+            f'CREATE FOREIGN TABLE "{schema}".sales (id int) SERVER "{schema}_server"'
+        )
+    except Exception as error:
+        pytest.skip(f'The foreign table cannot be created: {error}')
+
+    try:
+        commenter = Tcommenter(engine=engine, name_table='sales', schema=schema)
+        commenter.save_comments({'table': 'Foreign sales', 'columns': {'id': 'Key'}})
+
+        assert commenter.get_types_entities([(schema, 'sales')]) == {(schema, 'sales'): 'foreign_table'}
+        assert commenter.get_all_comments() == {'table': 'Foreign sales', 'columns': {'id': 'Key'}}
+    finally:
+        execute(f'DROP FOREIGN DATA WRAPPER "{schema}_fdw" CASCADE')
+
+
+def test_partitions(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}".events (id int, kind int) PARTITION BY LIST (kind)',
+        f'CREATE TABLE "{schema}".events_1 PARTITION OF "{schema}".events FOR VALUES IN (1) PARTITION BY LIST (id)',
+        f'CREATE TABLE "{schema}".events_1_1 PARTITION OF "{schema}".events_1 FOR VALUES IN (1)',
+        f'CREATE TABLE "{schema}".events_2 PARTITION OF "{schema}".events FOR VALUES IN (2)'
+    )
+    commenter = Tcommenter(engine=engine, name_table='events', schema=schema)
+
+    # All levels of partitions are found by the recursive query:
+    assert sorted(commenter.get_partitions()) == [
+        (schema, 'events_1'), (schema, 'events_1_1'), (schema, 'events_2')
+    ]
+
+    commenter.save_comments({'table': 'Events', 'columns': {'id': 'Key'}})
+    report = commenter.propagate_comments()
+
+    assert report['partitions'] == 3
+
+    for partition in ('events_1', 'events_1_1', 'events_2'):
+        target = Tcommenter(engine=engine, name_table=partition, schema=schema)
+        assert target.get_all_comments() == {'table': 'Events', 'columns': {'id': 'Key'}}
+
+
+def test_save_comments_propagate(engine, schema, execute):
+    execute(
+        f'CREATE TABLE "{schema}".events (id int, kind int) PARTITION BY LIST (kind)',
+        f'CREATE TABLE "{schema}".events_1 PARTITION OF "{schema}".events FOR VALUES IN (1)'
+    )
+    commenter = Tcommenter(engine=engine, name_table='events', schema=schema)
+
+    report = commenter.save_comments({'table': 'Events', 'columns': {'kind': 'Kind'}}, propagate=True)
+
+    assert report['partitions'] == 1
+    assert Tcommenter(engine=engine, name_table='events_1', schema=schema).get_all_comments() == {
+        'table': 'Events',
+        'columns': {'kind': 'Kind'}
+    }
+# ----------------------------------------------------------------------------------------------------------------------